@@ -0,0 +1,73 @@
+"""Benchmark per-blob fetch latency with fresh vs reused dulwich Repo handles.
+
+Usage: python benchmarks/blob_fetch.py [--workdir PATH] [--limit N]
+
+Run against an already fetched workdir (e.g. after `eips show 1`).
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from dulwich.objects import Commit, Tree
+from dulwich.repo import Repo
+
+from eips.const import DATA_PATH, EIPS_DIR, REPO_DIR
+
+
+def doc_blob_shas(repo: Repo, docs_dir: str, limit: int) -> list[bytes]:
+    """Return blob SHAs of the docs in the HEAD tree."""
+    commit = repo[repo.head()]
+    assert isinstance(commit, Commit)
+    tree = repo[commit.tree]
+    assert isinstance(tree, Tree)
+    _, docs_sha = tree.lookup_path(repo.object_store.__getitem__, docs_dir.encode())
+    docs_tree = repo[docs_sha]
+    assert isinstance(docs_tree, Tree)
+    return [entry.sha for entry in docs_tree.iteritems()][:limit]
+
+
+def timeit(label: str, shas: list[bytes], fetch: Callable[[bytes], object]) -> float:
+    """Time fetching every blob, printing and returning per-blob latency (µs)."""
+    start = time.perf_counter()
+    for sha in shas:
+        fetch(sha)
+    per_blob = (time.perf_counter() - start) / len(shas) * 1e6
+    print(f"{label:<16} {len(shas):>6} blobs  {per_blob:>10.1f} µs/blob")
+    return per_blob
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=Path(DATA_PATH).expanduser().resolve().joinpath("eips"),
+    )
+    parser.add_argument("--docs-dir", default=EIPS_DIR)
+    parser.add_argument("--limit", type=int, default=500)
+    args = parser.parse_args()
+
+    repo_path = str(args.workdir.joinpath(REPO_DIR))
+
+    with Repo(repo_path) as repo:
+        shas = doc_blob_shas(repo, args.docs_dir, args.limit)
+
+    def fresh(sha: bytes) -> object:
+        with Repo(repo_path) as r:
+            return r.get_object(sha)
+
+    shared = Repo(repo_path)
+    try:
+        before = timeit("fresh repo", shas, fresh)
+        after = timeit("shared repo", shas, shared.get_object)
+    finally:
+        shared.close()
+
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
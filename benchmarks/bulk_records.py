@@ -0,0 +1,87 @@
+"""Benchmark validated documents against compact records, memory and construction.
+
+Usage: python benchmarks/bulk_records.py [--corpus DIR] [--rounds N]
+
+Construction includes header parsing, which both share.  Memory is the traced
+allocation of holding every document of the corpus, with bodies stripped as they're the
+same for both.
+"""
+
+import argparse
+import logging
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from eips.const import DATA_PATH, EIPS_DIR, REPO_DIR
+from eips.object import EIP, CommitHash, EIPRecord
+
+COMMIT = CommitHash("0" * 40)
+
+
+def build_all(corpus: list[str], parse: Callable[..., Any]) -> list[Any]:
+    """Parse every document of the corpus."""
+    return [
+        parse(doc_id, COMMIT, datetime.min, text)
+        for doc_id, text in enumerate(corpus, start=1)
+    ]
+
+
+def measure(label: str, corpus: list[str], rounds: int, parse: Callable[..., Any]):
+    """Print per document construction time and memory."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        build_all(corpus, parse)
+    per_doc = (time.perf_counter() - start) / (rounds * len(corpus)) * 1e6
+
+    tracemalloc.start()
+    docs = build_all(corpus, parse)
+    mem, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del docs
+
+    print(
+        f"{label:<9} {per_doc:>8.1f} µs/doc  {mem / len(corpus):>8.0f} bytes/doc"
+        f"  ({mem / 1024 / 1024:.1f} MiB total)"
+    )
+    return per_doc, mem
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--corpus",
+        type=Path,
+        default=Path(DATA_PATH)
+        .expanduser()
+        .resolve()
+        .joinpath("eips", REPO_DIR, EIPS_DIR),
+    )
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    # Header warnings would drown out the results
+    logging.disable(logging.WARNING)
+
+    # Headers only, so both hold the same (empty) body
+    corpus = []
+    for fpath in sorted(args.corpus.glob("*.md")):
+        text = fpath.read_text()
+        end = text.find("\n---", 3)
+        corpus.append(text[: end + 4] if end >= 0 else text)
+    print(f"corpus: {len(corpus)} files from {args.corpus}")
+
+    model_time, model_mem = measure("EIP", corpus, args.rounds, EIP.parse)
+    record_time, record_mem = measure("EIPRecord", corpus, args.rounds, EIPRecord.parse)
+    print(
+        f"records: {model_time / record_time:.1f}x faster,"
+        f" {model_mem / record_mem:.1f}x less memory"
+    )
+
+
+if __name__ == "__main__":
+    main()
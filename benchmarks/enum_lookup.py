@@ -0,0 +1,107 @@
+"""Benchmark enum value lookups during a full history walk, before and after.
+
+Usage: python benchmarks/enum_lookup.py [--workdir PATH]
+
+Walks the full history of an already fetched workdir (with the document cache off),
+recording every status/type/category value looked up.  Those lookups are then replayed
+against the original member-scanning lookup and the current lookup tables.
+"""
+
+import argparse
+import logging
+import time
+from collections.abc import Callable
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from eips.const import DATA_PATH
+from eips.eips import EIPs
+from eips.enum import EIP1Category, EIP1Status, EIP1Type
+
+
+def legacy_get_by_val(cls: type[Enum], v: str) -> Any:
+    """Get an enum member by value, as originally implemented."""
+    if not v:
+        return None
+    for attr in list(cls):
+        str_attr = str(attr).split(".")[1]
+        attr_v = getattr(cls, str_attr).value
+        if attr_v == v or v in attr_v:
+            return cls[str_attr]
+    return None
+
+
+def record_lookups(workdir: Path) -> list[tuple[type[Enum], str]]:
+    """Walk the full history, recording the enum lookups made while parsing."""
+    lookups: list[tuple[type[Enum], str]] = []
+
+    for cls in (EIP1Category, EIP1Status, EIP1Type):
+        lookup = cls.get_by_val
+
+        def recorder(v: str, cls: Any = cls, lookup: Any = lookup) -> Any:
+            lookups.append((cls, v))
+            return lookup(v)
+
+        setattr(cls, "get_by_val", recorder)
+
+    eips = EIPs(freshness=None, workdir=workdir, cache=False)
+    start = time.perf_counter()
+    versions = sum(1 for _ in eips.all())
+    elapsed = time.perf_counter() - start
+    print(f"walked {versions} document versions in {elapsed:.1f}s")
+
+    return lookups
+
+
+def run(
+    label: str,
+    lookups: list[tuple[type[Enum], str]],
+    get_by_val: Callable[[type[Enum], str], Any],
+) -> float:
+    """Replay the lookups, printing and returning the total time spent."""
+    start = time.perf_counter()
+    for cls, v in lookups:
+        get_by_val(cls, v)
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<8} {len(lookups):>9} lookups  {elapsed * 1e3:>9.1f} ms"
+        f"  {elapsed / len(lookups) * 1e9:>7.0f} ns/lookup"
+    )
+    return elapsed
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=Path(DATA_PATH).expanduser().resolve().joinpath("eips"),
+    )
+    args = parser.parse_args()
+
+    # Header warnings would drown out the results
+    logging.disable(logging.WARNING)
+
+    lookups = record_lookups(args.workdir)
+    for cls in (EIP1Category, EIP1Status, EIP1Type):
+        # Restore the real lookups
+        delattr(cls, "get_by_val")
+
+    def get_by_val(cls: type[Enum], v: str) -> Any:
+        return getattr(cls, "get_by_val")(v)
+
+    # Anything the original found must still be found.  Case and whitespace
+    # insensitive matching may find more.
+    for cls, v in lookups:
+        expected = legacy_get_by_val(cls, v)
+        assert expected is None or get_by_val(cls, v) == expected
+
+    before = run("before", lookups, legacy_get_by_val)
+    after = run("after", lookups, get_by_val)
+    print(f"speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
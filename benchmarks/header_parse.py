@@ -0,0 +1,142 @@
+"""Benchmark header parsing over a corpus of EIP files, before and after.
+
+Usage: python benchmarks/header_parse.py [--corpus DIR] [--rounds N]
+
+"Before" is the original line splitting parser, kept here for comparison.  The
+parsers' output is compared for every file before timing.
+"""
+
+import argparse
+import logging
+import re
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from dateutil.parser import parse as dateutil_parse
+
+from eips.const import DATA_PATH, EIPS_DIR, REPO_DIR
+from eips.parsing import (
+    HEADER_MAPPING,
+    RFC_822_HEADER,
+    HeaderParseError,
+    ParseError,
+    header_translators,
+    normalize_header,
+    pluck_headers,
+)
+
+legacy_header_translators = {
+    **header_translators,
+    "created": dateutil_parse,
+    "updated": lambda v: dateutil_parse(sorted([d.strip() for d in v.split(",")])[-1]),
+}
+
+
+def legacy_normalize_header_line(name: str) -> str:
+    """Replace known weird characters, as originally implemented."""
+    return name.replace("“", '"').replace("”", '"').replace("\u200c", " ").strip()
+
+
+def legacy_pluck_headers(eip_text: str) -> tuple[dict[str, Any], str, list[str]]:
+    """Remove and return the RFC 822 headers, as originally implemented."""
+    lines = eip_text.split("\n")
+    line_count = 0
+    headers: dict[str, Any] = {}
+    found_end = False
+    errors: list[str] = []
+
+    if lines[0] != "---":
+        raise HeaderParseError("Header RFC-822 delimiter (---) not found")
+
+    for ln in lines[1:]:
+        line_count += 1
+        if ln.startswith("---"):
+            found_end = True
+            break
+        matches = re.fullmatch(RFC_822_HEADER, legacy_normalize_header_line(ln))
+        if not matches or len(matches.groups()) != 2:
+            errors.append(f"EIP header line parse failed: {ln}")
+        else:
+            normal_header = normalize_header(matches.group(1))
+            hkey = HEADER_MAPPING.get(normal_header, normal_header)
+            hval = None
+            if hkey in legacy_header_translators:
+                try:
+                    hval = legacy_header_translators[hkey](matches.group(2))
+                except Exception as err:
+                    errors.append(f"Failed to parse header date: {err}")
+            else:
+                hval = matches.group(2)
+            headers[hkey] = hval
+
+    if not found_end:
+        raise ParseError("EIP Appears to be malformed.  Did not find end of headers")
+
+    return (headers, "\n".join(lines[line_count + 1 :]), errors)
+
+
+def run(
+    label: str,
+    corpus: list[str],
+    rounds: int,
+    parse: Callable[[str], tuple[dict[str, Any], str, list[str]]],
+) -> float:
+    """Parse the corpus `rounds` times, printing and returning headers per second."""
+    header_count = 0
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in corpus:
+            try:
+                header_count += len(parse(text)[0])
+            except ParseError:
+                pass
+    rate = header_count / (time.perf_counter() - start)
+    print(f"{label:<8} {header_count:>9} headers  {rate:>12,.0f} headers/s")
+    return rate
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--corpus",
+        type=Path,
+        default=Path(DATA_PATH)
+        .expanduser()
+        .resolve()
+        .joinpath("eips", REPO_DIR, EIPS_DIR),
+    )
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    # Header warnings would drown out the results
+    logging.disable(logging.WARNING)
+
+    corpus = [f.read_text() for f in sorted(args.corpus.glob("*.md"))]
+    print(f"corpus: {len(corpus)} files from {args.corpus}")
+
+    for text in corpus:
+        try:
+            expected = legacy_pluck_headers(text)
+        except ParseError as err:
+            expected = err
+        try:
+            result = pluck_headers(text)
+        except ParseError as err:
+            result = err
+        if isinstance(expected, Exception) or isinstance(result, Exception):
+            assert type(expected).__name__ == type(result).__name__
+        else:
+            # Error messages differ slightly, as the benchmark doesn't log
+            assert expected[:2] == result[:2]
+            assert len(expected[2]) == len(result[2])
+
+    before = run("before", corpus, args.rounds, legacy_pluck_headers)
+    after = run("after", corpus, args.rounds, pluck_headers)
+    print(f"speedup: {after / before:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark peak memory of a full header scan, with and without lazy bodies.
+
+Usage: python benchmarks/header_scan.py [--workdir PATH]
+
+Reads every document at HEAD of an already fetched workdir (with the document cache off)
+and keeps them all, as listing or aggregating headers would.
+"""
+
+import argparse
+import logging
+import time
+import tracemalloc
+from pathlib import Path
+
+from eips.const import DATA_PATH
+from eips.eips import EIPs, Snapshot
+from eips.git import git_rev
+
+
+def scan(label: str, workdir: Path, headers_only: bool) -> int:
+    """Read all documents at HEAD, printing and returning the peak traced memory."""
+    eips = EIPs(freshness=None, workdir=workdir, cache=False)
+    # Use whatever is checked out, without fetching
+    commit = git_rev(eips.git_repo)
+    eips._snapshot = Snapshot(commit, eips._commit_time(commit))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    docs = list(eips.get(headers_only=headers_only))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"{label:<13} {len(docs):>6} docs  {elapsed:>6.2f}s"
+        f"  peak {peak / 1024 / 1024:>7.1f} MiB"
+    )
+    eips.close()
+    return peak
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=Path(DATA_PATH).expanduser().resolve().joinpath("eips"),
+    )
+    args = parser.parse_args()
+
+    # Header warnings would drown out the results
+    logging.disable(logging.WARNING)
+
+    full = scan("full", args.workdir, headers_only=False)
+    headers = scan("headers only", args.workdir, headers_only=True)
+    print(f"peak memory: {full / headers:.1f}x lower")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Load test a running `eips serve`, reporting requests/second and latency percentiles.
+
+Usage: python benchmarks/serve_load.py [--url URL] [--connections N] [--duration S]
+    [--path PATH ...] [--revalidate]
+
+Each connection sends requests back to back over keep-alive, cycling through the paths.
+With `--revalidate`, requests send the last ETag seen, as a caching client would.
+"""
+
+import argparse
+import asyncio
+import time
+from itertools import cycle
+from urllib.parse import urlsplit
+
+DEFAULT_PATHS = [
+    "/eips/1559",
+    "/eips/20?headers=1",
+    "/eips?status=Final&limit=50",
+    "/eips/stats",
+    "/ercs/20",
+    "/ercs?category=ERC",
+]
+
+
+async def _request(
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+    host: str,
+    path: str,
+    etag: str | None,
+) -> tuple[int, str | None]:
+    """Send a request and read its response, returning the status and ETag."""
+    lines = [f"GET {path} HTTP/1.1", f"Host: {host}"]
+    if etag is not None:
+        lines.append(f"If-None-Match: {etag}")
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+        elif name.lower() == "etag":
+            etag = value.strip()
+    await reader.readexactly(length)
+    return status, etag
+
+
+async def worker(
+    host: str,
+    port: int,
+    paths: list[str],
+    deadline: float,
+    revalidate: bool,
+    latencies: list[float],
+    statuses: dict[int, int],
+) -> None:
+    """Send requests over one connection until the deadline."""
+    reader, writer = await asyncio.open_connection(host, port)
+    etags: dict[str, str | None] = {}
+    for path in cycle(paths):
+        start = time.perf_counter()
+        if start >= deadline:
+            break
+        status, etag = await _request(
+            reader, writer, host, path, etags.get(path) if revalidate else None
+        )
+        latencies.append(time.perf_counter() - start)
+        statuses[status] = statuses.get(status, 0) + 1
+        etags[path] = etag
+    writer.close()
+
+
+async def run(
+    url: str, connections: int, duration: float, paths: list[str], revalidate: bool
+) -> None:
+    """Run the load test and print the results."""
+    parts = urlsplit(url)
+    host, port = parts.hostname or "127.0.0.1", parts.port or 80
+    latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            worker(
+                host,
+                port,
+                paths,
+                start + duration,
+                revalidate,
+                latencies,
+                statuses,
+            )
+            for _ in range(connections)
+        )
+    )
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def pct(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    print(f"{len(latencies)} requests in {elapsed:.1f}s over {connections} connections")
+    print(f"requests/second: {len(latencies) / elapsed:,.0f}")
+    print(f"latency p50 {pct(0.5):.2f}ms  p99 {pct(0.99):.2f}ms  max {pct(1):.2f}ms")
+    print("statuses: " + ", ".join(f"{s}: {n}" for s, n in sorted(statuses.items())))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--path", action="append", dest="paths")
+    parser.add_argument("--revalidate", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(
+        run(
+            args.url,
+            args.connections,
+            args.duration,
+            args.paths or DEFAULT_PATHS,
+            args.revalidate,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
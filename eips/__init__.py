@@ -6,11 +6,14 @@ Ethereum Requests for Comment (ERC) data.
 
 from importlib.metadata import metadata
 
+from eips.aio import AsyncEIPs, AsyncERCs
 from eips.eips import EIPs, ERCs
 
 meta = metadata("eips")
 
 __all__ = [
+    "AsyncEIPs",
+    "AsyncERCs",
     "EIPs",
     "ERCs",
 ]
@@ -0,0 +1,170 @@
+"""Asyncio interface to EIPs and ERCs.
+
+Reads run in a worker thread, one at a time, so the event loop never blocks on git or
+parsing.  Fetches run in the background while reads keep using the last fetched commit,
+and the fetched commit is swapped in once the fetch is done.
+"""
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from types import TracebackType
+from typing import Generic, TypeVar, cast
+
+from typing_extensions import Self, Unpack
+
+from eips.eips import EIPs, ERCs, EthereumDocs, SearchResult
+from eips.graph import DocumentGraph
+from eips.object import (
+    EIP,
+    ERC,
+    CommitHash,
+    CommitRef,
+    DocumentRecord,
+    EIP1Document,
+    EIPRecord,
+    EIPsStats,
+    ERCRecord,
+    FlexId,
+)
+from eips.store import QueryFilters
+
+DocT = TypeVar("DocT", bound=EIP1Document)
+RecordT = TypeVar("RecordT", bound=DocumentRecord)
+T = TypeVar("T")
+
+
+class AsyncEthereumDocs(Generic[DocT, RecordT]):
+    """Asyncio wrapper of an EthereumDocs.
+
+    The wrapped docs should have `background_refresh`, or due fetches will still run
+    inline (in the worker thread, holding up the reads queued behind them).
+    """
+
+    def __init__(self, docs: EthereumDocs):
+        """Wrap an EthereumDocs."""
+        self.docs = docs
+        self._reader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="eips-read")
+
+    async def __aenter__(self) -> Self:
+        """Enter a context that closes the docs on exit."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the docs."""
+        await self.close()
+
+    async def _run(self, func: Callable[[], T]) -> T:
+        """Run a blocking call in the reader thread."""
+        return await asyncio.get_running_loop().run_in_executor(self._reader, func)
+
+    async def close(self) -> None:
+        """Close the docs, and the reader thread."""
+        await self._run(self.docs.close)
+        self._reader.shutdown()
+
+    @property
+    def current_commit(self) -> CommitHash | None:
+        """Return the commit documents are currently read from."""
+        return self.docs.current_commit
+
+    async def resolve_commit(self, commit: CommitRef | None = None) -> CommitHash:
+        """Resolve a commit ref.  See `EthereumDocs.resolve_commit()`."""
+        return await self._run(partial(self.docs.resolve_commit, commit))
+
+    async def repo_fetch(self) -> CommitHash:
+        """Fetch (or clone) the repo, without holding up reads meanwhile."""
+        return await asyncio.wrap_future(self.docs.refresh())
+
+    async def get(
+        self,
+        doc_id: FlexId | None = None,
+        *,
+        commit: CommitRef | None = None,
+        headers_only: bool = False,
+    ) -> list[DocT]:
+        """Return document(s) by ID(s).  See `EthereumDocs.get()`."""
+        return await self._run(
+            lambda: cast(
+                list[DocT],
+                list(self.docs.get(doc_id, commit=commit, headers_only=headers_only)),
+            )
+        )
+
+    async def records(
+        self,
+        doc_id: FlexId | None = None,
+        *,
+        commit: CommitRef | None = None,
+        headers_only: bool = False,
+    ) -> list[RecordT]:
+        """Return compact document(s) by ID(s).  See `EthereumDocs.records()`."""
+        return await self._run(
+            lambda: cast(
+                list[RecordT],
+                list(
+                    self.docs.records(doc_id, commit=commit, headers_only=headers_only)
+                ),
+            )
+        )
+
+    async def query(
+        self,
+        commit: CommitRef | None = None,
+        **filters: Unpack[QueryFilters],
+    ) -> list[RecordT]:
+        """Return documents matching filters.  See `EthereumDocs.query()`."""
+        return await self._run(
+            lambda: cast(list[RecordT], list(self.docs.query(commit, **filters)))
+        )
+
+    async def search(
+        self,
+        terms: str,
+        *,
+        commit: CommitRef | None = None,
+        limit: int | None = 20,
+    ) -> list[SearchResult]:
+        """Full-text search documents.  See `EthereumDocs.search()`."""
+        return await self._run(
+            lambda: list(self.docs.search(terms, commit=commit, limit=limit))
+        )
+
+    async def check(
+        self,
+        doc_id: FlexId | None = None,
+        *,
+        commit: CommitRef | None = None,
+    ) -> bool:
+        """Check if all documents are valid."""
+        return await self._run(partial(self.docs.check, doc_id, commit=commit))
+
+    async def stats(self, commit: CommitRef | None = None) -> EIPsStats:
+        """Return aggregate stats.  See `EthereumDocs.stats()`."""
+        return await self._run(partial(self.docs.stats, commit))
+
+    async def graph(self, commit: CommitRef | None = None) -> DocumentGraph:
+        """Return the dependency graph.  See `EthereumDocs.graph()`."""
+        return await self._run(partial(self.docs.graph, commit))
+
+
+class AsyncEIPs(AsyncEthereumDocs[EIP, EIPRecord]):
+    """Asyncio EIPs ETL machinery"""
+
+    def __init__(self, docs: EIPs | None = None):
+        """Wrap EIPs, by default ones that refresh in the background."""
+        super().__init__(docs if docs is not None else EIPs(background_refresh=True))
+
+
+class AsyncERCs(AsyncEthereumDocs[ERC, ERCRecord]):
+    """Asyncio ERCs ETL machinery"""
+
+    def __init__(self, docs: ERCs | None = None):
+        """Wrap ERCs, by default ones that refresh in the background."""
+        super().__init__(docs if docs is not None else ERCs(background_refresh=True))
@@ -0,0 +1,274 @@
+"""Prebuilt bundles of the parsed documents at a commit.
+
+A bundle is a single binary file, memory mapped to read, so documents can be served
+without a git repo or parsing:
+
+- a fixed size header (see `HEADER`)
+- per document: its file name, its parsed headers as JSON and its raw text
+- an index of fixed size entries (see `ENTRY`), sorted by document ID
+
+Only the header and index are read on open.  Documents are decoded on access, and with
+`headers_only`, bodies are only decoded when accessed.
+"""
+
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from pathlib import Path
+from typing import BinaryIO, NamedTuple
+
+from eips.cache import VOLATILE_FIELDS
+from eips.const import BUNDLE_VERSION, CACHE_VERSION, ENCODING
+from eips.enum import DocumentType
+from eips.object import AnyDocument, CommitHash, LazyBody
+
+BUNDLE_MAGIC = b"EIPSBNDL"
+# Magic, bundle version, parser (cache) version, document type, commit, commit time,
+# commit timezone offset, creation time, document count, index offset
+HEADER = struct.Struct("<8sHH8s40sqiqIQ")
+# Document (file) ID, blob SHA, data offset, file name length, headers length, raw text
+# length and body offset (in characters of the raw text)
+ENTRY = struct.Struct("<I20sQHIII")
+# Body offset of documents without a body
+NO_BODY = 0xFFFFFFFF
+
+
+class BundleDocument(NamedTuple):
+    """A parsed document to bundle, with the file and raw text it was parsed from."""
+
+    doc_id: int
+    fname: str
+    blob_sha: bytes
+    raw_text: str
+    document: AnyDocument
+
+
+class BundleEntry(NamedTuple):
+    """A document in a bundle's index."""
+
+    doc_id: int
+    blob_sha: bytes
+    offset: int
+    fname_len: int
+    meta_len: int
+    text_len: int
+    body_offset: int
+
+
+@contextmanager
+def _bundle_writer(path: Path) -> Iterator[BinaryIO]:
+    """Write a bundle file through a temporary file of its own, moved into place.
+
+    Readers never see a partial bundle, and concurrent writers don't mix their writes.
+    """
+    path.parent.mkdir(mode=0o750, parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as bundle_file:
+            yield bundle_file
+            bundle_file.flush()
+            os.fsync(bundle_file.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def copy_bundle(source: Path, path: Path) -> None:
+    """Copy a bundle file, moving it into place once it's complete."""
+    with _bundle_writer(path) as bundle_file, source.open("rb") as source_file:
+        shutil.copyfileobj(source_file, bundle_file)
+
+
+def write_bundle(
+    path: Path,
+    document_type: DocumentType,
+    commit: CommitHash,
+    commit_time: datetime,
+    docs: Iterable[BundleDocument],
+) -> int:
+    """Write documents to a bundle file, returning the number written.
+
+    The bundle is written to a temporary file and moved into place, so readers never
+    see a partial bundle.
+    """
+    entries: list[BundleEntry] = []
+    offset_td = commit_time.utcoffset() or timedelta()
+
+    with _bundle_writer(path) as bundle_file:
+        # Written again with the count and index offset once the data is in
+        bundle_file.write(bytes(HEADER.size))
+        offset = HEADER.size
+
+        for doc_id, fname, blob_sha, raw_text, doc in docs:
+            fname_data = fname.encode(ENCODING)
+            meta = (
+                doc.model_copy(update={"body": ""})
+                .model_dump_json(exclude=VOLATILE_FIELDS)
+                .encode(ENCODING)
+            )
+            text = raw_text.encode(ENCODING)
+            body_len = len(doc.body)
+            entries.append(
+                BundleEntry(
+                    doc_id,
+                    blob_sha,
+                    offset,
+                    len(fname_data),
+                    len(meta),
+                    len(text),
+                    # The body is always a suffix of the raw text
+                    len(raw_text) - body_len if body_len else NO_BODY,
+                )
+            )
+            bundle_file.write(fname_data + meta + text)
+            offset += len(fname_data) + len(meta) + len(text)
+
+        entries.sort(key=lambda entry: entry.doc_id)
+        for entry in entries:
+            bundle_file.write(ENTRY.pack(*entry))
+
+        bundle_file.seek(0)
+        bundle_file.write(
+            HEADER.pack(
+                BUNDLE_MAGIC,
+                BUNDLE_VERSION,
+                CACHE_VERSION,
+                document_type.value.encode(ENCODING),
+                commit.encode(ENCODING),
+                int(commit_time.timestamp()),
+                int(offset_td.total_seconds()),
+                int(datetime.now(tz=timezone.utc).timestamp()),
+                len(entries),
+                offset,
+            )
+        )
+
+    return len(entries)
+
+
+class DocumentBundle:
+    """A bundle file of the parsed documents at a commit, memory mapped.
+
+    Raises ValueError on open if the file isn't a bundle of the current version.
+    """
+
+    def __init__(self, path: Path):
+        """Open a bundle file."""
+        self.path = path
+        with path.open("rb") as bundle_file:
+            self._mmap = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            (
+                magic,
+                version,
+                parser_version,
+                document_type,
+                commit,
+                commit_time,
+                tz_offset,
+                created,
+                count,
+                index_offset,
+            ) = HEADER.unpack_from(self._mmap)
+        except struct.error as err:
+            self.close()
+            raise ValueError(f"{path} is not a document bundle") from err
+
+        if magic != BUNDLE_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a document bundle")
+        if version != BUNDLE_VERSION or parser_version != CACHE_VERSION:
+            self.close()
+            raise ValueError(f"{path} was bundled by another version")
+
+        self.document_type = DocumentType(document_type.rstrip(b"\0").decode(ENCODING))
+        self.commit = CommitHash(commit.decode(ENCODING))
+        self.commit_time = datetime.fromtimestamp(
+            commit_time, tz=timezone(timedelta(seconds=tz_offset))
+        )
+        self.created = datetime.fromtimestamp(created, tz=timezone.utc)
+        self._entries = [
+            BundleEntry(*fields)
+            for fields in ENTRY.iter_unpack(
+                self._mmap[index_offset : index_offset + count * ENTRY.size]
+            )
+        ]
+        self._ids = {entry.doc_id: i for i, entry in enumerate(self._entries)}
+        self._blobs = {entry.blob_sha: i for i, entry in enumerate(self._entries)}
+
+    def close(self) -> None:
+        """Unmap the bundle file."""
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        """Return the number of documents."""
+        return len(self._entries)
+
+    def __contains__(self, doc_id: object) -> bool:
+        """Is there a document with the given ID?"""
+        return doc_id in self._ids
+
+    def files(self) -> list[tuple[int, str, bytes]]:
+        """Return the (document ID, file name, blob SHA) of every document."""
+        return [
+            (
+                entry.doc_id,
+                self._mmap[entry.offset : entry.offset + entry.fname_len].decode(
+                    ENCODING
+                ),
+                entry.blob_sha,
+            )
+            for entry in self._entries
+        ]
+
+    def _text(self, i: int) -> str:
+        entry = self._entries[i]
+        start = entry.offset + entry.fname_len + entry.meta_len
+        return self._mmap[start : start + entry.text_len].decode(ENCODING)
+
+    def blob_text(self, blob_sha: bytes) -> str | None:
+        """Return the raw text of a bundled blob, if it's in the bundle."""
+        i = self._blobs.get(blob_sha)
+        return None if i is None else self._text(i)
+
+    def document(
+        self,
+        doc_class: type[AnyDocument],
+        doc_id: int,
+        headers_only: bool = False,
+    ) -> AnyDocument | None:
+        """Load a document by ID, if bundled.
+
+        With `headers_only`, the body is a LazyBody decoded on access.
+        """
+        i = self._ids.get(doc_id)
+        if i is None:
+            return None
+
+        entry = self._entries[i]
+        start = entry.offset + entry.fname_len
+        meta = self._mmap[start : start + entry.meta_len].decode(ENCODING)
+
+        body: str | LazyBody
+        if entry.body_offset == NO_BODY:
+            body = ""
+        elif headers_only:
+            body = LazyBody(partial(self._text, i), entry.body_offset)
+        else:
+            body = self._text(i)[entry.body_offset :]
+
+        return doc_class.model_validate_json(meta).model_copy(
+            update={
+                "body": body,
+                "commit": self.commit,
+                "commit_time": self.commit_time,
+            }
+        )
@@ -0,0 +1,155 @@
+"""Persistent cache of parsed documents keyed by git blob SHA."""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from threading import Lock
+
+from eips.const import CACHE_VERSION
+from eips.logging import get_logger
+from eips.object import AnyDocument, CommitHash, DocumentRecord
+
+log = get_logger(__name__)
+
+# Fields that vary by where the blob was found, not by its content
+VOLATILE_FIELDS = {"commit", "commit_time"}
+
+
+def _document_type(doc_class: type[AnyDocument]) -> str:
+    """Return the document type value of a document class."""
+    if issubclass(doc_class, DocumentRecord):
+        return doc_class.document_type.value
+    return doc_class.model_fields["document_type"].default.value
+
+
+class DocumentCache:
+    """SQLite cache mapping a blob SHA to its parsed document.
+
+    A blob SHA always parses to the same document, so only the commit and body (a
+    slice of the raw text) have to be filled in on a hit.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize a cache stored at the given path."""
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._conn: sqlite3.Connection | None = None
+        self._lock = Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The SQLite connection, opened (and migrated) on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(mode=0o750, parents=True, exist_ok=True)
+            # Worker processes may share the file, so wait out their writes
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)"
+            )
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'version'"
+            ).fetchone()
+            if row is None or row[0] != CACHE_VERSION:
+                log.debug(f"Resetting document cache at {self.path}")
+                conn.execute("DROP TABLE IF EXISTS documents")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                    (CACHE_VERSION,),
+                )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                " blob_sha BLOB NOT NULL,"
+                " document_type TEXT NOT NULL,"
+                " doc_id INTEGER NOT NULL,"
+                " body_offset INTEGER NOT NULL,"
+                " data TEXT NOT NULL,"
+                " PRIMARY KEY (blob_sha, document_type, doc_id)"
+                ")"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def load(
+        self,
+        doc_class: type[AnyDocument],
+        doc_id: int,
+        blob_sha: bytes,
+        commit: CommitHash,
+        commit_time: datetime,
+        raw_text: str,
+    ) -> AnyDocument | None:
+        """Load a previously parsed document for the blob, if cached."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT body_offset, data FROM documents"
+                " WHERE blob_sha = ? AND document_type = ? AND doc_id = ?",
+                (blob_sha, _document_type(doc_class), doc_id),
+            ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        body_offset, data = row
+        return doc_class.model_validate_json(data).model_copy(
+            update={
+                "body": raw_text[body_offset:],
+                "commit": commit,
+                "commit_time": commit_time,
+            }
+        )
+
+    def store(
+        self,
+        doc: AnyDocument,
+        doc_id: int,
+        blob_sha: bytes,
+        raw_text: str,
+    ) -> None:
+        """Store a document parsed from the given blob."""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO documents"
+                " (blob_sha, document_type, doc_id, body_offset, data)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    blob_sha,
+                    _document_type(type(doc)),
+                    doc_id,
+                    # The body is always a suffix of the raw text
+                    len(raw_text) - len(doc.body),
+                    # The body is sliced back out of the raw text on a hit
+                    doc.model_copy(update={"body": ""}).model_dump_json(
+                        exclude=VOLATILE_FIELDS
+                    ),
+                ),
+            )
+            self.conn.commit()
+
+    def parse(
+        self,
+        doc_class: type[AnyDocument],
+        doc_id: int,
+        blob_sha: bytes,
+        commit: CommitHash,
+        commit_time: datetime,
+        raw_text: str,
+    ) -> AnyDocument:
+        """Parse a document, or load it from the cache if the blob was seen before."""
+        doc = self.load(doc_class, doc_id, blob_sha, commit, commit_time, raw_text)
+        if doc is None:
+            doc = doc_class.parse(doc_id, commit, commit_time, raw_text)
+            self.store(doc, doc_id, blob_sha, raw_text)
+        return doc
@@ -1,66 +1,263 @@
 """CLI defining `eips` and `ercs` commands."""
 
+import asyncio
+import json
 import sys
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, TypeVar
 
 import click
 
-from eips.eips import EIPs, ERCs
+from eips.eips import EIPs, ERCs, EthereumDocs
+from eips.export import DEFAULT_BATCH_SIZE, EXPORT_FORMATS
+from eips.graph import RELATIONS, CycleError
 from eips.logging import set_debug_logging
+from eips.object import AnyDocument
+from eips.store import QueryFilters, parse_filters
 
 
-@click.group()
+class DocsGroup(click.Group):
+    """Command group that reports a missing local clone without a traceback."""
+
+    def invoke(self, ctx: click.Context) -> Any:
+        """Invoke the command."""
+        try:
+            return super().invoke(ctx)
+        except FileNotFoundError as err:
+            raise click.ClickException(str(err)) from err
+
+
+def _fetch_options() -> dict[str, Any]:
+    """Return the EIPs/ERCs options for fetching given to the command group."""
+    return click.get_current_context().obj or {}
+
+
+# IDs are read in batches of this many, so output starts before all input is read
+ID_BATCH_SIZE = 100
+
+DocT = TypeVar("DocT", bound=AnyDocument)
+
+
+def _parse_ids(specs: Iterable[str]) -> Iterator[tuple[range, bool]]:
+    """Parse IDs and ID ranges (`-` reads them from stdin).
+
+    Yields each as a range, with whether it was an ID by itself rather than a range.
+    """
+    for spec in specs:
+        if spec == "-":
+            for line in sys.stdin:
+                yield from _parse_ids(part for part in line.split() if part != "-")
+            continue
+
+        for part in spec.split(","):
+            if not part:
+                continue
+            start, sep, end = part.partition("-")
+            try:
+                first, last = (int(start), int(end)) if sep else (int(part), int(part))
+            except ValueError as err:
+                raise click.BadParameter(
+                    f"{part} is not an ID or a range of IDs", param_hint="IDS"
+                ) from err
+            yield range(first, last + 1), not sep
+
+
+def _filter_options(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Add status/type/category filter options to a command."""
+    for name, short in (("category", "-c"), ("type", "-t"), ("status", "-s")):
+        func = click.option(
+            short,
+            f"--{name}",
+            multiple=True,
+            help=f"Only documents of this {name} (repeat or comma separate for any)",
+        )(func)
+    return func
+
+
+def _query_filters(
+    status: tuple[str, ...], type_: tuple[str, ...], category: tuple[str, ...]
+) -> QueryFilters:
+    """Parse the filter options into query filters."""
+    try:
+        return parse_filters(
+            {
+                name: list(values)
+                for name, values in (
+                    ("status", status),
+                    ("type", type_),
+                    ("category", category),
+                )
+                if values
+            }
+        )
+    except ValueError as err:
+        raise click.BadParameter(str(err)) from err
+
+
+def _select(
+    docs: EthereumDocs,
+    specs: tuple[str, ...],
+    filters: QueryFilters,
+    read: Callable[[list[int] | None], Iterable[DocT]],
+) -> Iterator[DocT]:
+    """Read documents by IDs (default: all) and filters, a batch of IDs at a time.
+
+    IDs asked for by themselves that aren't found (or don't match the filters) are
+    reported.  Ranges only cover the IDs there are, so they can be as wide as wanted.
+    """
+    matching = {record.id for record in docs.query(**filters)} if filters else None
+    known: list[int] | None = None
+
+    def _in_range(ids: range) -> list[int]:
+        nonlocal known
+        if known is None:
+            known = docs.ids() if matching is None else sorted(matching)
+        return known[bisect_left(known, ids.start) : bisect_left(known, ids.stop)]
+
+    def _batches() -> Iterator[tuple[list[int] | None, set[int]]]:
+        if not specs:
+            yield (None if matching is None else sorted(matching)), set()
+            return
+        batch: list[int] = []
+        explicit: set[int] = set()
+        for ids, alone in _parse_ids(specs):
+            if alone:
+                explicit.add(ids.start)
+                if matching is None or ids.start in matching:
+                    batch.append(ids.start)
+            else:
+                batch.extend(_in_range(ids))
+            while len(batch) >= ID_BATCH_SIZE:
+                batch, rest = batch[:ID_BATCH_SIZE], batch[ID_BATCH_SIZE:]
+                # IDs by themselves are reported with the batch they're read in
+                later = explicit.intersection(rest)
+                yield batch, explicit - later
+                batch, explicit = rest, later
+        yield batch, explicit
+
+    for batch, explicit in _batches():
+        found: set[int] = set()
+        # An empty list of IDs would read every document
+        for doc in read(batch) if batch != [] else ():
+            found.add(doc.id)
+            yield doc
+        for doc_id in sorted(explicit - found):
+            click.echo(f"{docs.document_type.name} {doc_id} not found", err=True)
+
+
+def _show(
+    docs: EthereumDocs,
+    specs: tuple[str, ...],
+    filters: QueryFilters,
+    headers: bool,
+    output: str,
+) -> None:
+    """Write documents one at a time, as they're read."""
+    for doc in _select(
+        docs, specs, filters, lambda ids: docs.get(ids, headers_only=headers)
+    ):
+        if output in ("json", "ndjson"):
+            # One per line, flushed by echo
+            click.echo(doc.model_dump_json(exclude={"body"} if headers else None))
+            continue
+
+        click.echo("---")
+        for k, v in doc.headers.items():
+            click.echo(f"{k}: {', '.join(map(str, v)) if isinstance(v, list) else v}")
+        click.echo("---\n")
+
+        if not headers:
+            click.echo(doc.body)
+
+
+def _list(
+    docs: EthereumDocs, specs: tuple[str, ...], filters: QueryFilters, output: str
+) -> None:
+    """Write the headers of documents one per line, as they're read."""
+    for record in _select(
+        docs, specs, filters, lambda ids: docs.records(ids, headers_only=True)
+    ):
+        if output == "ndjson":
+            click.echo(record.model_dump_json(exclude={"body"}))
+        else:
+            status = record.status.value if record.status else ""
+            click.echo(f"{record.id}\t{status}\t{record.title or ''}")
+
+
+@click.group(cls=DocsGroup)
 @click.option("-d", "--debug", is_flag=True, default=False)
-def eips_cli(debug: bool) -> None:
+@click.option(
+    "--offline", is_flag=True, default=False, help="Only read the local clone, no fetch"
+)
+@click.option(
+    "--max-age",
+    type=int,
+    default=60,
+    help="Fetch if the local clone was fetched longer ago than this many seconds",
+)
+@click.pass_context
+def eips_cli(ctx: click.Context, debug: bool, offline: bool, max_age: int) -> None:
     """Eips command"""
     if debug:
         set_debug_logging()
+    ctx.obj = {"freshness": timedelta(seconds=max_age), "offline": offline}
 
 
-@eips_cli.command(help="Display an EIP")
-@click.argument("eip_id", type=int)
+@eips_cli.command(
+    help="Display EIPs by IDs like 1559 or 1-100 (- reads IDs from stdin) or filters"
+)
+@click.argument("ids", nargs=-1)
+@_filter_options
 @click.option(
     "-i", "--headers", "headers", help="Show headers only", is_flag=True, default=False
 )
-@click.option("-o", "--output", type=click.Choice(["json", "text"]), default="text")
-def show(eip_id: int, headers: bool, output: str) -> None:
-    """Display an EIP."""
-    eips = EIPs()
-    eips.repo_fetch()
-    res = list(eips.get(eip_id))
-
-    if len(res) > 2:
-        click.echo("Found more than one EIP")
-        sys.exit(1)
-    elif len(res) < 1:
-        if output == "JSON":
-            click.echo("[]")
-        else:
-            click.echo("EIP not found")
-        sys.exit(0)
-
-    eip = res[0]
-
-    if output == "json":
-        exclude = dict()
-
-        if headers:
-            exclude["body"] = True
+@click.option(
+    "-o", "--output", type=click.Choice(["json", "ndjson", "text"]), default="text"
+)
+def show(
+    ids: tuple[str, ...],
+    status: tuple[str, ...],
+    type: tuple[str, ...],
+    category: tuple[str, ...],
+    headers: bool,
+    output: str,
+) -> None:
+    """Display EIPs, by IDs and filters.  JSON is one document per line."""
+    filters = _query_filters(status, type, category)
+    with EIPs(**_fetch_options()) as docs:
+        _show(docs, ids, filters, headers, output)
 
-        click.echo(eip.json(exclude=exclude))
-    else:
-        click.echo("---")
-        for k, v in eip.headers.items():
-            click.echo(f"{k}: {', '.join(v) if isinstance(v, list) else v}")
-        click.echo("---\n")
 
-        if not headers:
-            click.echo(eip.body)
+@eips_cli.command(
+    "list",
+    help="List EIPs by IDs like 1559 or 1-100 (- reads IDs from stdin) or filters",
+)
+@click.argument("ids", nargs=-1)
+@_filter_options
+@click.option("-o", "--output", type=click.Choice(["ndjson", "text"]), default="text")
+def list_eips(
+    ids: tuple[str, ...],
+    status: tuple[str, ...],
+    type: tuple[str, ...],
+    category: tuple[str, ...],
+    output: str,
+) -> None:
+    """List EIPs (ID, status and title), by IDs and filters."""
+    filters = _query_filters(status, type, category)
+    with EIPs(**_fetch_options()) as docs:
+        _list(docs, ids, filters, output)
 
 
 @eips_cli.command(help="Check that EIPs in repo can be parsed")
-def check() -> None:
+@click.option(
+    "-j", "--jobs", type=int, default=None, help="Parse with this many processes"
+)
+def check(jobs: int | None) -> None:
     """Check that EIPs in repo can be parsed."""
-    eips = EIPs()
+    eips = EIPs(workers=jobs, **_fetch_options())
 
     if eips.check():
         click.echo("No errors found")
@@ -70,59 +267,248 @@ def check() -> None:
     sys.exit(1)
 
 
-@click.group()
-@click.option("-d", "--debug", is_flag=True, default=False)
-def ercs_cli(debug: bool) -> None:
-    """`ercs` command."""
-    if debug:
-        set_debug_logging()
+@eips_cli.command(help="Full-text search EIPs")
+@click.argument("terms", nargs=-1, required=True)
+@click.option("-n", "--limit", type=int, default=20, help="Maximum results")
+@click.option("-o", "--output", type=click.Choice(["json", "text"]), default="text")
+def search(terms: tuple[str, ...], limit: int, output: str) -> None:
+    """Full-text search EIPs."""
+    with EIPs(**_fetch_options()) as eips:
+        results = list(eips.search(" ".join(terms), limit=limit))
+
+    if output == "json":
+        click.echo(
+            json.dumps(
+                [
+                    {
+                        "id": result.document.id,
+                        "title": result.document.title,
+                        "score": result.score,
+                        "snippet": result.snippet,
+                    }
+                    for result in results
+                ]
+            )
+        )
+        return
 
+    if not results:
+        click.echo("No EIPs found")
+    for result in results:
+        click.echo(f"{result.document.id}: {result.document.title}")
+        click.echo(f"    {' '.join(result.snippet.split())}")
 
-@ercs_cli.command("show", help="Display an ERC")
-@click.argument("erc_id", type=int)
+
+@eips_cli.command(help="Show dependencies between EIPs")
+@click.argument("eip_id", type=int, required=False)
 @click.option(
-    "-i", "--headers", "headers", help="Show headers only", is_flag=True, default=False
+    "-r",
+    "--relation",
+    type=click.Choice(RELATIONS),
+    default="requires",
+    help="Header to follow",
+)
+@click.option(
+    "--reverse",
+    is_flag=True,
+    default=False,
+    help="Show the EIPs that depend on it instead",
+)
+@click.option("--direct", is_flag=True, default=False, help="Only direct dependencies")
+@click.option(
+    "--cycles", is_flag=True, default=False, help="Show dependency cycles instead"
 )
 @click.option("-o", "--output", type=click.Choice(["json", "text"]), default="text")
-def ercs_show(erc_id: int, headers: bool, output: str) -> None:
-    """Display an ERC."""
-    ercs = ERCs()
-    ercs.repo_fetch()
-    res = list(ercs.get(erc_id))
-
-    if len(res) > 2:
-        click.echo("Found more than one ERC")
-        sys.exit(1)
-    elif len(res) < 1:
-        if output == "JSON":
-            click.echo("[]")
-        else:
-            click.echo("ERC not found")
-        sys.exit(0)
+def deps(
+    eip_id: int | None,
+    relation: str,
+    reverse: bool,
+    direct: bool,
+    cycles: bool,
+    output: str,
+) -> None:
+    """Show dependencies between EIPs.
 
-    erc = res[0]
+    With an ID, show the EIPs it (transitively) depends on.  Without one, list every
+    EIP after the EIPs it depends on.
+    """
+    with EIPs(**_fetch_options()) as eips:
+        graph = eips.graph()
+
+    result: list[int] | list[list[int]]
+    if cycles:
+        result = graph.cycles(relation)
+    elif eip_id is not None:
+        if direct:
+            result = graph.edges(eip_id, relation, reverse=reverse)
+        else:
+            result = graph.closure(eip_id, relation, reverse=reverse)
+    else:
+        try:
+            result = graph.topological_order(relation)
+        except CycleError as err:
+            click.echo(str(err), err=True)
+            sys.exit(1)
 
     if output == "json":
-        exclude = dict()
+        click.echo(json.dumps(result))
+        return
 
-        if headers:
-            exclude["body"] = True
+    for item in result:
+        click.echo(", ".join(map(str, item)) if isinstance(item, list) else item)
 
-        click.echo(erc.json(exclude=exclude))
-    else:
-        click.echo("---")
-        for k, v in erc.headers.items():
-            click.echo(f"{k}: {', '.join(v) if isinstance(v, list) else v}")
-        click.echo("---\n")
 
-        if not headers:
-            click.echo(erc.body)
+@eips_cli.command(help="Export EIPs to a Parquet or Arrow file")
+@click.argument("output", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "-f", "--format", "fmt", type=click.Choice(EXPORT_FORMATS), default="parquet"
+)
+@click.option(
+    "--history", is_flag=True, default=False, help="Export every version of every EIP"
+)
+@click.option(
+    "--body", "include_body", is_flag=True, default=False, help="Include EIP bodies"
+)
+@click.option(
+    "-b", "--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per batch"
+)
+@click.option(
+    "-j", "--jobs", type=int, default=None, help="Parse with this many processes"
+)
+def export(
+    output: Path,
+    fmt: str,
+    history: bool,
+    include_body: bool,
+    batch_size: int,
+    jobs: int | None,
+) -> None:
+    """Export EIPs to a Parquet or Arrow file."""
+    with EIPs(workers=jobs, **_fetch_options()) as eips:
+        try:
+            rows = eips.export(
+                output,
+                fmt=fmt,
+                history=history,
+                batch_size=batch_size,
+                include_body=include_body,
+            )
+        except ImportError as err:
+            click.echo(str(err), err=True)
+            sys.exit(1)
+
+    click.echo(f"Exported {rows} EIPs to {output}")
+
+
+@eips_cli.command(help="Bundle parsed EIPs for a fast start without git")
+@click.argument("output", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "-j", "--jobs", type=int, default=None, help="Parse with this many processes"
+)
+def bundle(output: Path, jobs: int | None) -> None:
+    """Write the parsed EIPs at the latest commit to a bundle file."""
+    with EIPs(workers=jobs, **_fetch_options()) as eips:
+        count = eips.write_bundle(output)
+        commit = eips.current_commit
+
+    click.echo(f"Bundled {count} EIPs at {commit} to {output}")
+
+
+@eips_cli.command(help="Serve EIPs and ERCs as JSON over HTTP")
+@click.option("-h", "--host", default="127.0.0.1", help="Address to listen on")
+@click.option("-p", "--port", type=int, default=8080, help="Port to listen on")
+@click.option(
+    "-r",
+    "--refresh",
+    type=int,
+    default=60,
+    help="Fetch every this many seconds, unless --offline",
+)
+def serve(host: str, port: int, refresh: int) -> None:
+    """Serve EIPs and ERCs as JSON over HTTP, until interrupted."""
+    from eips import server
+
+    click.echo(f"Serving EIPs and ERCs on http://{host}:{port}, once read")
+    try:
+        asyncio.run(
+            server.serve(host, port, timedelta(seconds=refresh), **_fetch_options())
+        )
+    except KeyboardInterrupt:
+        pass
+
+
+@click.group(cls=DocsGroup)
+@click.option("-d", "--debug", is_flag=True, default=False)
+@click.option(
+    "--offline", is_flag=True, default=False, help="Only read the local clone, no fetch"
+)
+@click.option(
+    "--max-age",
+    type=int,
+    default=60,
+    help="Fetch if the local clone was fetched longer ago than this many seconds",
+)
+@click.pass_context
+def ercs_cli(ctx: click.Context, debug: bool, offline: bool, max_age: int) -> None:
+    """`ercs` command."""
+    if debug:
+        set_debug_logging()
+    ctx.obj = {"freshness": timedelta(seconds=max_age), "offline": offline}
+
+
+@ercs_cli.command(
+    "show",
+    help="Display ERCs by IDs like 1559 or 1-100 (- reads IDs from stdin) or filters",
+)
+@click.argument("ids", nargs=-1)
+@_filter_options
+@click.option(
+    "-i", "--headers", "headers", help="Show headers only", is_flag=True, default=False
+)
+@click.option(
+    "-o", "--output", type=click.Choice(["json", "ndjson", "text"]), default="text"
+)
+def ercs_show(
+    ids: tuple[str, ...],
+    status: tuple[str, ...],
+    type: tuple[str, ...],
+    category: tuple[str, ...],
+    headers: bool,
+    output: str,
+) -> None:
+    """Display ERCs, by IDs and filters.  JSON is one document per line."""
+    filters = _query_filters(status, type, category)
+    with ERCs(**_fetch_options()) as docs:
+        _show(docs, ids, filters, headers, output)
+
+
+@ercs_cli.command(
+    "list",
+    help="List ERCs by IDs like 1559 or 1-100 (- reads IDs from stdin) or filters",
+)
+@click.argument("ids", nargs=-1)
+@_filter_options
+@click.option("-o", "--output", type=click.Choice(["ndjson", "text"]), default="text")
+def ercs_list(
+    ids: tuple[str, ...],
+    status: tuple[str, ...],
+    type: tuple[str, ...],
+    category: tuple[str, ...],
+    output: str,
+) -> None:
+    """List ERCs (ID, status and title), by IDs and filters."""
+    filters = _query_filters(status, type, category)
+    with ERCs(**_fetch_options()) as docs:
+        _list(docs, ids, filters, output)
 
 
 @ercs_cli.command("check", help="Check that ERCs in repo can be parsed")
-def ercs_check() -> None:
+@click.option(
+    "-j", "--jobs", type=int, default=None, help="Parse with this many processes"
+)
+def ercs_check(jobs: int | None) -> None:
     """Check that ERCs in repo can be parsed."""
-    ercs = ERCs()
+    ercs = ERCs(workers=jobs, **_fetch_options())
 
     if ercs.check():
         click.echo("No errors found")
@@ -130,3 +516,150 @@ def ercs_check() -> None:
 
     click.echo("Errors found")
     sys.exit(1)
+
+
+@ercs_cli.command("search", help="Full-text search ERCs")
+@click.argument("terms", nargs=-1, required=True)
+@click.option("-n", "--limit", type=int, default=20, help="Maximum results")
+@click.option("-o", "--output", type=click.Choice(["json", "text"]), default="text")
+def ercs_search(terms: tuple[str, ...], limit: int, output: str) -> None:
+    """Full-text search ERCs."""
+    with ERCs(**_fetch_options()) as ercs:
+        results = list(ercs.search(" ".join(terms), limit=limit))
+
+    if output == "json":
+        click.echo(
+            json.dumps(
+                [
+                    {
+                        "id": result.document.id,
+                        "title": result.document.title,
+                        "score": result.score,
+                        "snippet": result.snippet,
+                    }
+                    for result in results
+                ]
+            )
+        )
+        return
+
+    if not results:
+        click.echo("No ERCs found")
+    for result in results:
+        click.echo(f"{result.document.id}: {result.document.title}")
+        click.echo(f"    {' '.join(result.snippet.split())}")
+
+
+@ercs_cli.command("deps", help="Show dependencies between ERCs")
+@click.argument("erc_id", type=int, required=False)
+@click.option(
+    "-r",
+    "--relation",
+    type=click.Choice(RELATIONS),
+    default="requires",
+    help="Header to follow",
+)
+@click.option(
+    "--reverse",
+    is_flag=True,
+    default=False,
+    help="Show the ERCs that depend on it instead",
+)
+@click.option("--direct", is_flag=True, default=False, help="Only direct dependencies")
+@click.option(
+    "--cycles", is_flag=True, default=False, help="Show dependency cycles instead"
+)
+@click.option("-o", "--output", type=click.Choice(["json", "text"]), default="text")
+def ercs_deps(
+    erc_id: int | None,
+    relation: str,
+    reverse: bool,
+    direct: bool,
+    cycles: bool,
+    output: str,
+) -> None:
+    """Show dependencies between ERCs.
+
+    With an ID, show the ERCs it (transitively) depends on.  Without one, list every
+    ERC after the ERCs it depends on.
+    """
+    with ERCs(**_fetch_options()) as ercs:
+        graph = ercs.graph()
+
+    result: list[int] | list[list[int]]
+    if cycles:
+        result = graph.cycles(relation)
+    elif erc_id is not None:
+        if direct:
+            result = graph.edges(erc_id, relation, reverse=reverse)
+        else:
+            result = graph.closure(erc_id, relation, reverse=reverse)
+    else:
+        try:
+            result = graph.topological_order(relation)
+        except CycleError as err:
+            click.echo(str(err), err=True)
+            sys.exit(1)
+
+    if output == "json":
+        click.echo(json.dumps(result))
+        return
+
+    for item in result:
+        click.echo(", ".join(map(str, item)) if isinstance(item, list) else item)
+
+
+@ercs_cli.command("export", help="Export ERCs to a Parquet or Arrow file")
+@click.argument("output", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "-f", "--format", "fmt", type=click.Choice(EXPORT_FORMATS), default="parquet"
+)
+@click.option(
+    "--history", is_flag=True, default=False, help="Export every version of every ERC"
+)
+@click.option(
+    "--body", "include_body", is_flag=True, default=False, help="Include ERC bodies"
+)
+@click.option(
+    "-b", "--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Rows per batch"
+)
+@click.option(
+    "-j", "--jobs", type=int, default=None, help="Parse with this many processes"
+)
+def ercs_export(
+    output: Path,
+    fmt: str,
+    history: bool,
+    include_body: bool,
+    batch_size: int,
+    jobs: int | None,
+) -> None:
+    """Export ERCs to a Parquet or Arrow file."""
+    with ERCs(workers=jobs, **_fetch_options()) as ercs:
+        try:
+            rows = ercs.export(
+                output,
+                fmt=fmt,
+                history=history,
+                batch_size=batch_size,
+                include_body=include_body,
+            )
+        except ImportError as err:
+            click.echo(str(err), err=True)
+            sys.exit(1)
+
+    click.echo(f"Exported {rows} ERCs to {output}")
+
+
+@ercs_cli.command("bundle", help="Bundle parsed ERCs for a fast start without git")
+@click.argument("output", type=click.Path(dir_okay=False, path_type=Path))
+@click.option(
+    "-j", "--jobs", type=int, default=None, help="Parse with this many processes"
+)
+def ercs_bundle(output: Path, jobs: int | None) -> None:
+    """Write the parsed ERCs at the latest commit to a bundle file."""
+    with ERCs(workers=jobs, **_fetch_options()) as ercs:
+        count = ercs.write_bundle(output)
+        commit = ercs.current_commit
+
+    click.echo(f"Bundled {count} ERCs at {commit} to {output}")
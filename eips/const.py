@@ -12,3 +12,14 @@ DATA_PATH = os.environ.get("EIPS_DATA_PATH", "~/.config/eips")
 REPO_DIR = "repo"
 EIPS_DIR = "EIPS"
 ERCS_DIR = "ERCS"
+CACHE_FILE = "cache.sqlite"
+SYNC_STATE_FILE = "sync.json"
+STORE_FILE = "store.sqlite"
+FETCH_LOCK_FILE = "fetch.lock"
+FETCH_STATE_FILE = "fetch.json"
+# Bump when parsing changes, to invalidate previously cached documents
+CACHE_VERSION = 1
+# Bump when the document store schema changes
+STORE_VERSION = 2
+# Bump when the document bundle format changes
+BUNDLE_VERSION = 1
@@ -1,26 +1,97 @@
 """EIPs and ERCs ETL machinery."""
 
+import json
+import os
+import time
 from abc import abstractmethod
-from collections.abc import Iterator, Sequence
+from collections import Counter, OrderedDict, deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from datetime import datetime, timedelta, timezone
+from functools import partial
 from pathlib import Path
-from typing import cast
+from threading import Lock
+from types import TracebackType
+from typing import Any, ClassVar, NamedTuple, cast
 
 from dulwich.objects import Blob
 from dulwich.objects import Commit as DulwichCommit
 from dulwich.repo import Repo
 from dulwich.walk import WalkEntry
 from pydantic import ValidationError
+from typing_extensions import Self, Unpack  # Support addded in 3.11
 
-from eips.const import DATA_PATH, ENCODING, IGNORE_FILES, REPO_DIR
-from eips.enum import EIP1Category, EIP1Status, EIP1Type
-from eips.git import ensure_repo_updated, git_commit_history, git_history
+from eips.bundle import BundleDocument, DocumentBundle, copy_bundle, write_bundle
+from eips.cache import DocumentCache
+from eips.const import (
+    CACHE_FILE,
+    DATA_PATH,
+    ENCODING,
+    FETCH_LOCK_FILE,
+    FETCH_STATE_FILE,
+    IGNORE_FILES,
+    REPO_DIR,
+    STORE_FILE,
+    SYNC_STATE_FILE,
+)
+from eips.enum import DocumentType, EIP1Category, EIP1Status, EIP1Type
+from eips.export import DEFAULT_BATCH_SIZE, export_documents
+from eips.git import (
+    deepen_repo,
+    fetch_repo,
+    git_blob_text,
+    git_commit_history,
+    git_history,
+    git_resolve_commit,
+    git_rev,
+    git_tree_blobs,
+    is_dir_repo,
+)
+from eips.graph import DocumentGraph
 from eips.logging import get_logger
-from eips.object import EIP, ERC, CommitHash, CommitRef, EIP1Document, EIPsStats, FlexId
-from eips.util import doc_id_from_file, gitstamp_to_dt
+from eips.object import (
+    EIP,
+    ERC,
+    AnyDocument,
+    CommitHash,
+    CommitRef,
+    DocumentRecord,
+    EIP1Document,
+    EIPRecord,
+    EIPsStats,
+    ERCRecord,
+    FlexId,
+    LazyBody,
+)
+from eips.parsing import header_block
+from eips.store import DocumentStore, QueryFilters, StoredDocument, StoreRow
+from eips.util import (
+    doc_id_from_file,
+    file_lock,
+    gitstamp_to_dt,
+    read_state,
+    write_state,
+)
 
 log = get_logger(__name__)
 
+# Number of commits handed to a worker at a time when extracting history in parallel
+HISTORY_RANGE_SIZE = 64
+# Number of per-commit document indexes kept around for commit seeking
+INDEX_CACHE_SIZE = 32
+# Number of per-commit stats kept around
+STATS_CACHE_SIZE = 32
+# Number of per-commit dependency graphs kept around
+GRAPH_CACHE_SIZE = 8
+
 
 def is_doc_file(f: Path) -> bool:
     """Is the given Path an design doc file?"""
@@ -32,19 +103,313 @@ def filter_doc_files(fdir: Path) -> list[Path]:
     return list(filter(is_doc_file, fdir.iterdir()))
 
 
+def parse_document(
+    doc_class: type[AnyDocument],
+    doc_id: int,
+    commit: CommitHash,
+    commit_time: datetime,
+    raw_text: str,
+) -> AnyDocument:
+    """Parse a document.  Module level so it can be sent to worker processes."""
+    return doc_class.parse(doc_id, commit, commit_time, raw_text)
+
+
+def blob_document_text(
+    read_blob: Callable[[bytes], str], blob: Blob, headers_only: bool = False
+) -> tuple[str, LazyBody | None]:
+    """Decode the text of a document blob.
+
+    With `headers_only`, only the header block is decoded and the body is returned as a
+    LazyBody, read with `read_blob` when accessed.  No LazyBody is returned if the text
+    has no body, or can't be split.
+    """
+    if not headers_only:
+        return blob.data.decode(ENCODING), None
+
+    data = blob.data
+    header = header_block(data)
+    text = header.decode(ENCODING)
+    if len(header) == len(data):
+        return text, None
+    return text, LazyBody(partial(read_blob, blob.id), len(text))
+
+
+def entry_documents(
+    repo: Repo,
+    entry: WalkEntry,
+    docs_subdir: str,
+    doc_class: type[AnyDocument],
+    cache: DocumentCache | None = None,
+    headers_only: bool = False,
+    read_blob: Callable[[bytes], str] | None = None,
+) -> Iterator[AnyDocument]:
+    """Parse the documents in `docs_subdir` changed by a history entry.
+
+    Deleted documents are yielded as their last version, flagged as `deleted`.  See
+    `blob_document_text` for `headers_only`.  Bodies are read by path unless given
+    `read_blob`, so documents can be sent back from worker processes.
+    """
+    if read_blob is None:
+        read_blob = partial(git_blob_text, Path(repo.path))
+    prefix = f"{docs_subdir}/".encode(ENCODING)
+    commit_id = CommitHash(entry.commit.id.decode(ENCODING))
+    commit_time = gitstamp_to_dt(entry.commit.commit_time, entry.commit.commit_timezone)
+
+    def _changes():
+        # flatten the changes
+        for change in entry.changes():
+            if isinstance(change, list):
+                yield from change
+            else:
+                yield change
+
+    for change in _changes():
+        deleted = not (change.new and change.new.path)
+        tree_entry = change.old if deleted else change.new
+
+        if not (tree_entry and tree_entry.path and tree_entry.sha):
+            continue
+
+        # Outside of the docs dir, skip
+        if not tree_entry.path.startswith(prefix):
+            continue
+
+        filename = Path(tree_entry.path.decode(ENCODING)).name
+        doc_id = doc_id_from_file(filename)
+
+        # Not a design doc, skip
+        if doc_id < 1:
+            continue
+
+        try:
+            git_obj = repo.get_object(tree_entry.sha)
+            if not isinstance(git_obj, Blob):
+                log.error(
+                    f"Expected git object to be a Blob. Instead got"
+                    f" {type(git_obj)} (file: {filename})"
+                )
+                continue
+            doc_body, lazy_body = blob_document_text(read_blob, git_obj, headers_only)
+        except UnicodeDecodeError as err:
+            raise err
+
+        try:
+            if cache is None:
+                doc = doc_class.parse(doc_id, commit_id, commit_time, doc_body)
+            else:
+                doc = cache.parse(
+                    doc_class, doc_id, tree_entry.sha, commit_id, commit_time, doc_body
+                )
+        except ValidationError:
+            log.exception(
+                f"Failed to parse document (id: {doc_id}) (commit: {commit_id})"
+            )
+            continue
+
+        update: dict[str, Any] = {}
+        if lazy_body is not None:
+            update["body"] = lazy_body
+        if deleted:
+            update["deleted"] = True
+        yield doc.model_copy(update=update) if update else doc
+
+
+def extract_commit_range(
+    repo_path: Path,
+    docs_subdir: str,
+    doc_class: type[AnyDocument],
+    commit_ids: list[bytes],
+    cache_path: Path | None = None,
+    headers_only: bool = False,
+) -> list[tuple[int, AnyDocument]]:
+    """Parse the documents changed by each commit in a range.
+
+    Run in worker processes, so the repo (and cache) are opened here.  Returns the index
+    of the commit in the range along with each document.
+    """
+    cache = DocumentCache(cache_path) if cache_path is not None else None
+    results: list[tuple[int, AnyDocument]] = []
+    try:
+        with Repo(str(repo_path)) as repo:
+            for idx, commit_id in enumerate(commit_ids):
+                # Not path limited, or the walker would go on to find an ancestor
+                # touching the docs.  Other files are skipped by entry_documents().
+                for entry in repo.get_walker(include=[commit_id], max_entries=1):
+                    for doc in entry_documents(
+                        repo, entry, docs_subdir, doc_class, cache, headers_only
+                    ):
+                        results.append((idx, doc))
+    finally:
+        if cache is not None:
+            cache.close()
+    return results
+
+
+class ParseTask(NamedTuple):
+    """A raw document to be parsed."""
+
+    doc_id: int
+    blob_sha: bytes
+    commit: CommitHash
+    commit_time: datetime
+    raw_text: str
+    # Set on the parsed document, when only the headers were read
+    body: LazyBody | None = None
+
+
+class SearchResult(NamedTuple):
+    """A document matching a search, with its score (higher is better)."""
+
+    document: DocumentRecord
+    score: float
+    # Matching text, with the matched terms in [brackets]
+    snippet: str
+
+
+class Snapshot(NamedTuple):
+    """A fetched commit of the repo that documents are read from."""
+
+    commit: CommitHash
+    commit_time: datetime
+
+
+class DocFile(NamedTuple):
+    """A document file in the repo tree at some commit."""
+
+    doc_id: int
+    path: Path
+    blob_sha: bytes
+
+
+class DocSummary(NamedTuple):
+    """The parts of a document aggregated by stats."""
+
+    category: EIP1Category | None
+    status: EIP1Status | None
+    type: EIP1Type | None
+    errors: int
+
+    @classmethod
+    def of(cls, doc: AnyDocument) -> Self:
+        """Summarize a document."""
+        return cls(doc.category, doc.status, doc.type, len(doc.errors))
+
+
+class DocStats:
+    """Aggregates of the documents at a commit, kept per document file.
+
+    Documents can be added and removed one at a time, so the aggregates of a commit can
+    be updated from those of another without recounting.
+    """
+
+    def __init__(self, commit: CommitHash):
+        """Initialize empty aggregates for a commit."""
+        self.commit = commit
+        self.docs: dict[int, DocSummary] = {}
+        self.categories: Counter[EIP1Category] = Counter()
+        self.statuses: Counter[EIP1Status] = Counter()
+        self.types: Counter[EIP1Type] = Counter()
+        self.errors = 0
+        self.invalid = 0
+
+    def copy(self, commit: CommitHash) -> "DocStats":
+        """Return a copy of the aggregates, for another commit."""
+        other = DocStats(commit)
+        other.docs = self.docs.copy()
+        other.categories = self.categories.copy()
+        other.statuses = self.statuses.copy()
+        other.types = self.types.copy()
+        other.errors = self.errors
+        other.invalid = self.invalid
+        return other
+
+    def _count(self, summary: DocSummary, n: int) -> None:
+        if summary.category is not None:
+            self.categories[summary.category] += n
+        if summary.status is not None:
+            self.statuses[summary.status] += n
+        if summary.type is not None:
+            self.types[summary.type] += n
+        self.errors += n * summary.errors
+        self.invalid += n * bool(summary.errors)
+
+    def add(self, doc_id: int, summary: DocSummary) -> None:
+        """Add (or replace) the document from a file."""
+        self.remove(doc_id)
+        self.docs[doc_id] = summary
+        self._count(summary, 1)
+
+    def remove(self, doc_id: int) -> None:
+        """Remove the document from a file, if counted."""
+        summary = self.docs.pop(doc_id, None)
+        if summary is not None:
+            self._count(summary, -1)
+
+    def to_stats(self) -> EIPsStats:
+        """Return the aggregates as EIPsStats."""
+        category_counts = {k: n for k, n in self.categories.items() if n > 0}
+        status_counts = {k: n for k, n in self.statuses.items() if n > 0}
+        type_counts = {k: n for k, n in self.types.items() if n > 0}
+        return EIPsStats(
+            errors=self.errors,
+            categories=list(category_counts),
+            statuses=list(status_counts),
+            total=len(self.docs),
+            types=list(type_counts),
+            invalid=self.invalid,
+            category_counts=category_counts,
+            status_counts=status_counts,
+            type_counts=type_counts,
+        )
+
+
 class EthereumDocs:
     """Ethereum Docs ETL machinery"""
 
+    document_type: ClassVar[DocumentType]
+    document_class: ClassVar[type[EIP1Document]]
+
     def __init__(
         self,
         freshness: timedelta | None,
         repo: str,
         workdir: Path,
+        cache: bool = True,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        store: bool = True,
+        background_refresh: bool = False,
+        depth: int | None = None,
+        sparse: bool = False,
+        offline: bool = False,
     ):
-        """Initialize an Ethereum design document object."""
+        """Initialize an Ethereum design document object.
+
+        Documents are parsed serially unless `workers` (the size of a process pool
+        created on first use) or an `executor` to parse in is given.  With `store`,
+        `query()` is answered from a SQLite store of document headers in the workdir.
+        With `background_refresh`, a due fetch runs in a background thread while reads
+        keep using the last fetched commit.
+
+        A `depth` makes a shallow clone of that many commits, deepened when older
+        history is read.  With `sparse`, only the docs directory is checked out.
+
+        The time of the last fetch is kept in the workdir, so a local clone fetched
+        within `freshness` is read as is, even by a new process.  With `offline`, the
+        repo is never fetched (or deepened) on its own, and reads use the local clone.
+        """
         self.freshness = freshness
         self.repo = repo
         self.workdir = workdir
+        self.cache = DocumentCache(workdir.joinpath(CACHE_FILE)) if cache else None
+        self.store = DocumentStore(workdir.joinpath(STORE_FILE)) if store else None
+        self.background_refresh = background_refresh
+        self.depth = depth
+        self.sparse = sparse
+        self.offline = offline
+        self.workers = workers
+        self._executor = executor
+        self._owns_executor = False
         self.repo_path = self.workdir.joinpath(REPO_DIR)
         self.docs_dir = self.repo_path.joinpath("docs")
         self.assets_dir = self.repo_path.joinpath("assets")
@@ -52,8 +417,17 @@ class EthereumDocs:
         self._last_fetch: datetime = datetime(
             year=1970, month=1, day=1, tzinfo=timezone.utc
         )
-        self._current_commit: CommitHash | None = None
-        self._current_commit_time: datetime | None = None
+        # Swapped as a whole, so readers never see a commit with another's time
+        self._snapshot: Snapshot | None = None
+        self._fetch_executor: ThreadPoolExecutor | None = None
+        self._refresh: Future[CommitHash] | None = None
+        self._refresh_lock = Lock()
+        self._git_repo: Repo | None = None
+        self._bundle: DocumentBundle | None = None
+        self._doc_indexes: OrderedDict[CommitHash, dict[int, DocFile]] = OrderedDict()
+        self._stats: OrderedDict[CommitHash, EIPsStats] = OrderedDict()
+        self._last_doc_stats: DocStats | None = None
+        self._graphs: OrderedDict[CommitHash, DocumentGraph] = OrderedDict()
 
     def __getitem__(self, eip_id: int) -> EIP1Document | None:
         """Return an EIP-1 document by ID."""
@@ -71,15 +445,69 @@ class EthereumDocs:
         """Iterate over all documents."""
         yield from self.get()
 
+    def __enter__(self) -> Self:
+        """Enter a context that closes the git repo handle on exit."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the git repo handle."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the cached git repo handle, document cache and store, if open.
+
+        Waits for a background fetch to finish, if one is running.
+        """
+        if self._fetch_executor is not None:
+            self._fetch_executor.shutdown()
+            self._fetch_executor = None
+        self._close_repo()
+        if self._bundle is not None:
+            self._bundle.close()
+            self._bundle = None
+        if self.cache is not None:
+            self.cache.close()
+        if self.store is not None:
+            self.store.close()
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._owns_executor = False
+
+    def _close_repo(self) -> None:
+        """Close the cached git repo handle, if open."""
+        if self._git_repo is not None:
+            self._git_repo.close()
+            self._git_repo = None
+
+    @property
+    def executor(self) -> Executor | None:
+        """The executor documents are parsed in, if parsing in parallel."""
+        if self._executor is None and self.workers:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            self._owns_executor = True
+        return self._executor
+
     @property
     def current_commit(self) -> CommitHash | None:
         """Return the current commit hash of the local document repo."""
-        return self._current_commit
+        snapshot = self._snapshot
+        return snapshot.commit if snapshot is not None else None
+
+    def resolve_commit(self, commit: CommitRef | None = None) -> CommitHash:
+        """Resolve a commit ref, by default to the current commit (fetched if due)."""
+        return self._resolve_commit(commit)
 
     @property
     def current_commit_time(self) -> datetime | None:
         """Return the current commit time of the local document repo."""
-        return self._current_commit_time
+        snapshot = self._snapshot
+        return snapshot.commit_time if snapshot is not None else None
 
     @property
     def last_fetch(self) -> datetime:
@@ -88,8 +516,14 @@ class EthereumDocs:
 
     @property
     def git_repo(self) -> Repo:
-        """The Dulwich Git repo."""
-        return Repo(str(self.repo_path))
+        """The Dulwich Git repo.
+
+        The handle (and its object store pack indexes) is opened once and reused until
+        the repo is fetched or `close()` is called.
+        """
+        if self._git_repo is None:
+            self._git_repo = Repo(str(self.repo_path))
+        return self._git_repo
 
     @property
     def assets(self) -> Iterator[tuple[Path, str]]:
@@ -103,11 +537,59 @@ class EthereumDocs:
                 yield fpath, str(fpath.relative_to(self.assets_dir))
 
     @property
-    def _files(self) -> list[Path]:
-        try:
-            return filter_doc_files(self.docs_dir)
-        except FileNotFoundError:
-            return []
+    def _docs_subdir(self) -> str:
+        """The docs directory path relative to the repo root."""
+        return self.docs_dir.relative_to(self.repo_path).as_posix()
+
+    @property
+    def _index(self) -> dict[int, DocFile]:
+        """ID to document file index of the current commit.
+
+        Built from the commit's tree once, and rebuilt only when the commit moves.
+        """
+        commit = self.current_commit
+        if commit is None:
+            # Not fetched (yet), so fall back to whatever is checked out locally
+            if not is_dir_repo(self.repo_path):
+                return {}
+            commit = git_rev(self.git_repo)
+
+        return self._index_at(commit)
+
+    def _index_at(self, commit: CommitHash) -> dict[int, DocFile]:
+        """ID to document file index of the given commit.
+
+        The indexes of the last `INDEX_CACHE_SIZE` commits used are kept.
+        """
+        index = self._doc_indexes.get(commit)
+        if index is None:
+            index = self._build_index(commit)
+            self._doc_indexes[commit] = index
+            while len(self._doc_indexes) > INDEX_CACHE_SIZE:
+                self._doc_indexes.popitem(last=False)
+        else:
+            self._doc_indexes.move_to_end(commit)
+        return index
+
+    def _build_index(self, commit: CommitHash) -> dict[int, DocFile]:
+        """Build an ID to document file index from the tree of the given commit."""
+        bundle = self._bundle
+        if bundle is not None and commit == bundle.commit:
+            return {
+                doc_id: DocFile(doc_id, self.docs_dir.joinpath(fname), blob_sha)
+                for doc_id, fname, blob_sha in bundle.files()
+            }
+
+        index: dict[int, DocFile] = {}
+        for fname, blob_sha in git_tree_blobs(self.git_repo, commit, self._docs_subdir):
+            fpath = self.docs_dir.joinpath(fname)
+            if not is_doc_file(fpath):
+                continue
+            doc_id = doc_id_from_file(fname)
+            if doc_id < 1:
+                continue
+            index[doc_id] = DocFile(doc_id, fpath, blob_sha)
+        return index
 
     def check(
         self,
@@ -116,7 +598,10 @@ class EthereumDocs:
         commit: CommitRef | None = None,
     ) -> bool:
         """Check if all documents are valid."""
-        return all(doc.is_valid for doc in self.get(doc_id, commit=commit))
+        return all(
+            doc.is_valid
+            for doc in self.get(doc_id, commit=commit, ordered=False, headers_only=True)
+        )
 
     @abstractmethod
     def get(
@@ -124,70 +609,153 @@ class EthereumDocs:
         doc_id: FlexId | None = None,
         *,
         commit: CommitRef | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
     ) -> Iterator[EIP1Document]:
-        """Return document(s) by ID(s)."""
+        """Return document(s) by ID(s).
+
+        With `headers_only`, only the document headers are read up front.  Each `body`
+        is then a `LazyBody`, read from the repo when accessed.
+        """
         pass
 
     @abstractmethod
     def all(
-        self, until_commit: CommitHash | None = None
+        self,
+        until_commit: CommitHash | None = None,
+        *,
+        since: datetime | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
     ) -> Iterator[tuple[DulwichCommit, EIP1Document]]:
         """Return history of EIP documents in reverse order until until_commit."""
         pass
 
-    def _get_doc_commits(self, doc_id: int) -> Sequence[DulwichCommit]:
+    @abstractmethod
+    def records(
+        self,
+        doc_id: FlexId | None = None,
+        *,
+        commit: CommitRef | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
+    ) -> Iterator[DocumentRecord]:
+        """Return compact, unvalidated document(s) by ID(s).
+
+        Records skip validation, for bulk processing.  Use `to_document()` to upgrade
+        one to a validated document.
+        """
+        pass
+
+    @abstractmethod
+    def all_records(
+        self,
+        until_commit: CommitHash | None = None,
+        *,
+        since: datetime | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
+    ) -> Iterator[tuple[DulwichCommit, DocumentRecord]]:
+        """Return history of compact, unvalidated documents.  See `all()`."""
+        pass
+
+    @abstractmethod
+    def query(
+        self,
+        commit: CommitRef | None = None,
+        **filters: Unpack[QueryFilters],
+    ) -> Iterator[DocumentRecord]:
+        """Return the documents at a commit (default: current) matching the filters.
+
+        Filters are answered by the document store, which is populated with the headers
+        of the documents at a commit the first time it's queried.  See `QueryFilters`.
+        """
+        pass
+
+    @abstractmethod
+    def search(
+        self,
+        terms: str,
+        *,
+        commit: CommitRef | None = None,
+        limit: int | None = 20,
+    ) -> Iterator[SearchResult]:
+        """Full-text search titles, descriptions and bodies, best matches first.
+
+        Every term has to match, either as a word or a word prefix.  The search index
+        lives in the document store, and only new document versions are indexed when
+        a commit is first searched.
+        """
+        pass
+
+    @abstractmethod
+    def sync(self) -> Generator[tuple[DulwichCommit, EIP1Document], None, None]:
+        """Return document versions committed since the last sync, oldest first."""
+        pass
+
+    @property
+    def sync_commit(self) -> CommitHash | None:
+        """The commit `sync()` has processed up to, if any."""
+        commit = read_state(self.workdir.joinpath(SYNC_STATE_FILE)).get("commit")
+        return CommitHash(commit) if commit else None
+
+    def _save_sync_commit(self, commit: CommitHash) -> None:
+        write_state(self.workdir.joinpath(SYNC_STATE_FILE), {"commit": commit})
+
+    def _get_doc_commits(self, doc_id: int) -> Iterator[DulwichCommit]:
+        self._ensure_history()
         subdir = self.docs_dir.relative_to(self.repo_path)
-        return git_commit_history(
-            self.repo_path, [str(subdir.joinpath(f"{doc_id}.md"))]
-        )
+        return git_commit_history(self.git_repo, [str(subdir.joinpath(f"{doc_id}.md"))])
 
-    def _get_doc_history(self, doc_id: int) -> Sequence[WalkEntry]:
+    def _get_doc_history(self, doc_id: int) -> Iterator[WalkEntry]:
+        self._ensure_history()
         subdir = self.docs_dir.relative_to(self.repo_path)
-        return git_history(self.repo_path, [str(subdir.joinpath(f"{doc_id}.md"))])
+        return git_history(self.git_repo, [str(subdir.joinpath(f"{doc_id}.md"))])
 
     def _get_doc(
         self,
         doc_id: FlexId | None = None,
-        commit: CommitRef | None = None,
-    ) -> list[Path]:
-        if commit is not None:
-            raise NotImplementedError("commit seeking not implemented")
+        commit: CommitHash | None = None,
+    ) -> list[DocFile]:
+        index = self._index if commit is None else self._index_at(commit)
 
         if doc_id is None or (isinstance(doc_id, list) and len(doc_id) == 0):
             # Return all docs
-            return self._files
-            # return [
-            #     EIP.parse(current_commit, fil.read_text()) for fil in self._files
-            # ]
+            return list(index.values())
         elif isinstance(doc_id, int):
             doc_id = [doc_id]
 
         assert isinstance(doc_id, list)
 
-        def is_match(f: Path) -> bool:
-            return doc_id_from_file(f.name) in doc_id
-
-        return list(filter(is_match, self._files))
+        return [index[i] for i in doc_id if i in index]
 
     def len(self) -> int:
         """Total EIPs in the repo"""
-        return len(self._files)
+        return len(self._index)
+
+    def ids(self, commit: CommitRef | None = None) -> list[int]:
+        """Return the IDs of the documents at a commit (default: current), in order."""
+        return sorted(self._index_at(self._resolve_commit(commit)))
 
     def commits(
-        self, until_commit: CommitHash | None = None
+        self,
+        until_commit: CommitHash | None = None,
+        *,
+        since: datetime | None = None,
     ) -> Iterator[DulwichCommit]:
         """Return a commits history for the repo."""
-        for commit in git_commit_history(self.repo_path):
-            if commit.id == until_commit:
-                break
-            yield commit
+        self._ensure_history(until_commit, since)
+        return git_commit_history(self.git_repo, until_commit=until_commit, since=since)
 
-    def history(self, until_commit: CommitHash | None = None) -> Iterator[WalkEntry]:
+    def history(
+        self,
+        until_commit: CommitHash | None = None,
+        *,
+        since: datetime | None = None,
+    ) -> Iterator[WalkEntry]:
         """Return the history for the repo."""
-        for entry in git_history(self.repo_path):
-            if entry.commit.id == until_commit:
-                break
-            yield entry
+        self._ensure_history(until_commit, since)
+        return git_history(self.git_repo, until_commit=until_commit, since=since)
 
     def logs(self) -> list[str]:
         """Return commit messages for the given EIP"""
@@ -196,37 +764,588 @@ class EthereumDocs:
     def repo_fetch(self) -> CommitHash:
         """Fetch (or clone) an EIPs repo"""
         self._last_fetch = datetime.now(tz=timezone.utc)
-        self._current_commit = ensure_repo_updated(self.repo_path, self.repo)
-        assert self.current_commit
-        commit = self.git_repo.object_store[self.current_commit.encode("utf-8")]
-        if isinstance(commit, DulwichCommit):  # Note: should always be true
-            self._current_commit_time = gitstamp_to_dt(
-                commit.commit_time, commit.commit_timezone
+        # The fetch adds refs and packs, so drop the old handle
+        self._close_repo()
+        self._snapshot = self._fetch_snapshot()
+        return self._snapshot.commit
+
+    def refresh(self) -> Future[CommitHash]:
+        """Fetch the repo in a background thread, returning the fetch's future.
+
+        Reads keep using the current commit until the fetch finishes, then the fetched
+        commit is swapped in.  If a fetch is already running, its future is returned.
+        """
+        with self._refresh_lock:
+            if self._refresh is None or self._refresh.done():
+                self._last_fetch = datetime.now(tz=timezone.utc)
+                if self._fetch_executor is None:
+                    self._fetch_executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="eips-fetch"
+                    )
+                self._refresh = self._fetch_executor.submit(self._background_fetch)
+            return self._refresh
+
+    def _background_fetch(self) -> CommitHash:
+        """Fetch the repo and swap in the fetched commit."""
+        try:
+            snapshot = self._fetch_snapshot()
+        except Exception:
+            log.exception(f"Background fetch failed, still at {self.current_commit}")
+            raise
+        # The open handle picks up new packs on its own, and may be in use
+        self._snapshot = snapshot
+        log.debug(f"Refreshed to {snapshot.commit}")
+        return snapshot.commit
+
+    def _fetch_snapshot(self) -> Snapshot:
+        """Fetch (or clone) the repo, without touching what's being read.
+
+        Concurrent fetches of the workdir, from any thread or process, share one.
+        """
+        fetched = self._last_fetch
+        commit = fetch_repo(
+            self.repo_path,
+            self.repo,
+            self.workdir.joinpath(FETCH_LOCK_FILE),
+            self.depth,
+            [self._docs_subdir] if self.sparse else None,
+        )
+        with Repo(str(self.repo_path)) as repo:
+            commit_obj = repo[commit.encode(ENCODING)]
+            assert isinstance(commit_obj, DulwichCommit)
+            commit_time = gitstamp_to_dt(
+                commit_obj.commit_time, commit_obj.commit_timezone
             )
-        return self._current_commit
-
-    def stats(self, commit: CommitRef | None = None) -> EIPsStats:
-        """Return some aggregate data based on EIP files"""
-        categories: list[EIP1Category] = []
-        statuses: list[EIP1Status] = []
-        types: list[EIP1Type] = []
-
-        for eip in self.get():
-            if eip.category not in categories and eip.category is not None:
-                categories.append(eip.category)
-            if eip.status not in statuses:
-                statuses.append(eip.status)
-            if eip.type and eip.type not in types:
-                types.append(eip.type)
+        write_state(
+            self.workdir.joinpath(FETCH_STATE_FILE),
+            {"commit": commit, "fetched": fetched.isoformat()},
+        )
+        return Snapshot(commit, commit_time)
 
-        return EIPsStats(
-            # TODO: Errors should be something real.
-            errors=0,
-            categories=categories,
-            statuses=statuses,
-            total=self.len(),
-            types=types,
+    def _resume_local(self) -> None:
+        """Read from the local clone as of its last fetch, by this or another process.
+
+        Only once it's known when that fetch was (or `offline`), so an untracked clone
+        is still fetched when due.
+        """
+        if not is_dir_repo(self.repo_path):
+            return
+        fetched = read_state(self.workdir.joinpath(FETCH_STATE_FILE)).get("fetched")
+        if fetched is None and not self.offline:
+            return
+
+        commit = git_rev(self.git_repo)
+        with self._refresh_lock:
+            if self._snapshot is not None:
+                return
+            if fetched is not None:
+                self._last_fetch = datetime.fromisoformat(fetched)
+            self._snapshot = Snapshot(commit, self._commit_time(commit))
+        log.debug(f"Resumed local clone at {commit}, fetched {fetched}")
+
+    def _autofetch(self) -> None:
+        """Fetch the repo if due, in the background with `background_refresh`."""
+        if self._snapshot is None:
+            self._resume_local()
+        if self.offline:
+            if self._snapshot is None:
+                raise FileNotFoundError(
+                    f"No local clone at {self.repo_path} to read offline"
+                )
+            return
+
+        if not self.background_refresh:
+            if self._should_autofetch:
+                self.repo_fetch()
+            return
+
+        if self._should_autofetch:
+            self.refresh()
+        refresh = self._refresh
+        if self._snapshot is None and refresh is not None:
+            # Nothing to read until the first fetch lands
+            refresh.result()
+
+    def _ensure_history(
+        self,
+        commit: CommitRef | None = None,
+        since: datetime | None = None,
+    ) -> None:
+        """Deepen a shallow clone until it has the history a read needs.
+
+        That's until `commit` is found or the history goes back to `since`, or all of
+        history without either.  The depth is doubled each time.
+        """
+        if (
+            self.offline
+            or not is_dir_repo(self.repo_path)
+            or not self.git_repo.get_shallow()
+        ):
+            return
+
+        if commit is None and since is None:
+            self._deepen()
+            return
+
+        depth = self.depth or 1
+        while True:
+            if commit is not None and self._has_commit(commit):
+                return
+            if since is not None and all(
+                commit_obj.commit_time < int(since.timestamp())
+                for commit_obj in self._shallow_commits()
+            ):
+                return
+            depth *= 2
+            if not self._deepen(depth):
+                return
+
+    def _has_commit(self, commit: CommitRef) -> bool:
+        """Can a commit ref be resolved with the history fetched so far?"""
+        try:
+            git_resolve_commit(self.git_repo, commit)
+        except ValueError:
+            return False
+        return True
+
+    def _shallow_commits(self) -> Iterator[DulwichCommit]:
+        """Yield the oldest commits of a shallow clone."""
+        repo = self.git_repo
+        for sha in repo.get_shallow():
+            commit_obj = repo[sha]
+            assert isinstance(commit_obj, DulwichCommit)
+            yield commit_obj
+
+    def _deepen(self, depth: int | None = None) -> bool:
+        """Fetch `depth` commits of history (or all), returning if still shallow."""
+        start = time.perf_counter()
+        with file_lock(self.workdir.joinpath(FETCH_LOCK_FILE)):
+            shallow = deepen_repo(self.repo_path, self.repo, depth)
+        # The shallow commits and packs changed under the open handle
+        self._close_repo()
+        log.debug(
+            f"Deepened {self.repo_path} to {depth or 'all'} commits"
+            f" in {time.perf_counter() - start:.2f}s"
+        )
+        return shallow
+
+    def stats(
+        self,
+        commit: CommitRef | None = None,
+        *,
+        incremental: bool = True,
+    ) -> EIPsStats:
+        """Return some aggregate data based on EIP files
+
+        Stats are computed in a single pass over document headers and memoized per
+        commit.  With `incremental`, stats of a new commit are updated from the last
+        computed ones, parsing only the documents that differ between the two trees.
+        """
+        stats_commit = self._resolve_commit(commit)
+        stats = self._stats.get(stats_commit)
+        if stats is None:
+            stats = self._doc_stats(stats_commit, incremental).to_stats()
+            self._stats[stats_commit] = stats
+            while len(self._stats) > STATS_CACHE_SIZE:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(stats_commit)
+        return stats
+
+    def graph(self, commit: CommitRef | None = None) -> DocumentGraph:
+        """Return the graph of requires/replaces/superseded-by relations at a commit.
+
+        The graph is built from document headers once per commit and memoized.
+        """
+        graph_commit = self._resolve_commit(commit)
+        graph = self._graphs.get(graph_commit)
+        if graph is None:
+            graph = DocumentGraph.from_documents(
+                self.records(commit=graph_commit, ordered=False, headers_only=True),
+                graph_commit,
+            )
+            self._graphs[graph_commit] = graph
+            while len(self._graphs) > GRAPH_CACHE_SIZE:
+                self._graphs.popitem(last=False)
+        else:
+            self._graphs.move_to_end(graph_commit)
+        return graph
+
+    def _resolve_commit(self, commit: CommitRef | None = None) -> CommitHash:
+        """Resolve a commit ref, defaulting to the current commit (fetched if due)."""
+        if commit is None:
+            self._autofetch()
+            snapshot = self._snapshot
+            # NOTE: the act of fetching above should ensure this is set
+            assert snapshot
+            return snapshot.commit
+        bundle = self._bundle
+        if bundle is not None and commit == bundle.commit:
+            return bundle.commit
+        self._ensure_history(commit)
+        return git_resolve_commit(self.git_repo, commit)
+
+    def _query(
+        self,
+        record_class: type[DocumentRecord],
+        commit: CommitRef | None = None,
+        **filters: Unpack[QueryFilters],
+    ) -> Iterator[DocumentRecord]:
+        query_commit = self._resolve_commit(commit)
+        store = self._store_at(record_class, query_commit)
+        document_type = record_class.document_type.value
+        commit_time = store.commit_time(document_type, query_commit)
+        for row in store.query(document_type, query_commit, **filters):
+            yield self._stored_record(record_class, row, query_commit, commit_time)
+
+    def _search(
+        self,
+        record_class: type[DocumentRecord],
+        terms: str,
+        commit: CommitRef | None = None,
+        limit: int | None = None,
+    ) -> Iterator[SearchResult]:
+        search_commit = self._resolve_commit(commit)
+        store = self._store_at(record_class, search_commit)
+        document_type = record_class.document_type.value
+
+        # Only document versions that haven't been seen before are indexed
+        unindexed = store.unindexed(document_type, search_commit)
+
+        def _unindexed() -> Iterator[tuple[bytes, str, str, str]]:
+            for row in unindexed:
+                meta = json.loads(row.data)
+                text = self._blob_text(row.blob_sha)
+                yield (
+                    row.blob_sha,
+                    meta.get("title") or "",
+                    meta.get("description") or "",
+                    "" if row.body_offset is None else text[row.body_offset :],
+                )
+
+        store.add_search(document_type, _unindexed())
+
+        commit_time = store.commit_time(document_type, search_commit)
+        for row, score, snippet in store.search(
+            document_type, search_commit, terms, limit
+        ):
+            yield SearchResult(
+                self._stored_record(record_class, row, search_commit, commit_time),
+                score,
+                snippet,
+            )
+
+    def _store_at(
+        self, record_class: type[DocumentRecord], commit: CommitHash
+    ) -> DocumentStore:
+        """Return the document store, with the documents at a commit stored."""
+        if self.store is None:
+            raise ValueError("The document store is disabled")
+        if not self.store.has_commit(record_class.document_type.value, commit):
+            self._store_commit(record_class, commit)
+        return self.store
+
+    def _stored_record(
+        self,
+        record_class: type[DocumentRecord],
+        row: StoreRow,
+        commit: CommitHash,
+        commit_time: datetime | None,
+    ) -> DocumentRecord:
+        """Load a record from the store, with its body read from the repo on access."""
+        body = (
+            ""
+            if row.body_offset is None
+            else LazyBody(partial(self._blob_text, row.blob_sha), row.body_offset)
         )
+        return record_class.model_validate_json(row.data).model_copy(
+            update={"body": body, "commit": commit, "commit_time": commit_time}
+        )
+
+    def _store_commit(
+        self, record_class: type[DocumentRecord], commit: CommitHash
+    ) -> int:
+        """Populate the document store with the documents at a commit."""
+        assert self.store is not None
+
+        doc_files = list(self._index_at(commit).values())
+        records = cast(
+            Iterator[DocumentRecord],
+            self._get(
+                record_class,
+                [doc_file.doc_id for doc_file in doc_files],
+                commit=commit,
+                headers_only=True,
+            ),
+        )
+
+        # Ordered, so records line up with the files they came from.  Parsed up front,
+        # as the store is locked while adding.
+        docs = [
+            StoredDocument(
+                doc_file.doc_id,
+                doc_file.blob_sha,
+                record.body.offset if isinstance(record.body, LazyBody) else None,
+                record,
+            )
+            for doc_file, record in zip(doc_files, records, strict=True)
+        ]
+
+        return self.store.add_commit(
+            record_class.document_type.value,
+            commit,
+            self._commit_time(commit),
+            docs,
+        )
+
+    def write_bundle(self, path: Path, commit: CommitRef | None = None) -> int:
+        """Write the parsed documents at a commit (default: current) to a bundle file.
+
+        See `load_bundle()`.  Returns the number of documents written.
+        """
+        bundle_commit = self._resolve_commit(commit)
+        loaded = self._bundle
+        if loaded is not None and bundle_commit == loaded.commit:
+            # Already bundled, and without git to rebuild it from
+            if loaded.path.resolve() != path.resolve():
+                copy_bundle(loaded.path, path)
+            return len(loaded)
+
+        commit_time = self._commit_time(bundle_commit)
+        doc_files = list(self._index_at(bundle_commit).values())
+        tasks = list(self._parse_tasks(doc_files, bundle_commit, commit_time))
+        # Ordered, so documents line up with the raw texts they were parsed from
+        docs = self._parse_many(self.document_class, tasks, ordered=True)
+        return write_bundle(
+            path,
+            self.document_type,
+            bundle_commit,
+            commit_time,
+            (
+                BundleDocument(
+                    doc_file.doc_id,
+                    doc_file.path.name,
+                    doc_file.blob_sha,
+                    task.raw_text,
+                    doc,
+                )
+                for doc_file, task, doc in zip(doc_files, tasks, docs, strict=True)
+            ),
+        )
+
+    def load_bundle(self, path: Path) -> CommitHash:
+        """Read the documents at a bundle's commit from a bundle file, without git.
+
+        The bundle's commit becomes the current commit, and its already parsed documents
+        are loaded from the memory mapped file.  It counts as fetched when it was
+        written, so a stale bundle is replaced by a fetch as `freshness` says: inline
+        unless `background_refresh` (or never, `offline`).  Raises ValueError if the
+        file isn't a bundle of these documents.
+        """
+        bundle = DocumentBundle(path)
+        if bundle.document_type != self.document_type:
+            bundle.close()
+            raise ValueError(f"{path} is a bundle of {bundle.document_type.value}s")
+
+        if self._bundle is not None:
+            self._bundle.close()
+        self._bundle = bundle
+        self._snapshot = Snapshot(bundle.commit, bundle.commit_time)
+        self._last_fetch = bundle.created
+        log.debug(f"Loaded {len(bundle)} documents at {bundle.commit} from {path}")
+        return bundle.commit
+
+    def _blob_text(self, blob_sha: bytes) -> str:
+        """Read a document blob, from the loaded bundle if it's in there.
+
+        Otherwise it's read through the open repo handle, rather than opening the repo.
+        """
+        if self._bundle is not None:
+            text = self._bundle.blob_text(blob_sha)
+            if text is not None:
+                return text
+        return git_blob_text(self.git_repo, blob_sha)
+
+    def _commit_time(self, commit: CommitHash) -> datetime:
+        """Return the time of a commit."""
+        bundle = self._bundle
+        if bundle is not None and commit == bundle.commit:
+            return bundle.commit_time
+        commit_obj = self.git_repo[commit.encode(ENCODING)]
+        assert isinstance(commit_obj, DulwichCommit)
+        return gitstamp_to_dt(commit_obj.commit_time, commit_obj.commit_timezone)
+
+    def _doc_stats(self, commit: CommitHash, incremental: bool = True) -> DocStats:
+        """Count the documents at a commit, from the last counted commit if possible."""
+        index = self._index_at(commit)
+        base = self._last_doc_stats if incremental else None
+
+        if base is None:
+            doc_stats = DocStats(commit)
+            changed = list(index)
+        else:
+            doc_stats = base.copy(commit)
+            base_index = self._index_at(base.commit)
+            for doc_id in base_index.keys() - index.keys():
+                doc_stats.remove(doc_id)
+            changed = [
+                doc_id
+                for doc_id, doc_file in index.items()
+                if doc_id not in base_index
+                or base_index[doc_id].blob_sha != doc_file.blob_sha
+            ]
+            log.debug(
+                f"Updating stats from {base.commit} to {commit}"
+                f" ({len(changed)} changed documents)"
+            )
+
+        if changed:
+            # Ordered, so documents line up with the files they came from
+            docs = self.records(changed, commit=commit, headers_only=True)
+            for doc_id, doc in zip(changed, docs, strict=True):
+                doc_stats.add(doc_id, DocSummary.of(doc))
+
+        self._last_doc_stats = doc_stats
+        return doc_stats
+
+    def export(
+        self,
+        path: Path,
+        *,
+        fmt: str = "parquet",
+        history: bool = False,
+        until_commit: CommitHash | None = None,
+        since: datetime | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        include_body: bool = False,
+    ) -> int:
+        """Export the current documents (or all versions) to a Parquet or Arrow file.
+
+        Documents are streamed out in batches of `batch_size`, as compact records.
+        Bodies are only read if included.  Returns the number of rows written.
+        """
+        docs: Iterable[AnyDocument]
+        if history:
+            docs = (
+                doc
+                for _, doc in self.all_records(
+                    until_commit, since=since, headers_only=not include_body
+                )
+            )
+        else:
+            docs = self.records(headers_only=not include_body)
+        return export_documents(docs, path, fmt, batch_size, include_body)
+
+    def _parse(
+        self,
+        doc_class: type[AnyDocument],
+        doc_id: int,
+        blob_sha: bytes,
+        commit: CommitHash,
+        commit_time: datetime,
+        raw_text: str,
+    ) -> AnyDocument:
+        """Parse a document, through the document cache if enabled."""
+        if self.cache is None:
+            return doc_class.parse(doc_id, commit, commit_time, raw_text)
+        return self.cache.parse(
+            doc_class, doc_id, blob_sha, commit, commit_time, raw_text
+        )
+
+    def _parse_many(
+        self,
+        doc_class: type[AnyDocument],
+        tasks: Iterable[ParseTask],
+        ordered: bool = True,
+    ) -> Iterator[AnyDocument]:
+        """Parse a stream of documents, in the executor if there is one.
+
+        Results are streamed back as they complete.  Unless `ordered`, they may come
+        back in any order.  Cache lookups and stores happen in this process.
+        """
+
+        def _with_body(task: ParseTask, doc: AnyDocument) -> AnyDocument:
+            if task.body is None:
+                return doc
+            return doc.model_copy(update={"body": task.body})
+
+        executor = self.executor
+        if executor is None:
+            for task in tasks:
+                yield _with_body(
+                    task,
+                    self._parse(
+                        doc_class,
+                        task.doc_id,
+                        task.blob_sha,
+                        task.commit,
+                        task.commit_time,
+                        task.raw_text,
+                    ),
+                )
+            return
+
+        # Bound the work in flight so raw texts don't pile up ahead of the consumer
+        window = 4 * (self.workers or os.cpu_count() or 1)
+
+        def _submit(task: ParseTask) -> AnyDocument | Future[AnyDocument]:
+            if self.cache is not None:
+                doc = self.cache.load(
+                    doc_class,
+                    task.doc_id,
+                    task.blob_sha,
+                    task.commit,
+                    task.commit_time,
+                    task.raw_text,
+                )
+                if doc is not None:
+                    return _with_body(task, doc)
+            return executor.submit(
+                parse_document,
+                doc_class,
+                task.doc_id,
+                task.commit,
+                task.commit_time,
+                task.raw_text,
+            )
+
+        def _result(
+            task: ParseTask, pending: AnyDocument | Future[AnyDocument]
+        ) -> AnyDocument:
+            if not isinstance(pending, Future):
+                return pending
+            doc = pending.result()
+            if self.cache is not None:
+                self.cache.store(doc, task.doc_id, task.blob_sha, task.raw_text)
+            return _with_body(task, doc)
+
+        if ordered:
+            queue: deque[tuple[ParseTask, AnyDocument | Future[AnyDocument]]] = deque()
+            for task in tasks:
+                queue.append((task, _submit(task)))
+                while queue and (
+                    len(queue) >= window
+                    or not isinstance(queue[0][1], Future)
+                    or queue[0][1].done()
+                ):
+                    yield _result(*queue.popleft())
+            while queue:
+                yield _result(*queue.popleft())
+            return
+
+        futures: dict[Future[AnyDocument], ParseTask] = {}
+        for task in tasks:
+            pending = _submit(task)
+            if not isinstance(pending, Future):
+                yield pending
+                continue
+            futures[pending] = task
+            if len(futures) >= window:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield _result(futures.pop(fut), fut)
+        for fut in as_completed(list(futures)):
+            yield _result(futures.pop(fut), fut)
 
     @property
     def _should_autofetch(self) -> bool:
@@ -237,101 +1356,263 @@ class EthereumDocs:
 
     def _get(
         self,
-        doc_class: type[EIP1Document],
+        doc_class: type[AnyDocument],
         doc_id: FlexId | None = None,
         *,
         commit: CommitRef | None = None,
-    ) -> Iterator[EIP1Document]:
-        if self._should_autofetch:
-            self.repo_fetch()
+        ordered: bool = True,
+        headers_only: bool = False,
+    ) -> Iterator[AnyDocument]:
+        self._autofetch()
+        # Read from one snapshot, even if a refresh swaps in another meanwhile
+        snapshot = self._snapshot
 
         # NOTE: the act of fetching above should ensure this is set
-        assert self.current_commit
+        assert snapshot
 
         if doc_id is None:
             doc_id = []
         elif not isinstance(doc_id, list):
             doc_id = [doc_id]
 
-        # TODO: Update this for parse() changes
-        for fil in self._get_doc(doc_id, commit):
-            doc_id = doc_id_from_file(fil.name)
-            yield doc_class.parse(
-                doc_id,
-                self.current_commit,
-                self.current_commit_time or datetime.min,
-                fil.read_text(),
+        bundle = self._bundle
+        if commit is None:
+            doc_commit, commit_time = snapshot
+        elif bundle is not None and commit == bundle.commit:
+            doc_commit, commit_time = bundle.commit, bundle.commit_time
+        else:
+            self._ensure_history(commit)
+            # Read the docs straight from the commit's tree, no checkout needed
+            doc_commit = git_resolve_commit(self.git_repo, commit)
+            commit_time = self._commit_time(doc_commit)
+
+        if bundle is not None and doc_commit == bundle.commit:
+            # Already parsed, no git needed
+            for doc_file in self._get_doc(doc_id, doc_commit):
+                doc = bundle.document(doc_class, doc_file.doc_id, headers_only)
+                if doc is not None:
+                    yield doc
+            return
+
+        tasks = self._parse_tasks(
+            self._get_doc(doc_id, doc_commit), doc_commit, commit_time, headers_only
+        )
+        yield from self._parse_many(doc_class, tasks, ordered)
+
+    def _parse_tasks(
+        self,
+        doc_files: Iterable[DocFile],
+        commit: CommitHash,
+        commit_time: datetime,
+        headers_only: bool = False,
+    ) -> Iterator[ParseTask]:
+        """Read document files at a commit from git, to be parsed."""
+        repo = self.git_repo
+        for doc_file in doc_files:
+            blob = repo.get_object(doc_file.blob_sha)
+            assert isinstance(blob, Blob)
+            raw_text, body = blob_document_text(self._blob_text, blob, headers_only)
+            yield ParseTask(
+                doc_file.doc_id,
+                doc_file.blob_sha,
+                commit,
+                commit_time,
+                raw_text,
+                body,
             )
 
     def _all(
-        self, doc_class: type[EIP1Document], until_commit: CommitHash | None = None
-    ) -> Iterator[tuple[DulwichCommit, EIP1Document]]:
-        for entry in git_history(self.repo_path):
-            commit_id = CommitHash(entry.commit.id.decode(ENCODING))
-            if commit_id == until_commit:
-                break
-
-            def _changes():
-                # flatten the changes
-                for change in entry.changes():
-                    if isinstance(change, list):
-                        yield from change
-                    else:
-                        yield change
-
-            for change in _changes():
-                # Not additive, skip
-                if not (change.new and change.new.path):
-                    continue
+        self,
+        doc_class: type[AnyDocument],
+        until_commit: CommitHash | None = None,
+        *,
+        since: datetime | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
+    ) -> Iterator[tuple[DulwichCommit, AnyDocument]]:
+        self._ensure_history(until_commit, since)
+        if self.executor is not None:
+            yield from self._all_parallel(
+                doc_class,
+                until_commit,
+                since=since,
+                ordered=ordered,
+                headers_only=headers_only,
+            )
+            return
 
-                filename = Path(change.new.path.decode(ENCODING)).name
-                doc_id = doc_id_from_file(filename)
-                print("---doc_id:", doc_id)
+        # Only commits touching the docs dir are walked, streamed as they're found
+        repo = self.git_repo
+        for entry in git_history(
+            repo,
+            [self._docs_subdir],
+            until_commit=until_commit,
+            since=since,
+        ):
+            for doc in entry_documents(
+                repo,
+                entry,
+                self._docs_subdir,
+                doc_class,
+                self.cache,
+                headers_only,
+                self._blob_text,
+            ):
+                yield entry.commit, doc
 
-                # Not a design doc, skip
-                if doc_id < 1:
-                    continue
+    def _sync(
+        self, doc_class: type[AnyDocument]
+    ) -> Generator[tuple[DulwichCommit, AnyDocument], None, None]:
+        """Yield document versions since the last synced commit, oldest first.
 
-                # TODO: Handle deleted docs
+        The sync commit is persisted once every document of a commit has been consumed,
+        so a run that's interrupted resumes after the last fully processed commit.
+        Commits may be seen again after a crash, but never skipped.
+        """
+        self._autofetch()
+        snapshot = self._snapshot
 
-                commit_time = gitstamp_to_dt(
-                    entry.commit.commit_time, entry.commit.commit_timezone
-                )
-                try:
-                    git_obj = self.git_repo.get_object(change.new.sha)
-                    if not isinstance(git_obj, Blob):
-                        log.error(
-                            f"Expected git object to be a Blob. Instead got"
-                            f" {type(git_obj)} (file: {filename})"
-                        )
-                        continue
-                    doc_body = git_obj.data.decode(ENCODING)
-                except UnicodeDecodeError as err:
-                    raise err
-
-                try:
-                    yield (
-                        entry.commit,
-                        doc_class.parse(doc_id, commit_id, commit_time, doc_body),
-                    )
-                except ValidationError:
-                    log.exception(
-                        f"Failed to parse document (id: {doc_id})"
-                        f" (commit: {commit_id})"
-                    )
+        # NOTE: the act of fetching above should ensure this is set
+        assert snapshot
+        head = snapshot.commit
+
+        until_commit = self.sync_commit
+        self._ensure_history(until_commit)
+        repo = self.git_repo
+        if (
+            until_commit is not None
+            and until_commit.encode(ENCODING) not in repo.object_store
+        ):
+            log.warning(
+                f"Sync commit {until_commit} not found in repo.  Syncing all history."
+            )
+            until_commit = None
+
+        for entry in git_history(
+            repo,
+            [self._docs_subdir],
+            until_commit=until_commit,
+            reverse=True,
+        ):
+            for doc in entry_documents(
+                repo, entry, self._docs_subdir, doc_class, self.cache
+            ):
+                yield entry.commit, doc
+            self._save_sync_commit(CommitHash(entry.commit.id.decode(ENCODING)))
+
+        self._save_sync_commit(head)
+
+    def _all_parallel(
+        self,
+        doc_class: type[AnyDocument],
+        until_commit: CommitHash | None = None,
+        *,
+        since: datetime | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
+    ) -> Iterator[tuple[DulwichCommit, AnyDocument]]:
+        """Extract history with disjoint commit ranges processed in the executor.
+
+        Listing commits is cheap, diffing their trees and parsing is not.  So commits
+        are walked here and handed out in ranges of `HISTORY_RANGE_SIZE` for workers to
+        diff and parse.  With `ordered`, results come back in walk order, otherwise
+        each range is yielded as soon as it's done.
+        """
+        executor = self.executor
+        assert executor is not None
+
+        cache_path = self.cache.path if self.cache is not None else None
+        window = 2 * (self.workers or os.cpu_count() or 1)
+
+        def _ranges() -> Iterator[list[DulwichCommit]]:
+            commit_range: list[DulwichCommit] = []
+            for commit in git_commit_history(
+                self.git_repo, until_commit=until_commit, since=since
+            ):
+                commit_range.append(commit)
+                if len(commit_range) >= HISTORY_RANGE_SIZE:
+                    yield commit_range
+                    commit_range = []
+            if commit_range:
+                yield commit_range
+
+        def _submit(
+            commit_range: list[DulwichCommit],
+        ) -> Future[list[tuple[int, AnyDocument]]]:
+            return executor.submit(
+                extract_commit_range,
+                self.repo_path,
+                self._docs_subdir,
+                doc_class,
+                [c.id for c in commit_range],
+                cache_path,
+                headers_only,
+            )
+
+        def _results(
+            commit_range: list[DulwichCommit],
+            fut: Future[list[tuple[int, AnyDocument]]],
+        ) -> Iterator[tuple[DulwichCommit, AnyDocument]]:
+            for idx, doc in fut.result():
+                yield commit_range[idx], doc
+
+        if ordered:
+            queue: deque[
+                tuple[list[DulwichCommit], Future[list[tuple[int, AnyDocument]]]]
+            ] = deque()
+            for commit_range in _ranges():
+                queue.append((commit_range, _submit(commit_range)))
+                while queue and (len(queue) >= window or queue[0][1].done()):
+                    yield from _results(*queue.popleft())
+            while queue:
+                yield from _results(*queue.popleft())
+            return
+
+        futures: dict[Future[list[tuple[int, AnyDocument]]], list[DulwichCommit]] = {}
+        for commit_range in _ranges():
+            futures[_submit(commit_range)] = commit_range
+            if len(futures) >= window:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield from _results(futures.pop(fut), fut)
+        for fut in as_completed(list(futures)):
+            yield from _results(futures.pop(fut), fut)
 
 
 class EIPs(EthereumDocs):
     """EIPs ETL machinery"""
 
+    document_type = DocumentType.EIP
+    document_class = EIP
+
     def __init__(
         self,
         freshness: timedelta | None = timedelta(seconds=60),
         repo: str = "https://github.com/ethereum/EIPs.git",
         workdir: Path = Path(DATA_PATH).expanduser().resolve().joinpath("eips"),
+        cache: bool = True,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        store: bool = True,
+        background_refresh: bool = False,
+        depth: int | None = None,
+        sparse: bool = False,
+        offline: bool = False,
     ):
         """Initialize an EIPs ETL processor."""
-        super().__init__(freshness, repo, workdir)
+        super().__init__(
+            freshness,
+            repo,
+            workdir,
+            cache,
+            workers,
+            executor,
+            store,
+            background_refresh,
+            depth,
+            sparse,
+            offline,
+        )
         self.docs_dir = self.repo_path.joinpath("EIPS")
 
     def get(
@@ -339,28 +1620,140 @@ class EIPs(EthereumDocs):
         doc_id: FlexId | None = None,
         *,
         commit: CommitRef | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
     ) -> Iterator[EIP]:
         """Return EIP(s) by ID(s)."""
-        return cast(Iterator[EIP], self._get(EIP, doc_id, commit=commit))
+        return cast(
+            Iterator[EIP],
+            self._get(
+                EIP,
+                doc_id,
+                commit=commit,
+                ordered=ordered,
+                headers_only=headers_only,
+            ),
+        )
+
+    def records(
+        self,
+        doc_id: FlexId | None = None,
+        *,
+        commit: CommitRef | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
+    ) -> Iterator[EIPRecord]:
+        """Return compact, unvalidated EIP(s) by ID(s)."""
+        return cast(
+            Iterator[EIPRecord],
+            self._get(
+                EIPRecord,
+                doc_id,
+                commit=commit,
+                ordered=ordered,
+                headers_only=headers_only,
+            ),
+        )
 
     def all(
-        self, until_commit: CommitHash | None = None
+        self,
+        until_commit: CommitHash | None = None,
+        *,
+        since: datetime | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
     ) -> Iterator[tuple[DulwichCommit, EIP1Document]]:
         """Return all EIP(s) versions by ID(s)."""
-        return self._all(EIP, until_commit)
+        return cast(
+            Iterator[tuple[DulwichCommit, EIP1Document]],
+            self._all(
+                EIP,
+                until_commit,
+                since=since,
+                ordered=ordered,
+                headers_only=headers_only,
+            ),
+        )
+
+    def all_records(
+        self,
+        until_commit: CommitHash | None = None,
+        *,
+        since: datetime | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
+    ) -> Iterator[tuple[DulwichCommit, EIPRecord]]:
+        """Return all compact, unvalidated EIP(s) versions."""
+        return cast(
+            Iterator[tuple[DulwichCommit, EIPRecord]],
+            self._all(
+                EIPRecord,
+                until_commit,
+                since=since,
+                ordered=ordered,
+                headers_only=headers_only,
+            ),
+        )
+
+    def query(
+        self,
+        commit: CommitRef | None = None,
+        **filters: Unpack[QueryFilters],
+    ) -> Iterator[EIPRecord]:
+        """Return compact EIP(s) matching filters, from the document store."""
+        return cast(Iterator[EIPRecord], self._query(EIPRecord, commit, **filters))
+
+    def search(
+        self,
+        terms: str,
+        *,
+        commit: CommitRef | None = None,
+        limit: int | None = 20,
+    ) -> Iterator[SearchResult]:
+        """Full-text search EIP(s), best matches first."""
+        return self._search(EIPRecord, terms, commit, limit)
+
+    def sync(self) -> Generator[tuple[DulwichCommit, EIP1Document], None, None]:
+        """Return EIP(s) versions committed since the last sync, oldest first."""
+        return cast(
+            Generator[tuple[DulwichCommit, EIP1Document], None, None], self._sync(EIP)
+        )
 
 
 class ERCs(EthereumDocs):
     """ERCs ETL machinery"""
 
+    document_type = DocumentType.ERC
+    document_class = ERC
+
     def __init__(
         self,
         freshness: timedelta | None = timedelta(seconds=60),
         repo: str = "https://github.com/ethereum/ERCs.git",
         workdir: Path = Path(DATA_PATH).expanduser().resolve().joinpath("ercs"),
+        cache: bool = True,
+        workers: int | None = None,
+        executor: Executor | None = None,
+        store: bool = True,
+        background_refresh: bool = False,
+        depth: int | None = None,
+        sparse: bool = False,
+        offline: bool = False,
     ):
         """Initialize an ERCs ETL processor."""
-        super().__init__(freshness, repo, workdir)
+        super().__init__(
+            freshness,
+            repo,
+            workdir,
+            cache,
+            workers,
+            executor,
+            store,
+            background_refresh,
+            depth,
+            sparse,
+            offline,
+        )
         self.docs_dir = self.repo_path.joinpath("ERCS")
 
     def get(
@@ -368,12 +1761,101 @@ class ERCs(EthereumDocs):
         doc_id: FlexId | None = None,
         *,
         commit: CommitRef | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
     ) -> Iterator[ERC]:
         """Return ERC(s) by ID(s)."""
-        return cast(Iterator[ERC], self._get(ERC, doc_id, commit=commit))
+        return cast(
+            Iterator[ERC],
+            self._get(
+                ERC,
+                doc_id,
+                commit=commit,
+                ordered=ordered,
+                headers_only=headers_only,
+            ),
+        )
+
+    def records(
+        self,
+        doc_id: FlexId | None = None,
+        *,
+        commit: CommitRef | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
+    ) -> Iterator[ERCRecord]:
+        """Return compact, unvalidated ERC(s) by ID(s)."""
+        return cast(
+            Iterator[ERCRecord],
+            self._get(
+                ERCRecord,
+                doc_id,
+                commit=commit,
+                ordered=ordered,
+                headers_only=headers_only,
+            ),
+        )
 
     def all(
-        self, until_commit: CommitHash | None = None
+        self,
+        until_commit: CommitHash | None = None,
+        *,
+        since: datetime | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
     ) -> Iterator[tuple[DulwichCommit, EIP1Document]]:
-        """Return all EIP(s) versions by ID(s)."""
-        return self._all(ERC, until_commit)
+        """Return all ERC(s) versions by ID(s)."""
+        return cast(
+            Iterator[tuple[DulwichCommit, EIP1Document]],
+            self._all(
+                ERC,
+                until_commit,
+                since=since,
+                ordered=ordered,
+                headers_only=headers_only,
+            ),
+        )
+
+    def all_records(
+        self,
+        until_commit: CommitHash | None = None,
+        *,
+        since: datetime | None = None,
+        ordered: bool = True,
+        headers_only: bool = False,
+    ) -> Iterator[tuple[DulwichCommit, ERCRecord]]:
+        """Return all compact, unvalidated ERC(s) versions."""
+        return cast(
+            Iterator[tuple[DulwichCommit, ERCRecord]],
+            self._all(
+                ERCRecord,
+                until_commit,
+                since=since,
+                ordered=ordered,
+                headers_only=headers_only,
+            ),
+        )
+
+    def query(
+        self,
+        commit: CommitRef | None = None,
+        **filters: Unpack[QueryFilters],
+    ) -> Iterator[ERCRecord]:
+        """Return compact ERC(s) matching filters, from the document store."""
+        return cast(Iterator[ERCRecord], self._query(ERCRecord, commit, **filters))
+
+    def search(
+        self,
+        terms: str,
+        *,
+        commit: CommitRef | None = None,
+        limit: int | None = 20,
+    ) -> Iterator[SearchResult]:
+        """Full-text search ERC(s), best matches first."""
+        return self._search(ERCRecord, terms, commit, limit)
+
+    def sync(self) -> Generator[tuple[DulwichCommit, EIP1Document], None, None]:
+        """Return ERC(s) versions committed since the last sync, oldest first."""
+        return cast(
+            Generator[tuple[DulwichCommit, EIP1Document], None, None], self._sync(ERC)
+        )
@@ -1,11 +1,54 @@
 """Enum definitions for eips package."""
 
 from enum import Enum
+from functools import cache, lru_cache
+from typing import Any, cast
 
 from typing_extensions import Self  # Support addded in 3.11
 
 
-class EIP1Status(str, Enum):
+def _normalize_value(v: str) -> str:
+    """Normalize an enum value for case and whitespace insensitive lookups."""
+    return " ".join(v.split()).casefold()
+
+
+@cache
+def _lookup_tables(cls: type[Enum]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Build exact and normalized value to member maps for an enum, once."""
+    exact = {m.value: m for m in cls}
+    normalized = {_normalize_value(m.value): m for m in cls}
+    return exact, normalized
+
+
+@lru_cache(maxsize=1024)
+def _substring_lookup(cls: type[Enum], v: str) -> Any:
+    """Find the first member whose value contains the given value."""
+    for member in cls:
+        if v in member.value:
+            return member
+    return None
+
+
+class LookupEnum(str, Enum):
+    """A string Enum that can be looked up by value."""
+
+    @classmethod
+    def get_by_val(cls, v: str) -> Self | None:
+        """Get a member by value.
+
+        Exact matches are tried first, then case and whitespace insensitive ones.
+        Only if both miss is the first member containing the value returned.
+        """
+        if not v:
+            return None
+        exact, normalized = _lookup_tables(cls)
+        member = exact.get(v) or normalized.get(_normalize_value(v))
+        if member is None:
+            member = _substring_lookup(cls, v)
+        return cast("Self | None", member)
+
+
+class EIP1Status(LookupEnum):
     """EIP-1 Statuses."""
 
     LIVING = "Living"
@@ -33,40 +76,16 @@ class EIP1Status(str, Enum):
     # EIP-1, but is useful for internal tracking.
     ERROR = "Error"
 
-    @classmethod
-    def get_by_val(cls, v: str) -> Self | None:
-        """Get an EIP1Status by value."""
-        if not v:
-            return None
-        for attr in list(cls):
-            str_attr = str(attr).split(".")[1]
-            attr_v = getattr(cls, str_attr).value
-            if attr_v == v or v in attr_v:
-                return cls[str_attr]
-        return None
-
 
-class EIP1Type(str, Enum):
+class EIP1Type(LookupEnum):
     """EIP-1 Types."""
 
     STANDARDS = "Standards Track"
     INFORMATIONAL = "Informational"
     META = "Meta"
 
-    @classmethod
-    def get_by_val(cls, v: str) -> Self | None:
-        """Get an EIP1Type by value."""
-        if not v:
-            return None
-        for attr in list(cls):
-            str_attr = str(attr).split(".")[1]
-            attr_v = getattr(cls, str_attr).value
-            if attr_v == v or v in attr_v:
-                return cls[str_attr]
-        return None
-
 
-class EIP1Category(str, Enum):
+class EIP1Category(LookupEnum):
     """EIP-1 Categories."""
 
     CORE = "Core"
@@ -74,18 +93,6 @@ class EIP1Category(str, Enum):
     INTERFACE = "Interface"
     ERC = "ERC"
 
-    @classmethod
-    def get_by_val(cls, v: str) -> Self | None:
-        """Get an EIP1Category by value."""
-        if not v:
-            return None
-        for attr in list(cls):
-            str_attr = str(attr).split(".")[1]
-            attr_v = getattr(cls, str_attr).value
-            if attr_v == v or v in attr_v:
-                return cls[str_attr]
-        return None
-
 
 class DocumentType(str, Enum):
     """EIP-1 document types."""
@@ -0,0 +1,165 @@
+"""Columnar export of documents to Parquet or Arrow files.
+
+Documents are streamed into fixed-size batches of columns, so memory use is bounded by
+the batch size no matter how many documents (or versions) are exported.  Writing the
+batches requires the optional `pyarrow` dependency (`pip install eips[export]`).
+"""
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from typing import Any
+
+from eips.logging import get_logger
+from eips.object import AnyDocument
+
+log = get_logger(__name__)
+
+EXPORT_FORMATS = ("parquet", "arrow")
+DEFAULT_BATCH_SIZE = 1024
+
+# Column name and kind, in export order
+COLUMNS: tuple[tuple[str, str], ...] = (
+    ("document_type", "enum"),
+    ("id", "int"),
+    ("title", "str"),
+    ("description", "str"),
+    ("author", "str_list"),
+    ("status", "enum"),
+    ("type", "enum"),
+    ("category", "enum"),
+    ("created", "timestamp"),
+    ("updated", "timestamp"),
+    ("discussions_to", "str"),
+    ("review_period_end", "str"),
+    ("requires", "int_list"),
+    ("replaces", "int_list"),
+    ("superseded_by", "int_list"),
+    ("resolution", "str"),
+    ("commit", "str"),
+    ("commit_time", "timestamp"),
+    ("deleted", "bool"),
+    ("errors", "str_list"),
+)
+BODY_COLUMN = ("body", "str")
+
+
+def to_timestamp(value: datetime | None) -> int | None:
+    """Convert a datetime to integer seconds since the epoch, naive ones being UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def _column_value(kind: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if kind == "enum":
+        return value.value if isinstance(value, Enum) else str(value)
+    if kind == "timestamp":
+        return to_timestamp(value)
+    if kind == "str":
+        return str(value)
+    return value
+
+
+def export_columns(include_body: bool = False) -> tuple[tuple[str, str], ...]:
+    """Return the exported (column, kind) pairs."""
+    return (*COLUMNS, BODY_COLUMN) if include_body else COLUMNS
+
+
+def iter_batches(
+    docs: Iterable[AnyDocument],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    include_body: bool = False,
+) -> Iterator[dict[str, list[Any]]]:
+    """Stream documents into batches of at most `batch_size` rows, as columns.
+
+    Enums are exported as their values, and datetimes as seconds since the epoch.
+    """
+    if batch_size < 1:
+        raise ValueError("Batch size must be positive")
+
+    columns = export_columns(include_body)
+    batch: dict[str, list[Any]] = {name: [] for name, _ in columns}
+    rows = 0
+
+    for doc in docs:
+        for name, kind in columns:
+            value = doc.document_type if name == "document_type" else getattr(doc, name)
+            batch[name].append(_column_value(kind, value))
+        rows += 1
+
+        if rows >= batch_size:
+            yield batch
+            batch = {name: [] for name, _ in columns}
+            rows = 0
+
+    if rows:
+        yield batch
+
+
+def _arrow_schema(include_body: bool = False) -> Any:
+    """Build the Arrow schema of exported documents."""
+    import pyarrow as pa
+
+    types = {
+        # Enums are dictionary encoded, as they have very few distinct values
+        "enum": pa.dictionary(pa.int8(), pa.string()),
+        "int": pa.int64(),
+        "str": pa.string(),
+        "bool": pa.bool_(),
+        # int64 seconds since the epoch
+        "timestamp": pa.timestamp("s", tz="UTC"),
+        "int_list": pa.list_(pa.int64()),
+        "str_list": pa.list_(pa.string()),
+    }
+    return pa.schema(
+        [pa.field(name, types[kind]) for name, kind in export_columns(include_body)]
+    )
+
+
+def export_documents(
+    docs: Iterable[AnyDocument],
+    path: Path,
+    fmt: str = "parquet",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    include_body: bool = False,
+) -> int:
+    """Write documents to a Parquet or Arrow IPC file, a batch at a time.
+
+    Returns the number of rows written.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format {fmt}")
+
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc as pa_ipc
+        import pyarrow.parquet as pa_parquet
+    except ImportError as err:
+        raise ImportError(
+            "Exporting requires pyarrow.  Install it with `pip install eips[export]`."
+        ) from err
+
+    schema = _arrow_schema(include_body)
+    writer: Any = (
+        pa_parquet.ParquetWriter(str(path), schema)
+        if fmt == "parquet"
+        else pa_ipc.new_file(str(path), schema)
+    )
+
+    rows = 0
+    try:
+        for batch in iter_batches(docs, batch_size, include_body):
+            record_batch = pa.RecordBatch.from_pydict(batch, schema=schema)
+            writer.write_batch(record_batch)
+            rows += record_batch.num_rows
+            log.debug(f"Exported {rows} documents to {path}")
+    finally:
+        writer.close()
+
+    return rows
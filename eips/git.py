@@ -1,44 +1,286 @@
 """Git utilities."""
 
-from collections.abc import Sequence
+import shutil
+import stat
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
 from pathlib import Path
+from threading import Lock
+from typing import Any, TypeAlias
 
+from dulwich.client import (
+    GitClient,
+    LocalGitClient,
+    SubprocessGitClient,
+    get_transport_and_path,
+)
+from dulwich.object_store import tree_lookup_path
+from dulwich.objects import Blob, Tag, Tree
 from dulwich.objects import Commit as DulwichCommit
 from dulwich.porcelain import clone, pull
 from dulwich.repo import Repo
 from dulwich.walk import WalkEntry
 
+from eips.logging import get_logger
 from eips.object import CommitHash
+from eips.util import file_lock
+
+log = get_logger(__name__)
 
 ENCODING = "utf8"
 HEAD = b"HEAD"
 
+# Depth that fetches all history, like `git fetch --unshallow`
+UNSHALLOW_DEPTH = 2**31 - 1
+
+# Either a path to a repo, or an already open repo handle to reuse
+RepoLike: TypeAlias = Path | Repo
+
+# Fetches in flight by repo path, and how many callers are waiting on each
+_fetches: dict[Path, Future[CommitHash]] = {}
+_fetch_waiters: Counter[Path] = Counter()
+_fetches_lock = Lock()
+
 
 def is_dir_repo(repo_path: Path) -> bool:
     """Is the given dir a Git repo?"""
     return repo_path.joinpath(".git").is_dir()
 
 
-def git_rev(repo_path: Path) -> CommitHash:
+@contextmanager
+def open_repo(repo: RepoLike) -> Iterator[Repo]:
+    """Yield a Repo for the given path or handle.
+
+    Handles passed in are reused as-is and left open.  Repos opened from a path are
+    closed on exit.
+    """
+    if isinstance(repo, Repo):
+        yield repo
+        return
+
+    opened = Repo(str(repo))
+    try:
+        yield opened
+    finally:
+        opened.close()
+
+
+def git_rev(repo: RepoLike) -> CommitHash:
     """Get the current revision/commit for the repo."""
-    return CommitHash(Repo(str(repo_path)).refs[HEAD].decode(ENCODING))
+    with open_repo(repo) as r:
+        return CommitHash(r.refs[HEAD].decode(ENCODING))
+
+
+def git_resolve_commit(repo: RepoLike, ref: str) -> CommitHash:
+    """Resolve a commit hash (full or abbreviated), branch, tag or ref to a commit.
+
+    Raises ValueError if the ref can't be resolved to exactly one commit.
+    """
+    ref_b = ref.encode(ENCODING)
+
+    with open_repo(repo) as r:
+        sha: bytes | None = None
+
+        for candidate in (
+            ref_b,
+            b"refs/heads/" + ref_b,
+            b"refs/tags/" + ref_b,
+            b"refs/remotes/origin/" + ref_b,
+        ):
+            if candidate in r.refs:
+                sha = r.refs[candidate]
+                break
+
+        if sha is None and len(ref_b) == 40 and ref_b in r.object_store:
+            sha = ref_b
+        elif sha is None and len(ref_b) >= 4:
+            matches = [
+                s
+                for s in r.object_store.iter_prefix(ref_b)
+                if isinstance(r[s], DulwichCommit | Tag)
+            ]
+            if len(matches) > 1:
+                raise ValueError(f"Ambiguous commit ref {ref}")
+            elif matches:
+                sha = matches[0]
+
+        if sha is None:
+            raise ValueError(f"Unknown commit ref {ref}")
+
+        obj = r[sha]
+        # Peel annotated tags
+        while isinstance(obj, Tag):
+            obj = r[obj.object[1]]
 
+        if not isinstance(obj, DulwichCommit):
+            raise ValueError(f"{ref} is not a commit")
 
-def git_history(repo_path: Path, sub_paths: Sequence[str] = list()) -> list[WalkEntry]:
-    """Get the commit history for the repo."""
-    return [c for c in Repo(str(repo_path)).get_walker(paths=sub_paths)]
+        return CommitHash(obj.id.decode(ENCODING))
+
+
+def git_tree_blobs(
+    repo: RepoLike, commit: CommitHash, sub_path: str
+) -> Iterator[tuple[str, bytes]]:
+    """Yield (filename, blob SHA) for the files in a directory of a commit's tree.
+
+    Nothing is yielded if the directory doesn't exist at that commit.
+    """
+    with open_repo(repo) as r:
+        commit_obj = r[commit.encode(ENCODING)]
+        if not isinstance(commit_obj, DulwichCommit):
+            raise ValueError(f"{commit} is not a commit")
+
+        try:
+            _, tree_sha = tree_lookup_path(
+                r.object_store.__getitem__, commit_obj.tree, sub_path.encode(ENCODING)
+            )
+        except KeyError:
+            return
+
+        tree = r[tree_sha]
+        if not isinstance(tree, Tree):
+            return
+
+        for entry in tree.iteritems():
+            if stat.S_ISREG(entry.mode):
+                yield entry.path.decode(ENCODING), entry.sha
+
+
+def git_blob_text(repo: RepoLike, blob_sha: bytes) -> str:
+    """Read and decode a blob from the object store."""
+    with open_repo(repo) as r:
+        blob = r.get_object(blob_sha)
+        if not isinstance(blob, Blob):
+            raise ValueError(f"{blob_sha.decode(ENCODING)} is not a blob")
+        return blob.data.decode(ENCODING)
+
+
+def _walker_kwargs(
+    sub_paths: Sequence[str],
+    until_commit: CommitHash | None,
+    since: datetime | None,
+    until: datetime | None,
+    reverse: bool,
+) -> dict[str, Any]:
+    """Translate history bounds into dulwich Walker arguments."""
+    kwargs: dict[str, Any] = {"reverse": reverse}
+    if sub_paths:
+        kwargs["paths"] = [p.encode(ENCODING) for p in sub_paths]
+    if until_commit is not None:
+        # Excluding the commit also prunes all of its ancestors from the walk
+        kwargs["exclude"] = [until_commit.encode(ENCODING)]
+    if since is not None:
+        kwargs["since"] = int(since.timestamp())
+    if until is not None:
+        kwargs["until"] = int(until.timestamp())
+    return kwargs
+
+
+def git_history(
+    repo: RepoLike,
+    sub_paths: Sequence[str] = list(),
+    *,
+    until_commit: CommitHash | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    reverse: bool = False,
+) -> Iterator[WalkEntry]:
+    """Lazily walk the commit history for the repo, newest first.
+
+    Commits are yielded as the walker reaches them, so memory use stays flat regardless
+    of history length.  The walk stops before `until_commit` and is bound by the
+    `since`/`until` commit times.  Only commits touching `sub_paths` are yielded.
+
+    With `reverse`, commits are yielded oldest first.  This has to walk all of the
+    (bounded) history before yielding anything.
+    """
+    with open_repo(repo) as r:
+        yield from r.get_walker(
+            **_walker_kwargs(sub_paths, until_commit, since, until, reverse)
+        )
 
 
 def git_commit_history(
-    repo_path: Path, sub_paths: Sequence[str] = list()
-) -> list[DulwichCommit]:
-    """Get the commit history for the repo."""
-    return [c.commit for c in Repo(str(repo_path)).get_walker(paths=sub_paths)]
+    repo: RepoLike,
+    sub_paths: Sequence[str] = list(),
+    *,
+    until_commit: CommitHash | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+) -> Iterator[DulwichCommit]:
+    """Lazily walk the commits for the repo, newest first.
+
+    See `git_history` for the meaning of the bounds.
+    """
+    for entry in git_history(
+        repo, sub_paths, until_commit=until_commit, since=since, until=until
+    ):
+        yield entry.commit
 
 
-def ensure_repo(repo_path: Path, repo_uri: str) -> bool:
+def git_client(repo_uri: str, shallow: bool = False) -> tuple[GitClient, str]:
+    """Return a client for a repo URI, and the path to use with it.
+
+    Dulwich's client for local repos can't make or update shallow clones, so those go
+    through `git-upload-pack`.  Raises FileNotFoundError if it isn't installed.
+    """
+    client, path = get_transport_and_path(repo_uri)
+    if shallow and isinstance(client, LocalGitClient):
+        if shutil.which("git-upload-pack") is None:
+            raise FileNotFoundError(
+                "Shallow clones of local repos need git-upload-pack installed"
+            )
+        client = SubprocessGitClient()
+    return client, path
+
+
+def _want_head(repo: Repo) -> Callable[..., list[bytes]]:
+    """Return a `determine_wants` for the remote HEAD, unless already present."""
+
+    def _determine_wants(
+        refs: dict[bytes, bytes], depth: int | None = None
+    ) -> list[bytes]:
+        return [refs[HEAD]] if refs[HEAD] not in repo.object_store else []
+
+    return _determine_wants
+
+
+def git_checkout_paths(repo: Repo, paths: Sequence[str]) -> None:
+    """Write the files in some directories of HEAD to the working tree, and only those.
+
+    Files of those directories no longer at HEAD are removed.  No index is kept.
+    """
+    commit = git_rev(repo)
+    root = Path(repo.path)
+    for sub_path in paths:
+        dir_path = root.joinpath(sub_path)
+        dir_path.mkdir(mode=0o750, parents=True, exist_ok=True)
+        blobs = dict(git_tree_blobs(repo, commit, sub_path))
+        for fpath in dir_path.iterdir():
+            if fpath.is_file() and fpath.name not in blobs:
+                fpath.unlink()
+        for fname, blob_sha in blobs.items():
+            blob = repo.get_object(blob_sha)
+            assert isinstance(blob, Blob)
+            dir_path.joinpath(fname).write_bytes(blob.data)
+
+
+def ensure_repo(
+    repo_path: Path,
+    repo_uri: str,
+    depth: int | None = None,
+    paths: Sequence[str] | None = None,
+) -> bool:
     """Make sure a repo has been cloned from uri to path.
 
+    With `depth`, only that many commits of history are cloned.  With `paths`, only
+    those directories are checked out (see `git_checkout_paths`).
+
     Returns if a repo has been newly cloned
     """
     if is_dir_repo(repo_path):
@@ -46,7 +288,15 @@ def ensure_repo(repo_path: Path, repo_uri: str) -> bool:
     else:
         repo_path.mkdir(mode=0o750, parents=True)
 
-    clone(repo_uri, target=repo_path)
+    if depth is None and paths is None:
+        clone(repo_uri, target=repo_path)
+    else:
+        client, path = git_client(repo_uri, depth is not None)
+        with client.clone(
+            path, str(repo_path), mkdir=False, checkout=paths is None, depth=depth
+        ) as repo:
+            if paths is not None:
+                git_checkout_paths(repo, paths)
 
     if not is_dir_repo(repo_path):
         raise FileNotFoundError(f"Cloned repo not found at {repo_path}")
@@ -54,11 +304,142 @@ def ensure_repo(repo_path: Path, repo_uri: str) -> bool:
     return True
 
 
-def ensure_repo_updated(repo_path: Path, repo_uri: str) -> CommitHash:
-    """Ensure the given git repo exists and is up to date."""
-    cloned = ensure_repo(repo_path, repo_uri)
+def update_repo(
+    repo_path: Path, repo_uri: str, paths: Sequence[str] | None = None
+) -> None:
+    """Move a (possibly shallow) repo to the remote HEAD.
+
+    Shallow repos are fetched back to their shallow commits, so history fetched by
+    `deepen_repo` is kept.  With `paths`, only those directories are checked out.
+    """
+    with Repo(str(repo_path)) as repo:
+        client, path = git_client(repo_uri, bool(repo.get_shallow()))
+        result = client.fetch(path, repo, determine_wants=_want_head(repo))
+        repo.refs[HEAD] = result.refs[HEAD]
+        if paths is None:
+            head = repo[result.refs[HEAD]]
+            assert isinstance(head, DulwichCommit)
+            repo.reset_index(head.tree)
+        else:
+            git_checkout_paths(repo, paths)
+
+
+def deepen_repo(repo_path: Path, repo_uri: str, depth: int | None = None) -> bool:
+    """Fetch `depth` commits of history from the remote HEAD, or all of it.
+
+    Returns whether the repo is still shallow.
+    """
+    with Repo(str(repo_path)) as repo:
+        if not repo.get_shallow():
+            return False
+        client, path = git_client(repo_uri, True)
+        client.fetch(
+            path,
+            repo,
+            determine_wants=lambda refs, depth=None: [refs[HEAD]],
+            depth=depth or UNSHALLOW_DEPTH,
+        )
+        return bool(repo.get_shallow())
+
+
+def ensure_repo_updated(
+    repo_path: Path,
+    repo_uri: str,
+    depth: int | None = None,
+    paths: Sequence[str] | None = None,
+) -> CommitHash:
+    """Ensure the given git repo exists and is up to date.
+
+    See `ensure_repo` for `depth` and `paths`.  They only apply to new clones, except
+    that a repo with only `paths` checked out stays that way.
+    """
+    cloned = ensure_repo(repo_path, repo_uri, depth, paths)
 
     if not cloned:
-        pull(repo_path)
+        with Repo(str(repo_path)) as repo:
+            shallow = bool(repo.get_shallow())
+        if paths is None and not shallow:
+            pull(repo_path)
+        else:
+            update_repo(repo_path, repo_uri, paths)
 
     return git_rev(repo_path)
+
+
+def _locked_fetch(
+    repo_path: Path, lock_path: Path, update: Callable[[], CommitHash]
+) -> CommitHash:
+    """Update a repo holding a file lock, unless another process just did.
+
+    Only if HEAD moved while waiting for the lock is the holder taken to have fetched.
+    It may have failed, or held the lock for something else, e.g. deepening.
+    """
+    start = time.perf_counter()
+    head = git_rev(repo_path) if is_dir_repo(repo_path) else None
+    with file_lock(lock_path) as waited:
+        if waited and is_dir_repo(repo_path):
+            fetched = git_rev(repo_path)
+            log.debug(
+                f"Waited {time.perf_counter() - start:.2f}s for another process"
+                f" holding {lock_path}"
+            )
+            if fetched != head:
+                # Use what the holder fetched instead of fetching again
+                return fetched
+        return update()
+
+
+def fetch_repo(
+    repo_path: Path,
+    repo_uri: str,
+    lock_path: Path | None = None,
+    depth: int | None = None,
+    paths: Sequence[str] | None = None,
+) -> CommitHash:
+    """Ensure a repo is cloned and up to date, one fetch at a time.
+
+    Concurrent calls for the same repo within a process share a single fetch.  With
+    `lock_path`, the fetch holds an advisory lock on that file, and a process that has
+    to wait for the lock uses what the holder fetched, if it moved HEAD.  See
+    `ensure_repo_updated` for `depth` and `paths`.
+    """
+    key = repo_path.resolve()
+    with _fetches_lock:
+        fetch = _fetches.get(key)
+        leader = fetch is None
+        if fetch is None:
+            fetch = _fetches[key] = Future()
+        else:
+            _fetch_waiters[key] += 1
+
+    start = time.perf_counter()
+    if not leader:
+        try:
+            return fetch.result()
+        finally:
+            log.debug(
+                f"Waited {time.perf_counter() - start:.2f}s for the fetch of"
+                f" {repo_path} in progress"
+            )
+
+    try:
+        update = partial(ensure_repo_updated, repo_path, repo_uri, depth, paths)
+        if lock_path is None:
+            commit = update()
+        else:
+            commit = _locked_fetch(repo_path, lock_path, update)
+    except BaseException as err:
+        fetch.set_exception(err)
+        raise
+    else:
+        fetch.set_result(commit)
+    finally:
+        with _fetches_lock:
+            del _fetches[key]
+            waiters = _fetch_waiters.pop(key, 0)
+
+    log.debug(
+        f"Fetched {repo_uri} in {time.perf_counter() - start:.2f}s"
+        f" ({waiters} waiting callers)"
+    )
+    return commit
@@ -0,0 +1,260 @@
+"""Dependency graph of documents, over their requires/replaces/superseded-by headers.
+
+Edges are kept in compressed adjacency arrays indexed by node, so following them is a
+slice of a flat array instead of a dict lookup and a list per document.  Nodes number
+the IDs named at a commit densely and in order, as header values can be any number.
+"""
+
+import heapq
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+
+from eips.object import AnyDocument, CommitHash, DocumentRecord
+
+RELATIONS = ("requires", "replaces", "superseded_by")
+
+
+class CycleError(ValueError):
+    """Documents depend on each other, so they can't be ordered."""
+
+    def __init__(self, cycle: list[int]):
+        """Initialize with the documents in a cycle."""
+        self.cycle = cycle
+        super().__init__(
+            f"Dependency cycle between documents {', '.join(map(str, cycle))}"
+        )
+
+
+class Adjacency:
+    """The edges of one relation, as compressed sparse rows.
+
+    The targets of `node` are `targets[offsets[node]:offsets[node + 1]]`, sorted.
+    """
+
+    __slots__ = ("offsets", "targets")
+
+    def __init__(self, size: int, edges: Mapping[int, Iterable[int]]):
+        """Pack edges between nodes below `size`."""
+        self.offsets = array("I", bytes(4 * (size + 1)))
+        self.targets = array("I")
+        for node in range(size):
+            self.targets.extend(sorted(set(edges.get(node, ()))))
+            self.offsets[node + 1] = len(self.targets)
+
+    def __getitem__(self, node: int) -> array:
+        """Return the targets of a node."""
+        if node < 0 or node >= len(self.offsets) - 1:
+            return array("I")
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def reversed(self) -> "Adjacency":
+        """Return the adjacency with every edge reversed."""
+        edges: dict[int, list[int]] = {}
+        for node in range(len(self.offsets) - 1):
+            for target in self[node]:
+                edges.setdefault(target, []).append(node)
+        return Adjacency(len(self.offsets) - 1, edges)
+
+
+class DocumentGraph:
+    """Relations between the documents at a commit.
+
+    Edges point from a document to the documents named in its headers, e.g. from
+    EIP-1559 to EIP-2718 for `requires`.  Documents may name IDs with no document (at
+    least not in this repo), which are kept as nodes without edges of their own.
+    """
+
+    def __init__(
+        self,
+        ids: Iterable[int],
+        edges: Mapping[str, Mapping[int, Iterable[int]]],
+        commit: CommitHash | None = None,
+    ):
+        """Initialize from document IDs and their edges, per relation."""
+        self.commit = commit
+        self.ids = tuple(sorted(set(ids)))
+        # Node to ID, and back
+        self._nodes = tuple(
+            sorted(
+                {
+                    *self.ids,
+                    *(
+                        doc_id
+                        for relation in edges.values()
+                        for source, targets in relation.items()
+                        for doc_id in (source, *targets)
+                    ),
+                }
+            )
+        )
+        self._node_of = {doc_id: node for node, doc_id in enumerate(self._nodes)}
+        self.size = len(self._nodes)
+        self._present = bytearray(self.size)
+        for doc_id in self.ids:
+            self._present[self._node_of[doc_id]] = 1
+        self._forward = {
+            relation: Adjacency(
+                self.size,
+                {
+                    self._node_of[source]: [self._node_of[t] for t in targets]
+                    for source, targets in edges.get(relation, {}).items()
+                },
+            )
+            for relation in RELATIONS
+        }
+        # Reverse edges are built on first use
+        self._reverse: dict[str, Adjacency] = {}
+
+    @classmethod
+    def from_documents(
+        cls,
+        docs: Iterable[AnyDocument | DocumentRecord],
+        commit: CommitHash | None = None,
+    ) -> "DocumentGraph":
+        """Build the graph of documents from their headers."""
+        ids: list[int] = []
+        edges: dict[str, dict[int, list[int]]] = {rel: {} for rel in RELATIONS}
+        for doc in docs:
+            ids.append(doc.id)
+            for relation in RELATIONS:
+                targets = getattr(doc, relation)
+                if targets:
+                    edges[relation].setdefault(doc.id, []).extend(targets)
+        return cls(ids, edges, commit)
+
+    def __contains__(self, doc_id: object) -> bool:
+        """Return whether there's a document with an ID."""
+        node = self._node_of.get(doc_id) if isinstance(doc_id, int) else None
+        return node is not None and bool(self._present[node])
+
+    def __len__(self) -> int:
+        """Return the number of documents."""
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate over document IDs."""
+        return iter(self.ids)
+
+    def _adjacency(self, relation: str, reverse: bool) -> Adjacency:
+        if relation not in self._forward:
+            raise ValueError(f"Unknown relation {relation}")
+        if not reverse:
+            return self._forward[relation]
+        if relation not in self._reverse:
+            self._reverse[relation] = self._forward[relation].reversed()
+        return self._reverse[relation]
+
+    def edges(
+        self, doc_id: int, relation: str = "requires", *, reverse: bool = False
+    ) -> list[int]:
+        """Return the IDs a document names directly (or, reversed, that name it)."""
+        adjacency = self._adjacency(relation, reverse)
+        node = self._node_of.get(doc_id)
+        if node is None:
+            return []
+        return [self._nodes[target] for target in adjacency[node]]
+
+    def closure(
+        self, doc_id: int, relation: str = "requires", *, reverse: bool = False
+    ) -> list[int]:
+        """Return the IDs a document transitively names (or, reversed, that name it).
+
+        The document itself is only included if it's part of a cycle.
+        """
+        adjacency = self._adjacency(relation, reverse)
+        node = self._node_of.get(doc_id)
+        if node is None:
+            return []
+        seen = bytearray(self.size)
+        stack = list(adjacency[node])
+        while stack:
+            node = stack.pop()
+            if seen[node]:
+                continue
+            seen[node] = 1
+            stack.extend(target for target in adjacency[node] if not seen[target])
+        return [self._nodes[node] for node in range(self.size) if seen[node]]
+
+    def cycles(self, relation: str = "requires") -> list[list[int]]:
+        """Return groups of documents that (transitively) name each other.
+
+        These are the strongly connected components with more than one document, or a
+        document naming itself.
+        """
+        adjacency = self._adjacency(relation, False)
+        # Iterative Tarjan's, so deep chains don't hit the recursion limit
+        index = [-1] * self.size
+        low = [0] * self.size
+        on_stack = bytearray(self.size)
+        stack: list[int] = []
+        cycles: list[list[int]] = []
+        counter = 0
+
+        for root in range(self.size):
+            if index[root] >= 0:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, pos = work.pop()
+                if pos == 0:
+                    index[node] = low[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = 1
+                targets = adjacency[node]
+                if pos < len(targets):
+                    work.append((node, pos + 1))
+                    target = targets[pos]
+                    if index[target] < 0:
+                        work.append((target, 0))
+                    elif on_stack[target]:
+                        low[node] = min(low[node], index[target])
+                    continue
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = 0
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in targets:
+                        cycles.append(sorted(self._nodes[m] for m in component))
+
+        return sorted(cycles)
+
+    def topological_order(self, relation: str = "requires") -> list[int]:
+        """Return document IDs with every document after the documents it names.
+
+        Ties are broken by lowest ID first.  IDs with no document are left out.  Raises
+        CycleError if documents name each other.
+        """
+        adjacency = self._adjacency(relation, False)
+        reverse = self._adjacency(relation, True)
+        present = self._present
+        pending = {
+            node: sum(1 for target in adjacency[node] if present[target])
+            for node in (self._node_of[doc_id] for doc_id in self.ids)
+        }
+        # Nodes are in ID order, so the lowest node is the lowest ID
+        ready = [node for node, count in pending.items() if count == 0]
+        heapq.heapify(ready)
+        order: list[int] = []
+
+        while ready:
+            node = heapq.heappop(ready)
+            order.append(self._nodes[node])
+            for source in reverse[node]:
+                if not present[source]:
+                    continue
+                pending[source] -= 1
+                if pending[source] == 0:
+                    heapq.heappush(ready, source)
+
+        if len(order) < len(self.ids):
+            raise CycleError(self.cycles(relation)[0])
+
+        return order
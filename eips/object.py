@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import dataclasses
+import json
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, TypeAlias
+from typing import Any, ClassVar, TypeAlias
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer
 from typing_extensions import Self  # Support addded in 3.11
 
 from eips.enum import DocumentType, EIP1Category, EIP1Status, EIP1Type
@@ -26,6 +30,83 @@ class CommitHash(str):
         return f"CommitHash(value={self.__str__()!r})"
 
 
+class LazyBody:
+    """A document body, read from its source the first time it's accessed.
+
+    `load` returns the full raw document text, and the body starts at `offset`.  It
+    compares equal to, and otherwise acts like, the body string for common use.
+    """
+
+    __slots__ = ("_load", "_offset", "_text")
+
+    def __init__(self, load: Callable[[], str], offset: int = 0):
+        """Initialize a lazy body."""
+        self._load = load
+        self._offset = offset
+        self._text: str | None = None
+
+    @property
+    def offset(self) -> int:
+        """Where the body starts in the loaded text."""
+        return self._offset
+
+    @property
+    def loaded(self) -> bool:
+        """Has the body been read yet?"""
+        return self._text is not None
+
+    @property
+    def text(self) -> str:
+        """The body text, read on first access."""
+        if self._text is None:
+            self._text = self._load()[self._offset :]
+        return self._text
+
+    def __getattr__(self, name: str) -> Any:
+        """Defer anything else (str methods) to the body string."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.text, name)
+
+    def __str__(self) -> str:
+        """Return the body text."""
+        return self.text
+
+    def __repr__(self) -> str:
+        """Return a string representation of the LazyBody."""
+        return f"LazyBody(loaded={self.loaded})"
+
+    def __len__(self) -> int:
+        """Return the length of the body."""
+        return len(self.text)
+
+    def __bool__(self) -> bool:
+        """Is the body non-empty?"""
+        return bool(self.text)
+
+    def __contains__(self, value: str) -> bool:
+        """Is the given string in the body?"""
+        return value in self.text
+
+    def __getitem__(self, key: int | slice) -> str:
+        """Index or slice the body."""
+        return self.text[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the body characters."""
+        return iter(self.text)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare equal to the body string (or another LazyBody)."""
+        if isinstance(other, LazyBody):
+            return self.text == other.text
+        return self.text == other
+
+    def __hash__(self) -> int:
+        """Hash as the body string."""
+        return hash(self.text)
+
+
 CommitRef: TypeAlias = CommitHash | str
 FlexId: TypeAlias = int | list[int]
 
@@ -40,7 +121,8 @@ class EIP1Document(BaseModel):
     id: int
     # EIP-1 says "should" in one part and "must" when describing order for description
     description: str = ""
-    body: str
+    # A LazyBody when only the headers were read
+    body: str | LazyBody
     status: EIP1Status
 
     # Optionals
@@ -58,9 +140,15 @@ class EIP1Document(BaseModel):
     resolution: str | None = None
     commit: CommitHash | None = None
     commit_time: datetime | None = None
+    # Set on the last version of a document, as of the commit that deleted it
+    deleted: bool = False
 
     errors: list[str] = Field(default_factory=list)
 
+    @field_serializer("body", when_used="json")
+    def _serialize_body(self, body: str | LazyBody) -> str:
+        return str(body)
+
     @property
     def headers(self) -> dict[str, Any]:
         """Return all headers as a dictionary."""
@@ -131,11 +219,193 @@ class ERC(EIP1Document):
     document_type: DocumentType = DocumentType.ERC
 
 
+def _json_default(value: Any) -> str:
+    """Serialize what JSON can't, as pydantic does (UTC times end in Z)."""
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        return f"{text[:-6]}Z" if text.endswith("+00:00") else text
+    return str(value)
+
+
+@dataclass(slots=True)
+class DocumentRecord:
+    """A compact, unvalidated Ethereum design document for bulk processing.
+
+    Records are built straight from the parsed headers, skipping pydantic validation,
+    and use slots instead of a model instance.  They have the same fields as
+    `EIP1Document`, mirror the parts of its API used by the package, and can be upgraded
+    to a validated document with `to_document()`.
+    """
+
+    document_type: ClassVar[DocumentType]
+    document_class: ClassVar[type[EIP1Document]]
+
+    id: int
+    body: str | LazyBody
+    status: EIP1Status | None = None
+    description: str = ""
+    created: datetime | None = None
+    title: str | None = None
+    author: list[str] | None = None
+    type: EIP1Type | None = None
+    updated: datetime | None = None
+    discussions_to: str | None = None
+    review_period_end: str | None = None
+    category: EIP1Category | None = None
+    requires: list[int] | None = None
+    replaces: list[int] | None = None
+    superseded_by: list[int] | None = None
+    resolution: str | None = None
+    commit: CommitHash | None = None
+    commit_time: datetime | None = None
+    deleted: bool = False
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def headers(self) -> dict[str, Any]:
+        """Return all headers as a dictionary."""
+        return self.model_dump(exclude={"body"})
+
+    @classmethod
+    def parse(
+        cls, doc_id: int, commit: CommitHash, commit_time: datetime, raw_text: str
+    ) -> Self:
+        """Parse a raw EIP1 document text into a record, without validation."""
+        errors: list[str] = list()
+
+        try:
+            headers, body, parse_errors = pluck_headers(raw_text)
+
+            if parse_errors:
+                errors.extend(parse_errors)
+        except ParseError as err:
+            headers = {"status": EIP1Status.ERROR}
+            body = ""
+            errors.append(str(err))
+
+        values: dict[str, Any] = {
+            k: v for k, v in headers.items() if k in RECORD_HEADER_FIELDS
+        }
+        # NOTE: the id header may override the ID from the filename
+        header_id = values.get("id")
+        values["id"] = (
+            int(header_id)
+            if isinstance(header_id, str) and header_id.strip().isdigit()
+            else doc_id
+        )
+
+        return cls(
+            **values,
+            body=body,
+            commit=commit,
+            commit_time=commit_time,
+            errors=errors,
+        )
+
+    @classmethod
+    def model_validate_json(cls, data: str) -> Self:
+        """Load a record from `EIP1Document` (or record) JSON, without validation."""
+        values = {k: v for k, v in json.loads(data).items() if k in RECORD_FIELDS}
+
+        for key, enum_class in (
+            ("status", EIP1Status),
+            ("type", EIP1Type),
+            ("category", EIP1Category),
+        ):
+            if values.get(key) is not None:
+                values[key] = enum_class(values[key])
+        for key in ("created", "updated", "commit_time"):
+            if values.get(key) is not None:
+                values[key] = datetime.fromisoformat(values[key].replace("Z", "+00:00"))
+        if values.get("commit") is not None:
+            values["commit"] = CommitHash(values["commit"])
+
+        return cls(**values)
+
+    def model_copy(self, update: dict[str, Any] | None = None) -> Self:
+        """Return a copy of the record with the given fields updated."""
+        return dataclasses.replace(self, **(update or {}))
+
+    def model_dump(self, exclude: set[str] | None = None) -> dict[str, Any]:
+        """Return the record as a dictionary, as `EIP1Document.model_dump` would."""
+        exclude = exclude or set()
+        # In the document's field order
+        return {
+            name: getattr(self, name)
+            for name in self.document_class.model_fields
+            if name not in exclude
+        }
+
+    def model_dump_json(self, exclude: set[str] | None = None) -> str:
+        """Return the record as JSON, as `EIP1Document.model_dump_json` would."""
+        return json.dumps(
+            self.model_dump(exclude),
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=_json_default,
+        )
+
+    def to_document(self) -> EIP1Document:
+        """Upgrade the record to a validated document."""
+        return self.document_class.model_validate(self.model_dump())
+
+    def __repr__(self):
+        """Return a string representation of the DocumentRecord."""
+        return str(self)
+
+    def __str__(self):
+        """Return a string representation of the DocumentRecord."""
+        return (
+            f"<{self.document_type.name} {self.id}: {self.title or self.description}>"
+        )
+
+
+RECORD_FIELDS = tuple(f.name for f in dataclasses.fields(DocumentRecord))
+# Fields that aren't set from document headers
+RECORD_HEADER_FIELDS = frozenset(RECORD_FIELDS) - {
+    "body",
+    "commit",
+    "commit_time",
+    "deleted",
+    "errors",
+}
+
+
+class EIPRecord(DocumentRecord):
+    """A compact, unvalidated EIP."""
+
+    __slots__ = ()
+
+    document_type = DocumentType.EIP
+    document_class = EIP
+
+
+class ERCRecord(DocumentRecord):
+    """A compact, unvalidated ERC."""
+
+    __slots__ = ()
+
+    document_type = DocumentType.ERC
+    document_class = ERC
+
+
+# Either a validated document, or a compact record of one
+AnyDocument: TypeAlias = EIP1Document | DocumentRecord
+
+
 class EIPsStats(BaseModel):
     """General aggregate stats for all EIPs"""
 
+    # Total parse errors across all documents
     errors: int
     categories: list[EIP1Category]
     statuses: list[EIP1Status]
     total: int
     types: list[EIP1Type]
+
+    # Number of documents with errors
+    invalid: int = 0
+    # Number of documents per category, status and type
+    category_counts: dict[EIP1Category, int] = Field(default_factory=dict)
+    status_counts: dict[EIP1Status, int] = Field(default_factory=dict)
+    type_counts: dict[EIP1Type, int] = Field(default_factory=dict)
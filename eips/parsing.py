@@ -1,7 +1,9 @@
 """EIP1 document parsing utilities."""
 
 import re
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from typing import TypeAlias
 
 from dateutil.parser import ParserError as DateutilParserError
@@ -21,14 +23,31 @@ HeadersType: TypeAlias = dict[str, OptionalHeaderValueType]
 RFC_822_HEADER = (
     r'^([\w\-]+)\: ([\w\s\number\/\:\?\.\,;@&\*<>\[\]\(\)’\'"`_\^\-\—\+=]*)$'  # noqa: RUF001
 )
+RFC_822_HEADER_RE = re.compile(RFC_822_HEADER)
+ISO_DATE_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+HEADER_DELIMITER = "---"
 HEADER_MAPPING = {
     "eip": "id",
     # "status": "eip_status",
     # "type": "eip_type",
 }
 
+# Known weird characters, and their less weird replacements
+HEADER_LINE_TRANSLATION = str.maketrans(
+    {
+        # Weird quotes
+        "“": '"',
+        "”": '"',
+        # Zero width non-joiner or whatever
+        "\u200c": " ",
+    }
+)
+
 log = get_logger(__name__)
 
+# How often date parsing took the fast path, or had to fall back to dateutil
+date_parse_stats: Counter[str] = Counter()
+
 
 class ParseError(Exception):
     """Error parsing a document."""
@@ -38,13 +57,34 @@ class HeaderParseError(ParseError):
     """Error parsing a header line."""
 
 
+@lru_cache(maxsize=4096)
+def parse_date(date: str) -> datetime:
+    """Parse a date header.
+
+    Nearly every document uses plain `YYYY-MM-DD` dates, which are parsed with
+    `datetime.fromisoformat`.  Anything else falls back to dateutil.
+    """
+    stripped = date.strip()
+    if ISO_DATE_RE.fullmatch(stripped):
+        try:
+            parsed = datetime.fromisoformat(stripped)
+            date_parse_stats["fast"] += 1
+            return parsed
+        except ValueError:
+            # Not a real date (e.g. 2021-02-30), let dateutil decide what to do
+            pass
+
+    date_parse_stats["fallback"] += 1
+    return dateutil_parse(date)
+
+
 def normalize_date(date: str) -> datetime:
     """Normalize a date header to handle unusual cases.
 
     This was specifically created to handle some EIPs that for whatever reason have a
     list of dates for `updated`. We'll parse them all and select the most recent.
     """
-    return dateutil_parse(sorted([d.strip() for d in date.split(",")])[-1])
+    return parse_date(sorted([d.strip() for d in date.split(",")])[-1])
 
 
 def normalize_id_list(list_string: str) -> list[int]:
@@ -72,35 +112,66 @@ def normalize_header_line(name: str) -> str:
     might be worth just allowing all unicode in the regex, but for now being defensive
     and failing is a bit of an alerting mechanism.
     """
-    return (
-        name
-        # Weird quotes
-        .replace("“", '"')
-        .replace("”", '"')
-        # Zero width non-joiner or whatever
-        .replace("\u200c", " ")
-        # Basic cleanup
-        .strip()
-    )
+    return name.translate(HEADER_LINE_TRANSLATION).strip()
+
+
+def find_headers_end(eip_text: str) -> tuple[int, int]:
+    """Find the header block of EIP text.
+
+    Returns the end of the header lines and the start of the body.  The first line must
+    be the `---` delimiter, and headers end at the next line starting with `---`.
+    """
+    delim_len = len(HEADER_DELIMITER)
+
+    if not eip_text.startswith(HEADER_DELIMITER) or (
+        len(eip_text) > delim_len and eip_text[delim_len] != "\n"
+    ):
+        raise HeaderParseError("Header RFC-822 delimiter (---) not found")
+
+    end = eip_text.find("\n" + HEADER_DELIMITER, delim_len)
+    if end < 0:
+        raise ParseError("EIP Appears to be malformed.  Did not find end of headers")
+
+    body_start = eip_text.find("\n", end + 1)
+    return end, len(eip_text) if body_start < 0 else body_start + 1
+
+
+def header_block(raw: bytes) -> bytes:
+    """Return the leading bytes of a raw document, up to the end of its headers.
+
+    Scanning stops at the line closing the header block, and the body isn't decoded.
+    A document that doesn't start with a header block is returned whole, so that
+    parsing fails the same way it would for the full text.
+    """
+    delim = HEADER_DELIMITER.encode()
+    delim_len = len(delim)
+
+    if not raw.startswith(delim) or raw[delim_len : delim_len + 1] not in (b"", b"\n"):
+        return raw
+
+    end = raw.find(b"\n" + delim, delim_len)
+    if end < 0:
+        return raw
+
+    body_start = raw.find(b"\n", end + 1)
+    return raw if body_start < 0 else raw[: body_start + 1]
 
 
 def pluck_headers(eip_text: str) -> tuple[HeadersType, str, list[str]]:
     """Remove and return the RFC 822 headers from EIP text."""
-    lines = eip_text.split("\n")
-    line_count = 0
     headers: HeadersType = {}
-    found_end = False
     errors: list[str] = []
 
-    if lines[0] != "---":
-        raise HeaderParseError("Header RFC-822 delimiter (---) not found")
+    headers_end, body_start = find_headers_end(eip_text)
+    if headers_end == len(HEADER_DELIMITER):
+        # The closing delimiter directly follows the opening one
+        lines = []
+    else:
+        # Only the header block is split, the body is sliced off as-is
+        lines = eip_text[len(HEADER_DELIMITER) + 1 : headers_end].split("\n")
 
-    for ln in lines[1:]:
-        line_count += 1
-        if ln.startswith("---"):
-            found_end = True
-            break
-        matches = re.fullmatch(RFC_822_HEADER, normalize_header_line(ln))
+    for ln in lines:
+        matches = RFC_822_HEADER_RE.fullmatch(normalize_header_line(ln))
         if not matches or len(matches.groups()) != 2:
             # TODO: Need to store this somewhere for later reference instead of just
             #       logging.
@@ -126,10 +197,7 @@ def pluck_headers(eip_text: str) -> tuple[HeadersType, str, list[str]]:
 
             headers[hkey] = hval
 
-    if not found_end:
-        raise ParseError("EIP Appears to be malformed.  Did not find end of headers")
-
-    return (headers, "\n".join(lines[line_count + 1 :]), errors)
+    return (headers, eip_text[body_start:], errors)
 
 
 header_translators = {
@@ -138,7 +206,7 @@ header_translators = {
     "status": lambda v: EIP1Status.get_by_val(v),
     "type": lambda v: EIP1Type.get_by_val(v),
     # TODO: Vsauce, fragile lambdas here
-    "created": lambda v: dateutil_parse(v),
+    "created": parse_date,
     "updated": lambda v: normalize_date(v),
     "requires": normalize_id_list,
     "replaces": normalize_id_list,
@@ -0,0 +1,341 @@
+"""Read-only HTTP server of EIPs and ERCs, as JSON.
+
+A small HTTP/1.1 server on asyncio streams, so it needs nothing beyond the standard
+library.  Documents are read from warm `AsyncEIPs`/`AsyncERCs` that refresh in the
+background.  Every response is for the commit documents are currently read from, so
+its ETag is that commit, and rendered responses are cached until the commit changes.
+
+Routes, for `eips` and `ercs`:
+
+- `GET /eips`: records of documents matching query filters, e.g.
+  `?status=Final,Last Call&requires=1559&limit=10`
+- `GET /eips/search?q=...`: full-text search
+- `GET /eips/stats`: aggregate stats
+- `GET /eips/{id}`: a document, headers only with `?headers=1`
+"""
+
+import asyncio
+import json
+from collections import OrderedDict
+from collections.abc import Mapping
+from datetime import timedelta
+from http import HTTPStatus
+from typing import Any, NamedTuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from eips.aio import AsyncEIPs, AsyncERCs, AsyncEthereumDocs
+from eips.const import ENCODING
+from eips.eips import EIPs, ERCs
+from eips.logging import get_logger
+from eips.object import CommitHash
+from eips.store import parse_filters
+
+log = get_logger(__name__)
+
+# Rendered responses kept, across all routes
+RESPONSE_CACHE_SIZE = 4096
+# Longest request line or header line accepted
+MAX_LINE = 8192
+MAX_HEADERS = 100
+
+
+class BadRequestError(ValueError):
+    """A request the server can't make sense of."""
+
+
+class Response(NamedTuple):
+    """An HTTP response."""
+
+    status: HTTPStatus
+    body: bytes = b""
+    etag: str | None = None
+
+
+class CachedResponse(NamedTuple):
+    """A rendered response, and the commit it was rendered from."""
+
+    commit: CommitHash
+    response: Response
+
+
+def _json_response(data: Any, status: HTTPStatus = HTTPStatus.OK) -> Response:
+    return Response(status, json.dumps(data).encode(ENCODING))
+
+
+def _error(status: HTTPStatus, message: str | None = None) -> Response:
+    return _json_response({"error": message or status.phrase}, status)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Return whether an If-None-Match header (weakly) matches an ETag."""
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def _int_param(name: str, value: str) -> int:
+    try:
+        return int(value)
+    except ValueError as err:
+        raise BadRequestError(f"{name} must be an integer") from err
+
+
+class DocumentServer:
+    """HTTP server of documents, by document type (`eips` or `ercs`)."""
+
+    def __init__(
+        self,
+        docs: Mapping[str, AsyncEthereumDocs],
+        refresh_interval: timedelta | None = timedelta(seconds=60),
+        cache_size: int = RESPONSE_CACHE_SIZE,
+    ):
+        """Initialize a server of the given docs, by the path they're served under.
+
+        With `refresh_interval`, the docs are also fetched that often, even if every
+        request is answered from cache.
+        """
+        self.docs = dict(docs)
+        self.refresh_interval = refresh_interval
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._server: asyncio.Server | None = None
+        self._refresher: asyncio.Task[None] | None = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.Server:
+        """Read the current commit of the docs (fetched if due) and start listening."""
+        await asyncio.gather(*(docs.resolve_commit() for docs in self.docs.values()))
+        self._server = await asyncio.start_server(
+            self._handle_connection, host, port, limit=MAX_LINE
+        )
+        if self.refresh_interval is not None:
+            self._refresher = asyncio.create_task(self._refresh_loop())
+        return self._server
+
+    @property
+    def port(self) -> int:
+        """Return the port listened on (useful when started on port 0)."""
+        assert self._server is not None, "Server not started"
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """Stop listening and close the docs."""
+        if self._refresher is not None:
+            self._refresher.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for docs in self.docs.values():
+            await docs.close()
+
+    async def _refresh_loop(self) -> None:
+        assert self.refresh_interval is not None
+        while True:
+            await asyncio.sleep(self.refresh_interval.total_seconds())
+            for name, docs in self.docs.items():
+                try:
+                    await docs.repo_fetch()
+                except Exception:
+                    log.exception(f"Refreshing {name} failed")
+
+    async def handle(
+        self, method: str, target: str, headers: Mapping[str, str]
+    ) -> Response:
+        """Respond to a request.  Header names are expected in lower case."""
+        if method not in ("GET", "HEAD"):
+            return _error(HTTPStatus.METHOD_NOT_ALLOWED)
+
+        url = urlsplit(target)
+        parts = [unquote(part) for part in url.path.strip("/").split("/")]
+        docs = self.docs.get(parts[0])
+        if docs is None or len(parts) > 2:
+            return _error(HTTPStatus.NOT_FOUND)
+
+        commit = docs.current_commit
+        if commit is None:
+            return _error(HTTPStatus.SERVICE_UNAVAILABLE, "Not fetched yet")
+        etag = f'"{commit}"'
+        # Only responses that would be OK are Not Modified, so errors still show
+        not_modified = Response(HTTPStatus.NOT_MODIFIED, etag=etag)
+        revalidating = _etag_matches(headers.get("if-none-match", ""), etag)
+
+        key = f"{url.path}?{url.query}"
+        cached = self._cache.get(key)
+        if cached is not None and cached.commit == commit:
+            self._cache.move_to_end(key)
+            return not_modified if revalidating else cached.response
+
+        params = parse_qs(url.query)
+        try:
+            response = await self._render(docs, parts[1:], params)
+        except BadRequestError as err:
+            return _error(HTTPStatus.BAD_REQUEST, str(err))
+
+        # A refresh may have swapped in another commit during the read
+        if response.status != HTTPStatus.OK or docs.current_commit != commit:
+            return response
+
+        response = response._replace(etag=etag)
+        self._cache[key] = CachedResponse(commit, response)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return not_modified if revalidating else response
+
+    async def _render(
+        self,
+        docs: AsyncEthereumDocs,
+        parts: list[str],
+        params: dict[str, list[str]],
+    ) -> Response:
+        if not parts:
+            try:
+                filters = parse_filters(params)
+            except ValueError as err:
+                raise BadRequestError(str(err)) from err
+            records = await docs.query(**filters)
+            return Response(
+                HTTPStatus.OK,
+                b"["
+                + b",".join(
+                    record.model_dump_json(exclude={"body"}).encode(ENCODING)
+                    for record in records
+                )
+                + b"]",
+            )
+
+        if parts[0] == "stats":
+            stats = await docs.stats()
+            return Response(HTTPStatus.OK, stats.model_dump_json().encode(ENCODING))
+
+        if parts[0] == "search":
+            terms = " ".join(params.get("q", []))
+            if not terms.strip():
+                raise BadRequestError("q is required")
+            limit = _int_param("limit", params.get("limit", ["20"])[-1])
+            results = await docs.search(terms, limit=limit)
+            return _json_response(
+                [
+                    {
+                        "id": result.document.id,
+                        "title": result.document.title,
+                        "score": result.score,
+                        "snippet": result.snippet,
+                    }
+                    for result in results
+                ]
+            )
+
+        doc_id = _int_param("id", parts[0])
+        headers_only = params.get("headers", ["0"])[-1] not in ("", "0", "false")
+        found = await docs.get(doc_id, headers_only=headers_only)
+        if not found:
+            return _error(HTTPStatus.NOT_FOUND, f"No document {doc_id}")
+        return Response(
+            HTTPStatus.OK,
+            found[0]
+            .model_dump_json(exclude={"body"} if headers_only else None)
+            .encode(ENCODING),
+        )
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while await self._handle_request(reader, writer):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> bool:
+        """Read a request and write its response, returning whether to keep going."""
+        try:
+            request_line = await reader.readline()
+            if not request_line:
+                return False
+            method, target, version = request_line.decode("latin-1").split()
+            headers: dict[str, str] = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                if len(headers) >= MAX_HEADERS:
+                    raise ValueError("Too many headers")
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            content_length = int(headers.get("content-length", 0))
+        except ValueError:
+            # Including a line over the limit
+            await self._write(writer, "HTTP/1.1", _error(HTTPStatus.BAD_REQUEST), False)
+            return False
+
+        if content_length or "transfer-encoding" in headers:
+            # Nothing takes a body, so don't read one
+            await self._write(
+                writer, version, _error(HTTPStatus.REQUEST_ENTITY_TOO_LARGE), False
+            )
+            return False
+
+        keep_alive = (
+            version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        )
+        try:
+            response = await self.handle(method, target, headers)
+        except Exception:
+            log.exception(f"Error handling {method} {target}")
+            response = _error(HTTPStatus.INTERNAL_SERVER_ERROR)
+
+        await self._write(writer, version, response, keep_alive, method == "HEAD")
+        return keep_alive
+
+    async def _write(
+        self,
+        writer: asyncio.StreamWriter,
+        version: str,
+        response: Response,
+        keep_alive: bool,
+        head: bool = False,
+    ) -> None:
+        lines = [
+            f"{version} {response.status.value} {response.status.phrase}",
+            "Content-Type: application/json",
+            f"Content-Length: {len(response.body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        if response.etag is not None:
+            lines += [f"ETag: {response.etag}", "Cache-Control: no-cache"]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if not head:
+            writer.write(response.body)
+        await writer.drain()
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8080,
+    refresh_interval: timedelta | None = timedelta(seconds=60),
+    freshness: timedelta | None = timedelta(seconds=60),
+    offline: bool = False,
+) -> None:
+    """Serve EIPs and ERCs until cancelled.
+
+    `freshness` and `offline` are those of the served EIPs and ERCs.  Offline, they're
+    never refreshed.
+    """
+    options: dict[str, Any] = {
+        "background_refresh": True,
+        "freshness": freshness,
+        "offline": offline,
+    }
+    server = DocumentServer(
+        {"eips": AsyncEIPs(EIPs(**options)), "ercs": AsyncERCs(ERCs(**options))},
+        refresh_interval=None if offline else refresh_interval,
+    )
+    try:
+        listener = await server.start(host, port)
+        log.info(f"Serving EIPs and ERCs on http://{host}:{server.port}")
+        await listener.serve_forever()
+    finally:
+        await server.close()
@@ -0,0 +1,481 @@
+"""SQLite store of document headers at commits, for indexed queries."""
+
+import sqlite3
+from collections.abc import Iterable, Mapping
+from datetime import datetime, timezone
+from enum import Enum
+from pathlib import Path
+from threading import Lock
+from typing import Any, NamedTuple, TypedDict, cast
+
+from typing_extensions import Unpack  # Support addded in 3.11
+
+from eips.cache import VOLATILE_FIELDS
+from eips.const import STORE_VERSION
+from eips.enum import EIP1Category, EIP1Status, EIP1Type, LookupEnum
+from eips.export import to_timestamp
+from eips.logging import get_logger
+from eips.object import CommitHash, DocumentRecord, FlexId
+
+log = get_logger(__name__)
+
+# Document relations indexed for lookups by target document
+RELATIONS = ("requires", "replaces", "superseded_by")
+
+ENUM_FILTERS: dict[str, type[LookupEnum]] = {
+    "status": EIP1Status,
+    "type": EIP1Type,
+    "category": EIP1Category,
+}
+INT_FILTERS = ("requires", "replaces", "superseded_by", "limit")
+DATE_FILTERS = ("created_after", "created_before", "updated_after", "updated_before")
+
+
+class QueryFilters(TypedDict, total=False):
+    """Document query filters.
+
+    Status, type and category match any of the values given.  Relations match the
+    documents with the given document ID in that header.  Dates bound created/updated,
+    inclusive of the start.
+    """
+
+    doc_id: FlexId
+    status: EIP1Status | list[EIP1Status]
+    type: EIP1Type | list[EIP1Type]
+    category: EIP1Category | list[EIP1Category]
+    requires: int
+    replaces: int
+    superseded_by: int
+    created_after: datetime
+    created_before: datetime
+    updated_after: datetime
+    updated_before: datetime
+    limit: int
+
+
+def _int_filter(name: str, value: str) -> int:
+    try:
+        return int(value)
+    except ValueError as err:
+        raise ValueError(f"{name} must be an integer") from err
+
+
+def parse_filters(params: Mapping[str, list[str]]) -> QueryFilters:
+    """Parse query filters from parameter names and values, as in a query string.
+
+    Status, type and category take comma separated (or repeated) values.  Dates are ISO
+    8601, in UTC unless they say otherwise.  Raises ValueError on anything else.
+    """
+    filters: dict[str, Any] = {}
+    for name, values in params.items():
+        value = values[-1]
+        if name in ENUM_FILTERS:
+            members = []
+            for part in (p for v in values for p in v.split(",") if p.strip()):
+                member = ENUM_FILTERS[name].get_by_val(part.strip())
+                if member is None:
+                    raise ValueError(f"Unknown {name} {part}")
+                members.append(member)
+            filters[name] = members
+        elif name in INT_FILTERS:
+            filters[name] = _int_filter(name, value)
+        elif name in DATE_FILTERS:
+            try:
+                date = datetime.fromisoformat(value)
+            except ValueError as err:
+                raise ValueError(f"{name} must be an ISO 8601 date") from err
+            filters[name] = (
+                date if date.tzinfo is not None else date.replace(tzinfo=timezone.utc)
+            )
+        else:
+            raise ValueError(f"Unknown filter {name}")
+    return cast(QueryFilters, filters)
+
+
+class StoredDocument(NamedTuple):
+    """A document to store, along with where its body can be read from."""
+
+    # The ID from the filename, which headers may not agree with
+    file_id: int
+    blob_sha: bytes
+    # Offset of the body in the blob text, or None if it has no body
+    body_offset: int | None
+    record: DocumentRecord
+
+
+class StoreRow(NamedTuple):
+    """A document read back from the store."""
+
+    blob_sha: bytes
+    body_offset: int | None
+    data: str
+
+
+def _values(value: Any) -> list[Any]:
+    """Return a filter value as a list of SQL values."""
+    values = value if isinstance(value, list | tuple | set) else [value]
+    return [v.value if isinstance(v, Enum) else v for v in values]
+
+
+class DocumentStore:
+    """SQLite store of the document headers at a commit.
+
+    Documents are indexed by id, status, type, category, created and updated dates, and
+    their relations to other documents, so filters can be pushed down to SQL.  Only the
+    `keep` most recently stored commits are kept.
+    """
+
+    def __init__(self, path: Path, keep: int = 8):
+        """Initialize a store at the given path."""
+        self.path = path
+        self.keep = keep
+        self._conn: sqlite3.Connection | None = None
+        self._lock = Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The SQLite connection, opened (and migrated) on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(mode=0o750, parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)"
+            )
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'version'"
+            ).fetchone()
+            if row is None or row[0] != STORE_VERSION:
+                log.debug(f"Resetting document store at {self.path}")
+                conn.execute("DROP TABLE IF EXISTS commits")
+                conn.execute("DROP TABLE IF EXISTS documents")
+                conn.execute("DROP TABLE IF EXISTS relations")
+                conn.execute("DROP TABLE IF EXISTS search_docs")
+                conn.execute("DROP TABLE IF EXISTS search_index")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                    (STORE_VERSION,),
+                )
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS commits (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    document_type TEXT NOT NULL,
+                    commit_id TEXT NOT NULL,
+                    commit_time TEXT,
+                    UNIQUE (document_type, commit_id)
+                );
+                CREATE TABLE IF NOT EXISTS documents (
+                    document_type TEXT NOT NULL,
+                    commit_id TEXT NOT NULL,
+                    file_id INTEGER NOT NULL,
+                    id INTEGER NOT NULL,
+                    status TEXT,
+                    type TEXT,
+                    category TEXT,
+                    created INTEGER,
+                    updated INTEGER,
+                    blob_sha BLOB NOT NULL,
+                    body_offset INTEGER,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (document_type, commit_id, file_id)
+                );
+                CREATE INDEX IF NOT EXISTS documents_id
+                    ON documents (document_type, commit_id, id);
+                CREATE INDEX IF NOT EXISTS documents_status
+                    ON documents (document_type, commit_id, status);
+                CREATE INDEX IF NOT EXISTS documents_type
+                    ON documents (document_type, commit_id, type);
+                CREATE INDEX IF NOT EXISTS documents_category
+                    ON documents (document_type, commit_id, category);
+                CREATE INDEX IF NOT EXISTS documents_created
+                    ON documents (document_type, commit_id, created);
+                CREATE INDEX IF NOT EXISTS documents_updated
+                    ON documents (document_type, commit_id, updated);
+                CREATE TABLE IF NOT EXISTS relations (
+                    document_type TEXT NOT NULL,
+                    commit_id TEXT NOT NULL,
+                    relation TEXT NOT NULL,
+                    target INTEGER NOT NULL,
+                    file_id INTEGER NOT NULL,
+                    PRIMARY KEY (document_type, commit_id, relation, target, file_id)
+                );
+                CREATE INDEX IF NOT EXISTS documents_blob
+                    ON documents (document_type, blob_sha);
+                -- Search is indexed by blob, so each version of a document is only
+                -- indexed once, no matter how many commits it's in
+                CREATE TABLE IF NOT EXISTS search_docs (
+                    rowid INTEGER PRIMARY KEY,
+                    document_type TEXT NOT NULL,
+                    blob_sha BLOB NOT NULL,
+                    UNIQUE (document_type, blob_sha)
+                );
+                CREATE VIRTUAL TABLE IF NOT EXISTS search_index USING fts5 (
+                    title, description, body, tokenize = 'porter unicode61'
+                );
+                """
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def has_commit(self, document_type: str, commit: CommitHash) -> bool:
+        """Have the documents at the given commit been stored?"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM commits WHERE document_type = ? AND commit_id = ?",
+                (document_type, commit),
+            ).fetchone()
+        return row is not None
+
+    def commit_time(self, document_type: str, commit: CommitHash) -> datetime | None:
+        """Return the time of a stored commit."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT commit_time FROM commits"
+                " WHERE document_type = ? AND commit_id = ?",
+                (document_type, commit),
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row and row[0] else None
+
+    def add_commit(
+        self,
+        document_type: str,
+        commit: CommitHash,
+        commit_time: datetime | None,
+        docs: Iterable[StoredDocument],
+    ) -> int:
+        """Store all of the documents at a commit, returning how many were stored.
+
+        The commit is only marked as stored once all of its documents are, and the
+        oldest commits beyond `keep` are dropped.
+        """
+        count = 0
+        with self._lock:
+            conn = self.conn
+            # Drop anything left over from an interrupted run
+            self._delete_commit(document_type, commit)
+
+            for doc in docs:
+                record = doc.record
+                conn.execute(
+                    "INSERT INTO documents (document_type, commit_id, file_id, id,"
+                    " status, type, category, created, updated, blob_sha, body_offset,"
+                    " data) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        document_type,
+                        commit,
+                        doc.file_id,
+                        record.id,
+                        record.status.value if record.status else None,
+                        record.type.value if record.type else None,
+                        record.category.value if record.category else None,
+                        to_timestamp(record.created),
+                        to_timestamp(record.updated),
+                        doc.blob_sha,
+                        doc.body_offset,
+                        # The body is read from the blob on access
+                        record.model_copy(update={"body": ""}).model_dump_json(
+                            exclude=VOLATILE_FIELDS
+                        ),
+                    ),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO relations"
+                    " (document_type, commit_id, relation, target, file_id)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (document_type, commit, relation, target, doc.file_id)
+                        for relation in RELATIONS
+                        for target in getattr(record, relation) or []
+                    ],
+                )
+                count += 1
+
+            conn.execute(
+                "INSERT INTO commits (document_type, commit_id, commit_time)"
+                " VALUES (?, ?, ?)",
+                (
+                    document_type,
+                    commit,
+                    commit_time.isoformat() if commit_time else None,
+                ),
+            )
+
+            stale = conn.execute(
+                "SELECT commit_id FROM commits WHERE document_type = ?"
+                " ORDER BY seq DESC LIMIT -1 OFFSET ?",
+                (document_type, self.keep),
+            ).fetchall()
+            for (stale_commit,) in stale:
+                self._delete_commit(document_type, stale_commit)
+            if stale:
+                self._prune_search()
+
+            conn.commit()
+
+        log.debug(f"Stored {count} documents at {commit}")
+        return count
+
+    def _prune_search(self) -> None:
+        """Drop indexed blobs no longer in any stored commit."""
+        unused = (
+            "SELECT s.rowid FROM search_docs s WHERE NOT EXISTS (SELECT 1"
+            " FROM documents d WHERE d.document_type = s.document_type"
+            " AND d.blob_sha = s.blob_sha)"
+        )
+        self.conn.execute(f"DELETE FROM search_index WHERE rowid IN ({unused})")
+        self.conn.execute(f"DELETE FROM search_docs WHERE rowid IN ({unused})")
+
+    def unindexed(self, document_type: str, commit: CommitHash) -> list[StoreRow]:
+        """Return the stored documents at a commit not yet in the search index."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT DISTINCT d.blob_sha, d.body_offset, d.data FROM documents d"
+                " WHERE d.document_type = ? AND d.commit_id = ? AND NOT EXISTS"
+                " (SELECT 1 FROM search_docs s WHERE s.document_type = d.document_type"
+                " AND s.blob_sha = d.blob_sha)",
+                (document_type, commit),
+            ).fetchall()
+        return [StoreRow(*row) for row in rows]
+
+    def add_search(
+        self, document_type: str, docs: Iterable[tuple[bytes, str, str, str]]
+    ) -> int:
+        """Add (blob SHA, title, description, body) documents to the search index."""
+        count = 0
+        with self._lock:
+            conn = self.conn
+            for blob_sha, title, description, body in docs:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO search_docs (document_type, blob_sha)"
+                    " VALUES (?, ?)",
+                    (document_type, blob_sha),
+                )
+                if not cursor.rowcount:
+                    continue
+                conn.execute(
+                    "INSERT INTO search_index (rowid, title, description, body)"
+                    " VALUES (?, ?, ?, ?)",
+                    (cursor.lastrowid, title, description, body),
+                )
+                count += 1
+            conn.commit()
+
+        log.debug(f"Indexed {count} documents for search")
+        return count
+
+    def search(
+        self,
+        document_type: str,
+        commit: CommitHash,
+        terms: str,
+        limit: int | None = None,
+    ) -> list[tuple[StoreRow, float, str]]:
+        """Search the documents at a commit, best matches first.
+
+        Every whitespace separated term has to match, prefixes of words included.
+        Returns each matching document with its score (higher is better), and a snippet
+        of the matching text.
+        """
+        # Terms are quoted, so punctuation (e.g. "EIP-1559") isn't FTS query syntax
+        match = " ".join(
+            '"{}"*'.format(term.replace('"', '""')) for term in terms.split()
+        )
+        if not match:
+            return []
+
+        sql = (
+            "SELECT d.blob_sha, d.body_offset, d.data,"
+            # Title matches count more than description matches, than body matches
+            " -bm25(search_index, 10.0, 5.0, 1.0) AS score,"
+            " snippet(search_index, -1, '[', ']', '...', 16)"
+            " FROM search_index"
+            " JOIN search_docs s ON s.rowid = search_index.rowid"
+            " JOIN documents d ON d.document_type = s.document_type"
+            " AND d.blob_sha = s.blob_sha"
+            " WHERE search_index MATCH ? AND s.document_type = ? AND d.commit_id = ?"
+            " ORDER BY score DESC, d.id"
+        )
+        params: list[Any] = [match, document_type, commit]
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            return [
+                (StoreRow(blob_sha, body_offset, data), score, snippet)
+                for blob_sha, body_offset, data, score, snippet in self.conn.execute(
+                    sql, params
+                )
+            ]
+
+    def _delete_commit(self, document_type: str, commit: str) -> None:
+        for table in ("commits", "documents", "relations"):
+            self.conn.execute(
+                f"DELETE FROM {table} WHERE document_type = ? AND commit_id = ?",
+                (document_type, commit),
+            )
+
+    def query(
+        self,
+        document_type: str,
+        commit: CommitHash,
+        **filters: Unpack[QueryFilters],
+    ) -> list[StoreRow]:
+        """Return the stored documents at a commit matching all of the filters."""
+        where = ["d.document_type = ?", "d.commit_id = ?"]
+        params: list[Any] = [document_type, commit]
+
+        for column, value in (
+            ("id", filters.get("doc_id")),
+            ("status", filters.get("status")),
+            ("type", filters.get("type")),
+            ("category", filters.get("category")),
+        ):
+            if value is None:
+                continue
+            values = _values(value)
+            where.append(f"d.{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+
+        for relation in RELATIONS:
+            target = filters.get(relation)
+            if target is None:
+                continue
+            where.append(
+                "EXISTS (SELECT 1 FROM relations r"
+                " WHERE r.document_type = d.document_type"
+                " AND r.commit_id = d.commit_id AND r.relation = ?"
+                " AND r.target = ? AND r.file_id = d.file_id)"
+            )
+            params.extend([relation, target])
+
+        for condition, value in (
+            ("d.created >= ?", filters.get("created_after")),
+            ("d.created < ?", filters.get("created_before")),
+            ("d.updated >= ?", filters.get("updated_after")),
+            ("d.updated < ?", filters.get("updated_before")),
+        ):
+            if value is not None:
+                where.append(condition)
+                params.append(to_timestamp(value))
+
+        sql = (
+            "SELECT d.blob_sha, d.body_offset, d.data FROM documents d"
+            f" WHERE {' AND '.join(where)} ORDER BY d.id, d.file_id"
+        )
+        if "limit" in filters:
+            sql += " LIMIT ?"
+            params.append(filters["limit"])
+
+        with self._lock:
+            return [StoreRow(*row) for row in self.conn.execute(sql, params)]
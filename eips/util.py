@@ -1,14 +1,28 @@
 """General util funcs used by the package."""
 
+import json
+import os
 import re
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
 
 from eips.const import DOC_FILENAME_PATTERN
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None  # type: ignore[assignment]
+
+DOC_FILENAME_RE = re.compile(DOC_FILENAME_PATTERN)
+
 
 def doc_id_from_file(fname: str) -> int:
     """Get a document ID (EIP/ERC No.) from a filename."""
-    match = re.fullmatch(DOC_FILENAME_PATTERN, fname)
+    match = DOC_FILENAME_RE.fullmatch(fname)
     if match is None:
         return -1
     try:
@@ -23,3 +37,56 @@ def gitstamp_to_dt(timestamp: int, timezone_secs: int = 0) -> datetime:
         timestamp,
         tz=timezone(timedelta(seconds=timezone_secs)),
     )
+
+
+def read_state(fpath: Path) -> dict[str, Any]:
+    """Read a JSON state file, or an empty state if it's missing or unreadable."""
+    try:
+        return json.loads(fpath.read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def write_state(fpath: Path, state: dict[str, Any]) -> None:
+    """Atomically write a JSON state file.
+
+    The state is written to a temporary file of its own and moved into place, so
+    neither a crash nor concurrent writers leave a partially written state behind.
+    """
+    fpath.parent.mkdir(mode=0o750, parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{fpath.name}.", dir=fpath.parent)
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            json.dump(state, tmp_file)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_name, fpath)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def file_lock(fpath: Path) -> Iterator[bool]:
+    """Hold an exclusive advisory lock on a file, waiting for it if need be.
+
+    Yields whether another holder had to be waited for.  Without `fcntl`, nothing is
+    locked.
+    """
+    fpath.parent.mkdir(mode=0o750, parents=True, exist_ok=True)
+    with fpath.open("a") as lock_file:
+        if fcntl is None:
+            yield False
+            return
+
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            waited = False
+        except BlockingIOError:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            waited = True
+
+        try:
+            yield waited
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
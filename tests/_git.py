@@ -0,0 +1,117 @@
+"""Helpers for building local fixture git repos."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+from dulwich import porcelain
+from dulwich.repo import Repo
+
+# 2021-01-01T00:00:00Z, fixture commits are spaced a day apart from here
+BASE_TIMESTAMP = 1609459200
+DAY = 86400
+
+needs_upload_pack = pytest.mark.skipif(
+    shutil.which("git-upload-pack") is None,
+    reason="Shallow clones of local repos need git-upload-pack",
+)
+
+
+def make_doc_text(doc_id: int, status: str = "Draft", title: str | None = None) -> str:
+    """Build a minimal EIP-1 document."""
+    return (
+        "---\n"
+        f"eip: {doc_id}\n"
+        f"title: {title or f'Test document {doc_id}'}\n"
+        f"description: Description of document {doc_id}\n"
+        "author: Alice (@alice), Bob (@bob)\n"
+        f"status: {status}\n"
+        "type: Standards Track\n"
+        "category: Core\n"
+        "created: 2021-01-01\n"
+        "---\n"
+        "\n"
+        "## Abstract\n"
+        "\n"
+        f"Body of document {doc_id}.\n"
+    )
+
+
+def commit_files(
+    repo_path: Path,
+    files: dict[str, str | None],
+    message: str,
+    timestamp: int,
+) -> bytes:
+    """Write (or delete, when None) files and commit them, returning the commit ID."""
+    paths: list[str] = []
+    removed: list[str] = []
+    for name, text in files.items():
+        fpath = repo_path.joinpath(name)
+        if text is None:
+            removed.append(str(fpath))
+            continue
+        fpath.parent.mkdir(parents=True, exist_ok=True)
+        fpath.write_text(text)
+        paths.append(str(fpath))
+
+    if paths:
+        porcelain.add(str(repo_path), paths=paths)
+    if removed:
+        porcelain.remove(str(repo_path), paths=removed)
+
+    with Repo(str(repo_path)) as repo:
+        return repo.do_commit(
+            message.encode("utf-8"),
+            committer=b"Tester <tester@example.com>",
+            author=b"Tester <tester@example.com>",
+            commit_timestamp=timestamp,
+            commit_timezone=0,
+            author_timestamp=timestamp,
+            author_timezone=0,
+        )
+
+
+def add_doc(repo_path: Path, doc_id: int, day: int = 10) -> bytes:
+    """Commit a new EIP `day` days after the fixture's first commit."""
+    return commit_files(
+        repo_path,
+        {f"EIPS/eip-{doc_id}.md": make_doc_text(doc_id)},
+        f"Add {doc_id}",
+        BASE_TIMESTAMP + day * DAY,
+    )
+
+
+def init_doc_repo(
+    repo_path: Path, docs_dir: str = "EIPS", prefix: str = "eip"
+) -> list[bytes]:
+    """Create a small docs repo, returning its commit IDs oldest first."""
+    repo_path.mkdir(parents=True, exist_ok=True)
+    porcelain.init(str(repo_path))
+
+    return [
+        commit_files(
+            repo_path,
+            {f"{docs_dir}/{prefix}-1.md": make_doc_text(1)},
+            "Add 1",
+            BASE_TIMESTAMP,
+        ),
+        commit_files(
+            repo_path,
+            {f"{docs_dir}/{prefix}-20.md": make_doc_text(20, "Review")},
+            "Add 20",
+            BASE_TIMESTAMP + DAY,
+        ),
+        commit_files(
+            repo_path,
+            {"README.md": "# Docs\n"},
+            "Add readme",
+            BASE_TIMESTAMP + 2 * DAY,
+        ),
+        commit_files(
+            repo_path,
+            {f"{docs_dir}/{prefix}-1.md": make_doc_text(1, "Final")},
+            "Finalize 1",
+            BASE_TIMESTAMP + 3 * DAY,
+        ),
+    ]
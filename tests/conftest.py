@@ -7,6 +7,8 @@ import pytest
 
 from eips.eips import EIPs
 
+from ._git import init_doc_repo
+
 
 @pytest.fixture(scope="session")
 def workdir() -> Generator[Path, None, None]:
@@ -22,3 +24,14 @@ def eips(workdir: Path) -> EIPs:
     return EIPs(
         workdir=workdir,
     )
+
+
+@pytest.fixture
+def doc_repo(tmp_path: Path) -> tuple[Path, list[bytes]]:
+    repo_path = tmp_path.joinpath("source")
+    return repo_path, init_doc_repo(repo_path)
+
+
+@pytest.fixture
+def local_eips(tmp_path: Path, doc_repo: tuple[Path, list[bytes]]) -> EIPs:
+    return EIPs(repo=str(doc_repo[0]), workdir=tmp_path.joinpath("work"))
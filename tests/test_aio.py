@@ -0,0 +1,86 @@
+import asyncio
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Event
+from typing import Any
+
+import pytest
+
+from eips.aio import AsyncEIPs
+from eips.eips import EIPs
+from eips.git import ensure_repo_updated
+from eips.object import CommitHash
+
+from ._git import add_doc
+
+
+def test_background_refresh(
+    tmp_path: Path,
+    doc_repo: tuple[Path, list[bytes]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo_path, _ = doc_repo
+    docs = EIPs(
+        repo=str(repo_path),
+        workdir=tmp_path.joinpath("work"),
+        background_refresh=True,
+    )
+
+    # Nothing to read yet, so the first fetch is waited on
+    assert [doc.id for doc in docs.get()] == [1, 20]
+    first_commit = docs.current_commit
+    assert first_commit is not None
+
+    add_doc(repo_path, 30)
+
+    started = Event()
+    release = Event()
+
+    def _slow_fetch(repo_path: Path, repo: str, *args: Any) -> CommitHash:
+        started.set()
+        assert release.wait(10)
+        return ensure_repo_updated(repo_path, repo, *args)
+
+    monkeypatch.setattr("eips.git.ensure_repo_updated", _slow_fetch)
+    docs._last_fetch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+    # Due, but reads are served from the last commit while the fetch runs
+    assert [doc.id for doc in docs.get()] == [1, 20]
+    assert started.wait(10)
+    assert [doc.id for doc in docs.get()] == [1, 20]
+    assert docs.current_commit == first_commit
+    refresh = docs.refresh()
+    assert not refresh.done()
+
+    release.set()
+    new_commit = refresh.result(10)
+    assert new_commit != first_commit
+    assert docs.current_commit == new_commit
+    assert [doc.id for doc in docs.get()] == [1, 20, 30]
+    docs.close()
+
+
+def test_async_eips(tmp_path: Path, doc_repo: tuple[Path, list[bytes]]) -> None:
+    repo_path, _ = doc_repo
+
+    async def _main() -> None:
+        async with AsyncEIPs(
+            EIPs(
+                repo=str(repo_path),
+                workdir=tmp_path.joinpath("work"),
+                background_refresh=True,
+            )
+        ) as aeips:
+            commit = await aeips.repo_fetch()
+            assert aeips.current_commit == commit
+
+            docs, records = await asyncio.gather(aeips.get(1), aeips.records())
+            assert [doc.id for doc in docs] == [1]
+            assert [record.id for record in records] == [1, 20]
+            assert (await aeips.stats()).total == 2
+
+            add_doc(repo_path, 30)
+            assert await aeips.repo_fetch() != commit
+            assert [doc.id for doc in await aeips.get()] == [1, 20, 30]
+
+    asyncio.run(_main())
@@ -0,0 +1,78 @@
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from eips.bundle import BundleDocument, write_bundle
+from eips.eips import EIPs, ERCs
+from eips.enum import DocumentType
+from eips.object import CommitHash, LazyBody
+
+from ._git import add_doc
+
+
+def test_bundle(
+    tmp_path: Path,
+    local_eips: EIPs,
+    doc_repo: tuple[Path, list[bytes]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo_path, _ = doc_repo
+    bundle_path = tmp_path.joinpath("eips.bundle")
+    with monkeypatch.context() as patch:
+        # Raw texts come from the parse, without reading blobs again
+        patch.setattr("eips.eips.git_blob_text", None)
+        assert local_eips.write_bundle(bundle_path) == 2
+    commit = local_eips.current_commit
+    expected = list(local_eips.get())
+
+    workdir = tmp_path.joinpath("cold")
+    cold = EIPs(repo=str(repo_path), workdir=workdir)
+    assert cold.load_bundle(bundle_path) == commit
+    assert cold.current_commit == commit
+
+    # Served from the bundle, without a clone
+    assert list(cold.get()) == expected
+    assert len(cold) == 2
+    doc = next(iter(cold.get(20, headers_only=True)))
+    assert isinstance(doc.body, LazyBody)
+    assert doc.body == expected[1].body
+    assert [rec.id for rec in cold.query()] == [1, 20]
+    assert [res.document.id for res in cold.search("document 20")] == [20]
+    assert cold.stats().total == 2
+    assert not workdir.joinpath("repo").exists()
+    copy_path = tmp_path.joinpath("copy.bundle")
+    assert cold.write_bundle(copy_path) == 2
+    assert copy_path.read_bytes() == bundle_path.read_bytes()
+
+    # Stale, so the next read fetches
+    add_doc(repo_path, 30)
+    cold._last_fetch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    assert [doc.id for doc in cold.get()] == [1, 20, 30]
+    assert cold.current_commit != commit
+    cold.close()
+
+    with pytest.raises(ValueError):
+        ERCs(repo=str(repo_path), workdir=workdir).load_bundle(bundle_path)
+    with pytest.raises(ValueError):
+        cold.load_bundle(repo_path.joinpath("EIPS", "eip-1.md"))
+
+
+def test_bundle_failed_write(tmp_path: Path, local_eips: EIPs) -> None:
+    bundle_path = tmp_path.joinpath("bundles", "eips.bundle")
+    local_eips.write_bundle(bundle_path)
+    data = bundle_path.read_bytes()
+
+    def _fail(*args: Any) -> Iterator[BundleDocument]:
+        raise RuntimeError("Parse failed")
+        yield
+
+    # The bundle in place is left as is, and no temporary file is left behind
+    with pytest.raises(RuntimeError):
+        write_bundle(
+            bundle_path, DocumentType.EIP, CommitHash("0" * 40), datetime.now(), _fail()
+        )
+    assert bundle_path.read_bytes() == data
+    assert list(bundle_path.parent.iterdir()) == [bundle_path]
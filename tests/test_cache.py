@@ -0,0 +1,52 @@
+from datetime import datetime
+from pathlib import Path
+
+from dulwich.objects import Blob
+
+from eips.cache import DocumentCache
+from eips.eips import EIPs
+from eips.object import EIP, CommitHash
+
+from ._const import TEST_EIP_HEADER
+
+
+def test_cache_hit(tmp_path: Path) -> None:
+    cache = DocumentCache(tmp_path.joinpath("cache.sqlite"))
+    sha = Blob.from_string(TEST_EIP_HEADER.encode("utf-8")).id
+
+    first = cache.parse(
+        EIP, 4200, sha, CommitHash("abc0def"), datetime.min, TEST_EIP_HEADER
+    )
+    second = cache.parse(
+        EIP, 4200, sha, CommitHash("0123456"), datetime.max, TEST_EIP_HEADER
+    )
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    assert isinstance(second, EIP)
+    assert second.commit == CommitHash("0123456")
+    assert second.commit_time == datetime.max
+    assert second.model_dump(exclude={"commit", "commit_time"}) == first.model_dump(
+        exclude={"commit", "commit_time"}
+    )
+    assert second == EIP.parse(
+        4200, CommitHash("0123456"), datetime.max, TEST_EIP_HEADER
+    )
+    cache.close()
+
+    # Persists across instances
+    cache = DocumentCache(tmp_path.joinpath("cache.sqlite"))
+    cache.parse(EIP, 4200, sha, CommitHash("abc0def"), datetime.min, TEST_EIP_HEADER)
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_cache_shared_by_get_and_all(local_eips: EIPs) -> None:
+    assert local_eips.cache is not None
+    local_eips.repo_fetch()
+
+    list(local_eips.all())
+    assert (local_eips.cache.hits, local_eips.cache.misses) == (0, 3)
+
+    # Current versions of both docs were already parsed walking history
+    docs = {doc.id: doc for doc in local_eips.get()}
+    assert (local_eips.cache.hits, local_eips.cache.misses) == (2, 3)
+    assert docs[1].commit == local_eips.current_commit
@@ -0,0 +1,105 @@
+import io
+import json
+from functools import partial
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from eips.cli import _list, _parse_ids, _query_filters, eips_cli
+from eips.eips import EIPs
+from eips.enum import EIP1Status
+
+from ._git import BASE_TIMESTAMP, DAY, commit_files, make_doc_text
+
+
+def test_parse_ids(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("sys.stdin", io.StringIO("20\n7 8\n"))
+    assert list(_parse_ids(["1", "3-5,9", "-"])) == [
+        (range(1, 2), True),
+        (range(3, 6), False),
+        (range(9, 10), True),
+        (range(20, 21), True),
+        (range(7, 8), True),
+        (range(8, 9), True),
+    ]
+    with pytest.raises(click.BadParameter):
+        list(_parse_ids(["1-x"]))
+
+
+def test_list(local_eips: EIPs, capsys: pytest.CaptureFixture[str]) -> None:
+    _list(local_eips, ("1-10", "20", "99"), {}, "text")
+    # Ranges only cover the IDs there are
+    _list(local_eips, ("2-99999999",), {}, "text")
+    out, err = capsys.readouterr()
+    assert out.splitlines() == [
+        "1\tFinal\tTest document 1",
+        "20\tReview\tTest document 20",
+        "20\tReview\tTest document 20",
+    ]
+    assert err == "EIP 99 not found\n"
+
+    filters = _query_filters(("review",), (), ())
+    assert filters == {"status": [EIP1Status.REVIEW]}
+    _list(local_eips, (), filters, "ndjson")
+    _list(local_eips, ("1",), filters, "ndjson")
+    out, err = capsys.readouterr()
+    # As `show -o json` prints the document
+    assert out.splitlines() == [
+        next(local_eips.get(20)).model_dump_json(exclude={"body"})
+    ]
+    assert err == "EIP 1 not found\n"
+
+
+def test_show(
+    tmp_path: Path,
+    doc_repo: tuple[Path, list[bytes]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo_path, _ = doc_repo
+    monkeypatch.setattr(
+        "eips.cli.EIPs",
+        partial(EIPs, repo=str(repo_path), workdir=tmp_path.joinpath("work")),
+    )
+    try:
+        runner = CliRunner(mix_stderr=False)  # type: ignore[call-arg]
+    except TypeError:
+        # stderr is kept apart since click 8.2
+        runner = CliRunner()
+
+    res = runner.invoke(eips_cli, ["show", "-o", "json", "20", "99"])
+    assert res.exit_code == 0
+    assert [json.loads(line)["id"] for line in res.stdout.splitlines()] == [20]
+    assert "Body of document 20." in json.loads(res.stdout)["body"]
+    assert res.stderr == "EIP 99 not found\n"
+
+    res = runner.invoke(
+        eips_cli, ["show", "-i", "-o", "ndjson", "-", "1-5"], input="20\n98\n"
+    )
+    assert res.exit_code == 0
+    docs = [json.loads(line) for line in res.stdout.splitlines()]
+    assert [doc["id"] for doc in docs] == [20, 1]
+    assert "body" not in docs[0]
+    assert res.stderr == "EIP 98 not found\n"
+
+    res = runner.invoke(eips_cli, ["--offline", "show", "1"])
+    assert res.exit_code == 0
+    assert res.stdout.startswith("---\n")
+    assert "title: Test document 1\n" in res.stdout
+    assert res.stdout.endswith("Body of document 1.\n\n")
+
+    commit_files(
+        repo_path,
+        {
+            "EIPS/eip-30.md": make_doc_text(30).replace(
+                "created: 2021-01-01\n", "created: 2021-01-01\nrequires: 1, 20\n"
+            )
+        },
+        "Add 30",
+        BASE_TIMESTAMP + 10 * DAY,
+    )
+    res = runner.invoke(eips_cli, ["--max-age", "0", "show", "30", "1"])
+    assert res.exit_code == 0
+    assert "requires: 1, 20\n" in res.stdout
+    assert "title: Test document 1\n" in res.stdout
@@ -1,8 +1,24 @@
+from collections.abc import Iterator
 from datetime import timedelta
 from pathlib import Path
+from typing import Any
 
+import pytest
+from dulwich.repo import Repo
+
+from eips.const import FETCH_STATE_FILE
 from eips.eips import REPO_DIR, EIPs, filter_doc_files
 from eips.enum import EIP1Category, EIP1Status, EIP1Type
+from eips.object import EIP, CommitHash, EIPRecord, LazyBody
+
+from ._git import (
+    BASE_TIMESTAMP,
+    DAY,
+    add_doc,
+    commit_files,
+    make_doc_text,
+    needs_upload_pack,
+)
 
 
 def test_eips() -> None:
@@ -51,4 +67,352 @@ def test_eips_stats(eips: EIPs, workdir: Path) -> None:
     assert len(stats.categories) <= len(EIP1Category)
     assert len(stats.statuses) <= len(EIP1Status)
     assert len(stats.types) <= len(EIP1Type)
-    assert stats.errors == 0
+    assert stats.errors == sum(len(eip.errors) for eip in eips.get())
+
+
+def test_eips_stats_local(
+    monkeypatch: pytest.MonkeyPatch,
+    local_eips: EIPs,
+    doc_repo: tuple[Path, list[bytes]],
+) -> None:
+    repo_path, commits = doc_repo
+
+    stats = local_eips.stats()
+    assert stats.total == 2
+    assert stats.errors == stats.invalid == 0
+    assert stats.status_counts == {EIP1Status.FINAL: 1, EIP1Status.REVIEW: 1}
+    assert stats.type_counts == {EIP1Type.STANDARDS: 2}
+    assert stats.category_counts == {EIP1Category.CORE: 2}
+    assert set(stats.statuses) == {EIP1Status.FINAL, EIP1Status.REVIEW}
+    # Memoized per commit
+    assert local_eips.stats() is stats
+    assert local_eips.stats(commit="HEAD") is stats
+
+    first = local_eips.stats(commit=commits[0].decode("utf-8"))
+    assert first.total == 1
+    assert first.status_counts == {EIP1Status.DRAFT: 1}
+
+    commit_files(
+        repo_path,
+        {
+            "EIPS/eip-1.md": None,
+            "EIPS/eip-20.md": make_doc_text(20, "Final").replace(
+                "---\n\n", "bad header\n---\n\n"
+            ),
+            "EIPS/eip-30.md": make_doc_text(30, "Last Call"),
+        },
+        "Shuffle docs",
+        BASE_TIMESTAMP + 10 * DAY,
+    )
+    local_eips.repo_fetch()
+
+    # Only the changed documents are parsed
+    requested: list[list[int]] = []
+    records = local_eips.records
+
+    def _records(doc_id: list[int], **kwargs: Any) -> Iterator[EIPRecord]:
+        requested.append(doc_id)
+        return records(doc_id, **kwargs)
+
+    monkeypatch.setattr(local_eips, "records", _records)
+    stats = local_eips.stats()
+    assert sorted(requested[0]) == [20, 30]
+    assert stats.total == 2
+    assert stats.errors == stats.invalid == 1
+    assert stats.status_counts == {EIP1Status.FINAL: 1, EIP1Status.LAST_CALL: 1}
+
+    # Same as counting from scratch
+    local_eips._stats.clear()
+    assert local_eips.stats(incremental=False) == stats
+    assert len(requested[1]) == 2
+
+
+def test_eips_all(local_eips: EIPs, doc_repo: tuple[Path, list[bytes]]) -> None:
+    _, commits = doc_repo
+    local_eips.repo_fetch()
+
+    versions = [(c.id, doc.id, doc.status) for c, doc in local_eips.all()]
+    assert versions == [
+        (commits[3], 1, EIP1Status.FINAL),
+        (commits[1], 20, EIP1Status.REVIEW),
+        (commits[0], 1, EIP1Status.DRAFT),
+    ]
+
+    until = CommitHash(commits[1].decode("utf-8"))
+    assert [c.id for c, _ in local_eips.all(until)] == [commits[3]]
+
+
+def test_eips_git_repo_handle(local_eips: EIPs) -> None:
+    with local_eips as docs:
+        docs.repo_fetch()
+        repo = docs.git_repo
+        assert docs.git_repo is repo
+
+        docs.repo_fetch()
+        assert docs.git_repo is not repo
+
+    assert docs._git_repo is None
+
+
+def test_eips_index(local_eips: EIPs, doc_repo: tuple[Path, list[bytes]]) -> None:
+    repo_path, _ = doc_repo
+    local_eips.repo_fetch()
+
+    assert len(local_eips) == 2
+    assert sorted(local_eips._index) == [1, 20]
+    index = local_eips._index
+    assert local_eips._index is index
+
+    doc = local_eips[20]
+    assert doc is not None
+    assert doc.id == 20
+    assert local_eips[999] is None
+    assert [d.id for d in local_eips.get([20, 1])] == [20, 1]
+
+    # Fetch without new commits keeps the index
+    local_eips.repo_fetch()
+    assert local_eips._index is index
+
+    add_doc(repo_path, 30)
+    local_eips.repo_fetch()
+    assert local_eips._index is not index
+    assert len(local_eips) == 3
+
+
+def test_eips_parallel_get(
+    tmp_path: Path, local_eips: EIPs, doc_repo: tuple[Path, list[bytes]]
+) -> None:
+    serial = list(local_eips.get())
+
+    with EIPs(
+        repo=str(doc_repo[0]), workdir=tmp_path.joinpath("parallel"), workers=2
+    ) as parallel:
+        assert list(parallel.get()) == serial
+        assert sorted(parallel.get(ordered=False), key=lambda d: d.id) == sorted(
+            serial, key=lambda d: d.id
+        )
+        assert parallel.check()
+
+
+def test_eips_headers_only(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    local_eips: EIPs,
+    doc_repo: tuple[Path, list[bytes]],
+) -> None:
+    docs: list[EIP] = []
+    # Parsed from scratch, then again from the cache
+    for _ in range(2):
+        docs = list(local_eips.get(headers_only=True))
+        assert all(
+            isinstance(doc.body, LazyBody) and not doc.body.loaded for doc in docs
+        )
+        assert docs == list(local_eips.get())
+        assert all(isinstance(doc.body, LazyBody) and doc.body.loaded for doc in docs)
+
+    (doc,) = local_eips.get(1, headers_only=True)
+    assert doc.body.startswith("\n## Abstract")
+    assert doc.model_dump_json() == next(local_eips.get(1)).model_dump_json()
+
+    records = list(local_eips.records(headers_only=True))
+    assert [r.to_document() for r in records] == docs
+
+    history = [(c.id, doc) for c, doc in local_eips.all()]
+    assert [(c.id, doc) for c, doc in local_eips.all(headers_only=True)] == history
+
+    # Bodies are read through the open repo handle, not by opening the repo again
+    lazy = [
+        *local_eips.get(headers_only=True),
+        *local_eips.records(headers_only=True),
+        *(doc for _, doc in local_eips.all(headers_only=True)),
+    ]
+
+    def _no_open(*args: Any) -> None:
+        raise AssertionError("Repo opened")
+
+    with monkeypatch.context() as m:
+        m.setattr(Repo, "__init__", _no_open)
+        assert all(doc.body.startswith("\n## Abstract") for doc in lazy)
+
+    with EIPs(
+        repo=str(doc_repo[0]),
+        workdir=tmp_path.joinpath("parallel"),
+        cache=False,
+        workers=2,
+    ) as parallel:
+        assert list(parallel.get(headers_only=True)) == docs
+        parallel_history = parallel.all(headers_only=True)
+        assert [(c.id, doc) for c, doc in parallel_history] == history
+
+
+def test_eips_parallel_all(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    local_eips: EIPs,
+    doc_repo: tuple[Path, list[bytes]],
+) -> None:
+    # A range per commit
+    monkeypatch.setattr("eips.eips.HISTORY_RANGE_SIZE", 1)
+    local_eips.repo_fetch()
+    serial = [(c.id, doc) for c, doc in local_eips.all()]
+
+    with EIPs(
+        repo=str(doc_repo[0]), workdir=tmp_path.joinpath("parallel"), workers=2
+    ) as parallel:
+        parallel.repo_fetch()
+        assert [(c.id, doc) for c, doc in parallel.all()] == serial
+        assert sorted(
+            ((c.id, doc.id) for c, doc in parallel.all(ordered=False))
+        ) == sorted((cid, doc.id) for cid, doc in serial)
+
+
+def test_eips_sync(local_eips: EIPs, doc_repo: tuple[Path, list[bytes]]) -> None:
+    repo_path, commits = doc_repo
+    assert local_eips.sync_commit is None
+
+    versions = [(c.id, doc.id, doc.status) for c, doc in local_eips.sync()]
+    assert versions == [
+        (commits[0], 1, EIP1Status.DRAFT),
+        (commits[1], 20, EIP1Status.REVIEW),
+        (commits[3], 1, EIP1Status.FINAL),
+    ]
+    assert local_eips.sync_commit == local_eips.current_commit
+    assert list(local_eips.sync()) == []
+
+    deleted = commit_files(
+        repo_path, {"EIPS/eip-20.md": None}, "Delete 20", BASE_TIMESTAMP + 10 * DAY
+    )
+    added = add_doc(repo_path, 30, 11)
+    local_eips.repo_fetch()
+
+    # Interrupted after the first commit is done
+    sync = local_eips.sync()
+    commit, doc = next(sync)
+    assert commit.id == deleted
+    assert doc.id == 20
+    assert doc.deleted
+    assert doc.status == EIP1Status.REVIEW
+    assert next(sync)[0].id == added
+    sync.close()
+    assert local_eips.sync_commit == CommitHash(deleted.decode("utf-8"))
+
+    # Resumes after the last finished commit
+    assert [(c.id, doc.id) for c, doc in local_eips.sync()] == [(added, 30)]
+
+
+def test_eips_sync_offline(tmp_path: Path, doc_repo: tuple[Path, list[bytes]]) -> None:
+    repo_path, commits = doc_repo
+    workdir = tmp_path.joinpath("work")
+    EIPs(repo=str(repo_path), workdir=workdir).repo_fetch()
+    add_doc(repo_path, 30)
+
+    eips = EIPs(repo=str(repo_path), workdir=workdir, offline=True)
+    assert [doc.id for _, doc in eips.sync()] == [1, 20, 1]
+    assert eips.current_commit == CommitHash(commits[-1].decode("utf-8"))
+    assert eips.sync_commit == eips.current_commit
+
+
+@needs_upload_pack
+def test_eips_shallow(tmp_path: Path, doc_repo: tuple[Path, list[bytes]]) -> None:
+    repo_path, commits = doc_repo
+    eips = EIPs(
+        repo=f"file://{repo_path}",
+        workdir=tmp_path.joinpath("work"),
+        depth=1,
+        sparse=True,
+    )
+    assert [doc.id for doc in eips.get()] == [1, 20]
+    assert eips.git_repo.get_shallow() == {commits[-1]}
+
+    # Seeking a commit deepens just far enough to find it
+    (doc,) = eips.get(20, commit=commits[1].decode("utf-8")[:7])
+    assert doc.status == EIP1Status.REVIEW
+    assert eips.git_repo.get_shallow()
+
+    # All of history is fetched for all versions
+    assert [(c.id, doc.id) for c, doc in eips.all()] == [
+        (commits[3], 1),
+        (commits[1], 20),
+        (commits[0], 1),
+    ]
+    assert not eips.git_repo.get_shallow()
+    eips.close()
+
+
+def test_eips_reuse_fetch(
+    tmp_path: Path,
+    doc_repo: tuple[Path, list[bytes]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo_path, _ = doc_repo
+    workdir = tmp_path.joinpath("work")
+
+    with pytest.raises(FileNotFoundError):
+        list(EIPs(repo=str(repo_path), workdir=workdir, offline=True).get())
+
+    fetched = EIPs(repo=str(repo_path), workdir=workdir)
+    commit = fetched.repo_fetch()
+    fetched.close()
+    add_doc(repo_path, 30)
+
+    def _no_fetch(*args: Any) -> CommitHash:
+        raise AssertionError("Fetched")
+
+    # Fetched within freshness by another instance, so the clone is read as is
+    monkeypatch.setattr("eips.eips.fetch_repo", _no_fetch)
+    eips = EIPs(repo=str(repo_path), workdir=workdir)
+    assert [doc.id for doc in eips.get()] == [1, 20]
+    assert eips.current_commit == commit
+    assert eips.last_fetch == fetched.last_fetch
+    eips.close()
+
+    eips = EIPs(
+        repo=str(repo_path), workdir=workdir, freshness=timedelta(0), offline=True
+    )
+    assert [doc.id for doc in eips.get()] == [1, 20]
+    eips.close()
+
+    monkeypatch.undo()
+    eips = EIPs(repo=str(repo_path), workdir=workdir, freshness=timedelta(0))
+    assert [doc.id for doc in eips.get()] == [1, 20, 30]
+    eips.close()
+
+    # An unreadable fetch time is as good as none, so the clone is fetched when due
+    workdir.joinpath(FETCH_STATE_FILE).write_text('{"commit": "')
+    add_doc(repo_path, 40, 11)
+    eips = EIPs(repo=str(repo_path), workdir=workdir)
+    assert [doc.id for doc in eips.get()] == [1, 20, 30, 40]
+    eips.close()
+
+
+def test_eips_get_at_commit(
+    local_eips: EIPs, doc_repo: tuple[Path, list[bytes]]
+) -> None:
+    _, commits = doc_repo
+    local_eips.repo_fetch()
+
+    first = commits[0].decode("utf-8")
+    assert [doc.id for doc in local_eips.get(commit=first)] == [1]
+    assert [doc.id for doc in local_eips.get(20, commit=first)] == []
+
+    (doc,) = local_eips.get(1, commit=first[:7])
+    assert doc.status == EIP1Status.DRAFT
+    assert doc.commit == CommitHash(first)
+    assert doc.commit_time is not None
+    assert doc.commit_time.timestamp() == BASE_TIMESTAMP
+
+    (doc,) = local_eips.get(1, commit="HEAD")
+    assert doc.status == EIP1Status.FINAL
+    assert doc.commit == local_eips.current_commit
+
+    with pytest.raises(ValueError):
+        list(local_eips.get(1, commit="nope"))
+
+
+def test_eips_records(local_eips: EIPs) -> None:
+    docs = list(local_eips.get())
+    records = list(local_eips.records())
+    assert [r.to_document() for r in records] == docs
+
+    history = [(c.id, doc) for c, doc in local_eips.all()]
+    assert [(c.id, r.to_document()) for c, r in local_eips.all_records()] == history
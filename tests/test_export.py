@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import pytest
+
+from eips.eips import EIPs
+from eips.export import COLUMNS, iter_batches
+
+from ._git import BASE_TIMESTAMP, DAY
+
+
+def test_iter_batches(local_eips: EIPs) -> None:
+    local_eips.repo_fetch()
+    docs = [doc for _, doc in local_eips.all_records(headers_only=True)]
+    assert len(docs) == 3
+
+    batches = list(iter_batches(docs, batch_size=2))
+    assert [len(batch["id"]) for batch in batches] == [2, 1]
+    assert list(batches[0]) == [name for name, _ in COLUMNS]
+
+    batch = batches[0]
+    assert batch["id"] == [1, 20]
+    assert batch["document_type"] == ["EIP", "EIP"]
+    assert batch["status"] == ["Final", "Review"]
+    assert batch["category"] == ["Core", "Core"]
+    assert batch["created"] == [BASE_TIMESTAMP, BASE_TIMESTAMP]
+    assert batch["commit_time"][1] == BASE_TIMESTAMP + DAY
+    assert batch["author"][0] == ["Alice (@alice)", "Bob (@bob)"]
+    assert batch["requires"] == [None, None]
+
+    (with_body,) = iter_batches(docs[:1], include_body=True)
+    assert with_body["body"] == [str(docs[0].body)]
+
+    with pytest.raises(ValueError):
+        next(iter_batches(docs, batch_size=0))
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_export(tmp_path: Path, local_eips: EIPs, fmt: str) -> None:
+    pa = pytest.importorskip("pyarrow")
+    local_eips.repo_fetch()
+
+    path = tmp_path.joinpath(f"eips.{fmt}")
+    assert local_eips.export(path, fmt=fmt, history=True, batch_size=2) == 3
+
+    if fmt == "parquet":
+        import pyarrow.parquet as pa_parquet
+
+        table = pa_parquet.read_table(str(path))
+    else:
+        table = pa.ipc.open_file(str(path)).read_all()
+
+    assert table.num_rows == 3
+    assert table.column("id").to_pylist() == [1, 20, 1]
+    assert pa.types.is_dictionary(table.schema.field("status").type)
+    assert table.schema.field("created").type == pa.timestamp("s", tz="UTC")
+    assert table.schema.field("requires").type == pa.list_(pa.int64())
+    assert "body" not in table.schema.names
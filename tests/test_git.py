@@ -0,0 +1,186 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Event, Thread
+from types import GeneratorType
+from typing import Any
+
+import pytest
+from dulwich.repo import Repo
+
+from eips.git import (
+    deepen_repo,
+    ensure_repo_updated,
+    fetch_repo,
+    git_commit_history,
+    git_history,
+    git_rev,
+)
+from eips.object import CommitHash
+from eips.util import file_lock
+
+from ._git import (
+    BASE_TIMESTAMP,
+    DAY,
+    add_doc,
+    commit_files,
+    make_doc_text,
+    needs_upload_pack,
+)
+
+
+def test_git_history_is_lazy(doc_repo: tuple[Path, list[bytes]]) -> None:
+    repo_path, commits = doc_repo
+    history = git_history(repo_path)
+    assert isinstance(history, GeneratorType)
+    assert next(history).commit.id == commits[-1]
+    assert [c.id for c in git_commit_history(repo_path)] == commits[::-1]
+
+
+def test_git_history_bounds(doc_repo: tuple[Path, list[bytes]]) -> None:
+    repo_path, commits = doc_repo
+
+    until = CommitHash(commits[1].decode("utf-8"))
+    assert [c.id for c in git_commit_history(repo_path, until_commit=until)] == [
+        commits[3],
+        commits[2],
+    ]
+
+    since = datetime.fromtimestamp(BASE_TIMESTAMP + DAY, tz=timezone.utc)
+    assert [c.id for c in git_commit_history(repo_path, since=since)] == [
+        commits[3],
+        commits[2],
+        commits[1],
+    ]
+
+    # Only commits touching the docs dir
+    assert [c.id for c in git_commit_history(repo_path, ["EIPS"])] == [
+        commits[3],
+        commits[1],
+        commits[0],
+    ]
+
+
+def test_fetch_repo_single_flight(
+    tmp_path: Path,
+    doc_repo: tuple[Path, list[bytes]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo_path, commits = doc_repo
+    clone_path = tmp_path.joinpath("clone")
+    started = Event()
+    release = Event()
+    fetches: list[Path] = []
+
+    def _slow_fetch(path: Path, uri: str, *args: Any) -> CommitHash:
+        fetches.append(path)
+        started.set()
+        assert release.wait(10)
+        return ensure_repo_updated(path, uri, *args)
+
+    monkeypatch.setattr("eips.git.ensure_repo_updated", _slow_fetch)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(fetch_repo, clone_path, str(repo_path)) for _ in range(4)
+        ]
+        assert started.wait(10)
+        # Let the other callers join the fetch in progress
+        time.sleep(0.2)
+        release.set()
+        results = [f.result(10) for f in futures]
+
+    assert results == [commits[-1].decode("utf-8")] * 4
+    assert fetches == [clone_path]
+
+
+def test_fetch_repo_file_lock(
+    tmp_path: Path,
+    doc_repo: tuple[Path, list[bytes]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    repo_path, commits = doc_repo
+    clone_path = tmp_path.joinpath("clone")
+    lock_path = tmp_path.joinpath("fetch.lock")
+    commit = fetch_repo(clone_path, str(repo_path), lock_path)
+    assert commit == git_rev(clone_path)
+
+    fetches: list[Path] = []
+
+    def _fetch(path: Path, uri: str, *args: Any) -> CommitHash:
+        fetches.append(path)
+        return ensure_repo_updated(path, uri, *args)
+
+    monkeypatch.setattr("eips.git.ensure_repo_updated", _fetch)
+
+    def _wait_for_holder(fetch: bool) -> list[CommitHash]:
+        # Another holder of the lock (the lock is per open file, like another process)
+        results: list[CommitHash] = []
+        with file_lock(lock_path) as waited:
+            assert not waited
+            thread = Thread(
+                target=lambda: results.append(
+                    fetch_repo(clone_path, str(repo_path), lock_path)
+                )
+            )
+            thread.start()
+            thread.join(0.2)
+            assert thread.is_alive()
+            if fetch:
+                ensure_repo_updated(clone_path, str(repo_path))
+        thread.join(10)
+        return results
+
+    # The holder fetched, so the waiter didn't fetch again
+    new_commit = CommitHash(add_doc(repo_path, 30).decode("utf-8"))
+    assert _wait_for_holder(fetch=True) == [new_commit]
+    assert fetches == []
+
+    # The holder didn't (failed, or was deepening), so the waiter did
+    newer_commit = CommitHash(add_doc(repo_path, 40, 11).decode("utf-8"))
+    assert _wait_for_holder(fetch=False) == [newer_commit]
+    assert fetches == [clone_path]
+
+
+@needs_upload_pack
+def test_shallow_sparse_clone(
+    tmp_path: Path, doc_repo: tuple[Path, list[bytes]]
+) -> None:
+    repo_path, commits = doc_repo
+    uri = f"file://{repo_path}"
+    clone_path = tmp_path.joinpath("clone")
+
+    commit = ensure_repo_updated(clone_path, uri, depth=1, paths=["EIPS"])
+    assert commit == commits[-1].decode("utf-8")
+    with Repo(str(clone_path)) as repo:
+        assert repo.get_shallow() == {commits[-1]}
+        assert commits[0] not in repo.object_store
+    # Only the docs are checked out
+    assert sorted(p.name for p in clone_path.iterdir()) == [".git", "EIPS"]
+    assert sorted(p.name for p in clone_path.joinpath("EIPS").iterdir()) == [
+        "eip-1.md",
+        "eip-20.md",
+    ]
+
+    new = commit_files(
+        repo_path,
+        {"EIPS/eip-30.md": make_doc_text(30), "EIPS/eip-20.md": None},
+        "Add 30, remove 20",
+        BASE_TIMESTAMP + 10 * DAY,
+    )
+    assert ensure_repo_updated(clone_path, uri, paths=["EIPS"]) == new.decode("utf-8")
+    assert sorted(p.name for p in clone_path.joinpath("EIPS").iterdir()) == [
+        "eip-1.md",
+        "eip-30.md",
+    ]
+    with Repo(str(clone_path)) as repo:
+        # Updates are fetched back to the shallow commit, no further
+        assert repo.get_shallow() == {commits[-1]}
+        assert [entry.commit.id for entry in repo.get_walker()] == [new, commits[-1]]
+
+    assert deepen_repo(clone_path, uri, 3)
+    assert not deepen_repo(clone_path, uri)
+    with Repo(str(clone_path)) as repo:
+        assert not repo.get_shallow()
+        assert all(c in repo.object_store for c in commits)
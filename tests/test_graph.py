@@ -0,0 +1,84 @@
+from pathlib import Path
+
+import pytest
+
+from eips.eips import EIPs
+from eips.graph import CycleError, DocumentGraph
+
+from ._git import BASE_TIMESTAMP, DAY, commit_files, make_doc_text
+
+
+def test_graph() -> None:
+    graph = DocumentGraph(
+        [1, 2, 3, 4, 5, 6],
+        {
+            "requires": {2: [1], 3: [2, 7], 4: [2, 3], 5: [6], 6: [5]},
+            "superseded_by": {1: [4]},
+        },
+    )
+
+    assert len(graph) == 6
+    assert 7 not in graph
+    assert list(graph) == [1, 2, 3, 4, 5, 6]
+
+    assert graph.edges(4) == [2, 3]
+    assert graph.edges(2, reverse=True) == [3, 4]
+    assert graph.edges(1, "superseded_by") == [4]
+    assert graph.edges(100) == []
+
+    # IDs without documents are still dependencies
+    assert graph.closure(4) == [1, 2, 3, 7]
+    assert graph.closure(1, reverse=True) == [2, 3, 4]
+    assert graph.closure(7, reverse=True) == [3, 4]
+    assert graph.closure(5) == [5, 6]
+
+    assert graph.cycles() == [[5, 6]]
+    assert graph.cycles("superseded_by") == []
+    assert graph.topological_order("superseded_by") == [2, 3, 4, 1, 5, 6]
+    with pytest.raises(CycleError) as err:
+        graph.topological_order()
+    assert err.value.cycle == [5, 6]
+
+    with pytest.raises(ValueError):
+        graph.edges(1, "replace")
+
+
+def test_graph_huge_ids() -> None:
+    # Header values are whatever a document says, so nodes can't be sized by them
+    huge = 2**64
+    graph = DocumentGraph([1, 2], {"requires": {2: [1, huge], 1: [5_000_000]}})
+    assert graph.size == 4
+    assert huge not in graph
+    assert graph.edges(2) == [1, huge]
+    assert graph.closure(2) == [1, 5_000_000, huge]
+    assert graph.closure(huge, reverse=True) == [2]
+    assert graph.cycles() == []
+    assert graph.topological_order() == [1, 2]
+
+
+def test_eips_graph(local_eips: EIPs, doc_repo: tuple[Path, list[bytes]]) -> None:
+    repo_path, _ = doc_repo
+    graph = local_eips.graph()
+    assert list(graph) == [1, 20]
+    assert local_eips.graph() is graph
+
+    commit_files(
+        repo_path,
+        {
+            "EIPS/eip-30.md": make_doc_text(30).replace(
+                "created: 2021-01-01\n", "created: 2021-01-01\nrequires: 1, 20\n"
+            ),
+            "EIPS/eip-40.md": make_doc_text(40).replace(
+                "created: 2021-01-01\n", "created: 2021-01-01\nrequires: 30\n"
+            ),
+        },
+        "Add 30 and 40",
+        BASE_TIMESTAMP + 10 * DAY,
+    )
+    local_eips.repo_fetch()
+
+    graph = local_eips.graph()
+    assert graph.commit == local_eips.current_commit
+    assert graph.closure(40) == [1, 20, 30]
+    assert graph.closure(1, reverse=True) == [30, 40]
+    assert graph.topological_order() == [1, 20, 30, 40]
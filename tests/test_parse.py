@@ -1,7 +1,18 @@
-from datetime import datetime
+from datetime import datetime, timezone
+
+import pytest
 
 from eips.enum import EIP1Category, EIP1Status, EIP1Type
-from eips.object import EIP, CommitHash
+from eips.object import EIP, CommitHash, EIPRecord
+from eips.parsing import (
+    HeaderParseError,
+    ParseError,
+    date_parse_stats,
+    header_block,
+    normalize_date,
+    parse_date,
+    pluck_headers,
+)
 
 from ._const import TEST_EIP_HEADER
 
@@ -23,3 +34,117 @@ def test_parse_eip() -> None:
     assert len(eip.requires) == 2
     assert 3540 in eip.requires
     assert 3670 in eip.requires
+
+
+def test_pluck_headers() -> None:
+    headers, body, errors = pluck_headers(TEST_EIP_HEADER)
+    assert headers["id"] == "4200"
+    assert headers["requires"] == [3540, 3670]
+    assert body == TEST_EIP_HEADER.split("---\n", 2)[2]
+    assert errors == []
+
+    headers, body, errors = pluck_headers("---\ntitle: “Quoted”\nbad line!\n----\nbody")
+    assert headers == {"title": '"Quoted"'}
+    assert body == "body"
+    assert errors == ["EIP header line parse failed: bad line!"]
+
+    assert pluck_headers("---\n---") == ({}, "", [])
+    assert pluck_headers("---\n---\n\nbody\n") == ({}, "\nbody\n", [])
+
+
+@pytest.mark.parametrize(
+    "text,error",
+    [
+        ("", HeaderParseError),
+        ("eip: 1\n---\n", HeaderParseError),
+        ("----\neip: 1\n---\n", HeaderParseError),
+        ("---", ParseError),
+        ("---\neip: 1\n", ParseError),
+    ],
+)
+def test_pluck_headers_malformed(text: str, error: type[ParseError]) -> None:
+    with pytest.raises(error):
+        pluck_headers(text)
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        TEST_EIP_HEADER,
+        "---\n---",
+        "---\n---\n",
+        "---\neip: 1\n----\nbody",
+        "---\neip: 1\n---\n\nbody ---\n---\n",
+        # Malformed documents come back whole
+        "",
+        "---",
+        "---\neip: 1\n",
+        "----\neip: 1\n---\nbody",
+    ],
+)
+def test_header_block(text: str) -> None:
+    raw = text.encode("utf-8")
+    header = header_block(raw)
+    assert raw.startswith(header)
+
+    try:
+        headers, body, errors = pluck_headers(text)
+    except ParseError:
+        assert header == raw
+        return
+
+    # Headers parse the same from the block, and the body is what's left
+    assert pluck_headers(header.decode("utf-8")) == (headers, "", errors)
+    assert raw[len(header) :].decode("utf-8") == body
+
+
+def test_parse_date() -> None:
+    parse_date.cache_clear()
+    date_parse_stats.clear()
+
+    assert parse_date("2021-07-16") == datetime(year=2021, month=7, day=16)
+    assert parse_date("2021-07-16") == datetime(year=2021, month=7, day=16)
+    assert parse_date("July 16th, 2021") == datetime(year=2021, month=7, day=16)
+    assert normalize_date("2021-07-16, 2022-01-02") == datetime(
+        year=2022, month=1, day=2
+    )
+    assert date_parse_stats == {"fast": 2, "fallback": 1}
+
+
+def test_enum_get_by_val() -> None:
+    assert EIP1Status.get_by_val("Final") == EIP1Status.FINAL
+    assert EIP1Status.get_by_val(" last  CALL ") == EIP1Status.LAST_CALL
+    # Substring fallback
+    assert EIP1Status.get_by_val("Last") == EIP1Status.LAST_CALL
+    assert EIP1Type.get_by_val("Standards") == EIP1Type.STANDARDS
+    assert EIP1Category.get_by_val("Core") == EIP1Category.CORE
+    assert EIP1Category.get_by_val("Nope") is None
+    assert EIP1Category.get_by_val("") is None
+
+
+def test_parse_record() -> None:
+    commit = CommitHash("abc0def")
+    record = EIPRecord.parse(4200, commit, datetime.min, TEST_EIP_HEADER)
+    eip = EIP.parse(4200, commit, datetime.min, TEST_EIP_HEADER)
+
+    assert record.id == 4200
+    assert record.model_dump() == eip.model_dump()
+    assert record.headers == eip.headers
+    assert record.to_document() == eip
+
+    # Round trips through document JSON
+    assert EIPRecord.model_validate_json(eip.model_dump_json()) == record
+    assert EIP.model_validate_json(
+        record.model_dump_json(exclude={"commit"})
+    ) == eip.model_copy(update={"commit": None})
+
+    # Dumped the same as the document, byte for byte
+    commit_time = datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+    text = TEST_EIP_HEADER.replace("title:", "title: Café")
+    record = EIPRecord.parse(4200, commit, commit_time, text)
+    eip = EIP.parse(4200, commit, commit_time, text)
+    assert record.model_dump_json() == eip.model_dump_json()
+    assert record.model_dump_json() == record.to_document().model_dump_json()
+    assert record.model_dump_json(exclude={"body"}) == eip.model_dump_json(
+        exclude={"body"}
+    )
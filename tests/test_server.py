@@ -0,0 +1,121 @@
+import asyncio
+import json
+from http import HTTPStatus
+from pathlib import Path
+
+from eips.aio import AsyncEIPs
+from eips.eips import EIPs
+from eips.server import DocumentServer
+
+from ._git import add_doc
+
+
+def test_document_server(tmp_path: Path, doc_repo: tuple[Path, list[bytes]]) -> None:
+    repo_path, _ = doc_repo
+
+    async def _main() -> None:
+        server = DocumentServer(
+            {
+                "eips": AsyncEIPs(
+                    EIPs(
+                        repo=str(repo_path),
+                        workdir=tmp_path.joinpath("work"),
+                        background_refresh=True,
+                    )
+                )
+            },
+            refresh_interval=None,
+        )
+        await server.start(port=0)
+        docs = server.docs["eips"]
+
+        res = await server.handle("GET", "/eips/20", {})
+        assert res.status == HTTPStatus.OK
+        assert json.loads(res.body)["id"] == 20
+        assert res.etag == f'"{docs.current_commit}"'
+        # Rendered once per commit
+        assert await server.handle("GET", "/eips/20", {}) is res
+
+        etag = f'"{docs.current_commit}"'
+        res = await server.handle("GET", "/eips/20", {"if-none-match": etag})
+        assert res.status == HTTPStatus.NOT_MODIFIED
+        assert not res.body
+        res = await server.handle("GET", "/eips/stats", {"if-none-match": etag})
+        assert res.status == HTTPStatus.NOT_MODIFIED
+
+        res = await server.handle("GET", "/eips/1?headers=1", {})
+        assert "body" not in json.loads(res.body)
+        res = await server.handle("GET", "/eips?status=review&status=final", {})
+        assert [doc["id"] for doc in json.loads(res.body)] == [1, 20]
+        res = await server.handle("GET", "/eips/stats", {})
+        assert json.loads(res.body)["total"] == 2
+        res = await server.handle("GET", "/eips/search?q=document+20", {})
+        assert [result["id"] for result in json.loads(res.body)] == [20]
+
+        for target, status in [
+            ("/eips/99", HTTPStatus.NOT_FOUND),
+            ("/ercs/20", HTTPStatus.NOT_FOUND),
+            ("/eips/abc", HTTPStatus.BAD_REQUEST),
+            ("/eips?status=nope", HTTPStatus.BAD_REQUEST),
+            ("/eips?colour=blue", HTTPStatus.BAD_REQUEST),
+        ]:
+            assert (await server.handle("GET", target, {})).status == status
+            # Errors aren't Not Modified, even for the current commit's ETag
+            res = await server.handle("GET", target, {"if-none-match": etag})
+            assert res.status == status
+        res = await server.handle("POST", "/eips/20", {})
+        assert res.status == HTTPStatus.METHOD_NOT_ALLOWED
+
+        # Over the wire, with keep-alive
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        for _ in range(2):
+            writer.write(b"GET /eips/1 HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            assert await reader.readline() == b"HTTP/1.1 200 OK\r\n"
+            headers = {}
+            while (line := await reader.readline()) != b"\r\n":
+                name, _, value = line.decode().partition(":")
+                headers[name.lower()] = value.strip()
+            body = await reader.readexactly(int(headers["content-length"]))
+            assert json.loads(body)["id"] == 1
+        writer.close()
+
+        # Bodies aren't read, just refused
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.write(b"GET /eips/1 HTTP/1.1\r\nContent-Length: 1000000000\r\n\r\n")
+        assert (await reader.readline()).startswith(b"HTTP/1.1 413 ")
+        await reader.read()
+        writer.close()
+
+        add_doc(repo_path, 30)
+        old_etag = f'"{docs.current_commit}"'
+        await docs.repo_fetch()
+        res = await server.handle("GET", "/eips/20", {"if-none-match": old_etag})
+        assert res.status == HTTPStatus.OK
+        assert res.etag != old_etag
+        res = await server.handle("GET", "/eips/stats", {})
+        assert json.loads(res.body)["total"] == 3
+
+        await server.close()
+
+    asyncio.run(_main())
+
+
+def test_document_server_offline(
+    tmp_path: Path, doc_repo: tuple[Path, list[bytes]]
+) -> None:
+    repo_path, commits = doc_repo
+    workdir = tmp_path.joinpath("work")
+    EIPs(repo=str(repo_path), workdir=workdir).repo_fetch()
+    add_doc(repo_path, 30)
+
+    async def _main() -> None:
+        docs = AsyncEIPs(EIPs(repo=str(repo_path), workdir=workdir, offline=True))
+        server = DocumentServer({"eips": docs}, refresh_interval=None)
+        await server.start(port=0)
+        # Started from the clone, without fetching
+        assert docs.current_commit == commits[-1].decode("utf-8")
+        res = await server.handle("GET", "/eips/30", {})
+        assert res.status == HTTPStatus.NOT_FOUND
+        await server.close()
+
+    asyncio.run(_main())
@@ -0,0 +1,128 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from eips.eips import EIPs
+from eips.enum import EIP1Category, EIP1Status
+from eips.object import LazyBody
+from eips.store import DocumentStore
+
+from ._git import BASE_TIMESTAMP, DAY, commit_files, make_doc_text
+
+
+def test_store_query(local_eips: EIPs, doc_repo: tuple[Path, list[bytes]]) -> None:
+    repo_path, commits = doc_repo
+    commit_files(
+        repo_path,
+        {
+            "EIPS/eip-1559.md": make_doc_text(1559, "Final"),
+            "EIPS/eip-30.md": make_doc_text(30, "Final").replace(
+                "created: 2021-01-01\n", "created: 2022-06-01\nrequires: 1, 1559\n"
+            ),
+        },
+        "Add 1559 and 30",
+        BASE_TIMESTAMP + 10 * DAY,
+    )
+
+    assert [r.id for r in local_eips.query()] == [1, 20, 30, 1559]
+    assert [r.id for r in local_eips.query(status=EIP1Status.FINAL)] == [1, 30, 1559]
+    assert [
+        r.id for r in local_eips.query(status=[EIP1Status.REVIEW, EIP1Status.DRAFT])
+    ] == [20]
+    assert [r.id for r in local_eips.query(requires=1559)] == [30]
+    assert [
+        r.id
+        for r in local_eips.query(
+            status=EIP1Status.FINAL, category=EIP1Category.CORE, requires=1
+        )
+    ] == [30]
+    assert [r.id for r in local_eips.query(created_after=datetime(2022, 1, 1))] == [30]
+    assert [r.id for r in local_eips.query(doc_id=[20, 1559, 404])] == [20, 1559]
+    assert [r.id for r in local_eips.query(limit=2)] == [1, 20]
+
+    # Same as parsing the docs, with bodies read on access
+    records = list(local_eips.query())
+    assert all(isinstance(r.body, LazyBody) and not r.body.loaded for r in records)
+    docs = sorted(local_eips.get(), key=lambda doc: doc.id)
+    assert [r.to_document() for r in records] == docs
+
+    # Other commits are stored on demand
+    first = commits[0].decode("utf-8")
+    (record,) = local_eips.query(first)
+    assert record.status == EIP1Status.DRAFT
+    assert record.commit == first
+    assert local_eips.store is not None
+    assert local_eips.store.has_commit("EIP", local_eips._resolve_commit(first))
+
+
+def test_store_keep(
+    tmp_path: Path, local_eips: EIPs, doc_repo: tuple[Path, list[bytes]]
+) -> None:
+    local_eips.store = DocumentStore(tmp_path.joinpath("store.sqlite"), keep=1)
+    head = local_eips._resolve_commit()
+    first = local_eips._resolve_commit(doc_repo[1][0].decode("utf-8"))
+
+    assert len(list(local_eips.query(head))) == 2
+    assert len(list(local_eips.query(first))) == 1
+    assert not local_eips.store.has_commit("EIP", head)
+    assert local_eips.store.has_commit("EIP", first)
+
+
+def test_store_disabled(tmp_path: Path, doc_repo: tuple[Path, list[bytes]]) -> None:
+    eips = EIPs(repo=str(doc_repo[0]), workdir=tmp_path.joinpath("work"), store=False)
+    with pytest.raises(ValueError):
+        list(eips.query())
+
+
+def test_store_search(
+    monkeypatch: pytest.MonkeyPatch,
+    local_eips: EIPs,
+    doc_repo: tuple[Path, list[bytes]],
+) -> None:
+    repo_path, _ = doc_repo
+    commit_files(
+        repo_path,
+        {
+            "EIPS/eip-1559.md": make_doc_text(1559, title="Fee market change").replace(
+                "Body of document", "The basefee is burned, see document"
+            ),
+        },
+        "Add 1559",
+        BASE_TIMESTAMP + 10 * DAY,
+    )
+    assert local_eips.store is not None
+    indexed: list[int] = []
+    add_search = local_eips.store.add_search
+
+    def _add_search(*args: Any) -> int:
+        indexed.append(add_search(*args))
+        return indexed[-1]
+
+    monkeypatch.setattr(local_eips.store, "add_search", _add_search)
+
+    (result,) = local_eips.search("fee market")
+    assert result.document.id == 1559
+    assert result.score > 0
+    assert isinstance(result.document.body, LazyBody)
+    assert "[basefee]" in next(local_eips.search("basefee")).snippet
+    # Word prefixes match
+    assert [r.document.id for r in local_eips.search("basef")] == [1559]
+    # Title matches rank first
+    assert next(local_eips.search("document 20")).document.id == 20
+    assert len(list(local_eips.search("document", limit=2))) == 2
+    assert list(local_eips.search('EIP-1559 "quoted')) == []
+    assert list(local_eips.search("  ")) == []
+    assert indexed == [3, 0, 0, 0, 0, 0, 0]
+
+    # Only changed documents are indexed as HEAD moves on
+    commit_files(
+        repo_path,
+        {"EIPS/eip-20.md": make_doc_text(20, title="Token standard")},
+        "Rename 20",
+        BASE_TIMESTAMP + 11 * DAY,
+    )
+    local_eips.repo_fetch()
+    assert [r.document.id for r in local_eips.search("token")] == [20]
+    assert indexed[-1] == 1